@@ -17,6 +17,14 @@ Playwright로 초기 접속(세션/쿠키/헤더/보안 토큰 확보) 후,
     --out "./downloads" \
     --count-only \
     --headless
+
+  # 같은 쿼리를 반복 확인할 때 결과 개수 캐시 (24시간)
+  python google_patents_xhr_downloader.py \
+    --query "machine learning" \
+    --out "./downloads" \
+    --count-only \
+    --cache \
+    --headless
     
   # 여러 쿼리 검색 결과 개수 확인
   python google_patents_xhr_downloader.py \
@@ -26,12 +34,44 @@ Playwright로 초기 접속(세션/쿠키/헤더/보안 토큰 확보) 후,
     --count-only \
     --headless
 
+  # 여러 쿼리 동시 처리 (동시 실행 쿼리 수 제한)
+  python google_patents_xhr_downloader.py \
+    --query-file queries.txt \
+    --out "./downloads" \
+    --concurrency 4 \
+    --headless
+
+  # PDF 다운로드 동시 실행 수 조정 (쿼리당)
+  python google_patents_xhr_downloader.py \
+    --query "machine learning" \
+    --out "./downloads" \
+    --max-results 20 \
+    --pdf-concurrency 10 \
+    --headless
+
+  # 제목이 거의 같은 패밀리 특허는 PDF를 한 번만 다운로드
+  python google_patents_xhr_downloader.py \
+    --query "machine learning" \
+    --out "./downloads" \
+    --max-results 20 \
+    --dedup-threshold 0.9 \
+    --headless
+
+  # warm XHR 세션 재사용 없이 쿼리마다 브라우저로 검색
+  python google_patents_xhr_downloader.py \
+    --query "machine learning" \
+    --out "./downloads" \
+    --browser-only \
+    --headless
+
 참고:
 - XHR 엔드포인트(`/xhr/query`) 요청을 실제 브라우저에서 한 번 발생시켜
   필요한 헤더(`x-same-domain`, `user-agent`, `accept-language`, `cookie` 등)와
   URL 파라미터(내부 토큰 포함 가능)를 캡처합니다.
 - 캡처된 값으로 httpx(HTTP/2) 클라이언트를 구성해 동일한 요청을 재현합니다.
 - 검색 결과에서 특허 상세로 이동해 `meta[name="citation_pdf_url"]`로 PDF 직링크를 추출합니다.
+- 쿼리 메타데이터는 `<out>/query_<슬러그>_<해시8>.json/.txt`, 진단 아티팩트는
+  `<out>/diagnostics/<슬러그>_<해시8>/`에 쿼리별로 저장합니다.
 
 주의: 본 스크립트는 구글 사이트 변경에 민감합니다. 차단(403/429) 시 진단 아티팩트를
       활성화(`--diagnostics`)해 캡처된 요청을 확인하고 지연(`--delay`)을 늘려주세요.
@@ -167,22 +207,276 @@ elif response["results"]["total_num_results"] == 0:
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import re
 import sys
-from dataclasses import dataclass
+import time
+from dataclasses import asdict, dataclass, replace
+from functools import lru_cache
 from datetime import datetime
+from html import unescape
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import httpx
-from bs4 import BeautifulSoup
 from loguru import logger
-from playwright.async_api import Browser, BrowserContext, Page, async_playwright
+from selectolax.lexbor import LexborHTMLParser
+from playwright.async_api import (
+    Browser,
+    Page,
+    Playwright,
+    Route,
+    async_playwright,
+)
+
+try:  # 선택 의존성: 있으면 XHR JSON 디코딩/메타 저장에 사용
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 
 GOOGLE_PATENTS_ORIGIN = "https://patents.google.com"
 
+# XHR 제목 필드의 하이라이트 태그(<b> 등) 제거용
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+# 공개번호 비교 시 제거할 구분 문자 (예: "US 11,056,471-B2" → "US11056471B2")
+_PUB_NUMBER_DELETE = str.maketrans("", "", " ,-")
+# XHR 본문이 JSON인지 판별 (큰 본문을 strip()으로 복사하지 않고 앞부분만 검사)
+_JSON_START_RE = re.compile(r"\s*\{")
+
+# _normalize_query_string용 필드 치환 규칙 (import 시 한 번만 컴파일)
+# - 필드 약어: abstract: → AB=, title: → TI=, claims: → CL=
+# - 메타데이터 필드: assignee= → assignee: 등 (일관성을 위해)
+_FIELD_ABBREVIATIONS: Dict[str, str] = {"abstract": "AB=", "title": "TI=", "claims": "CL="}
+_QUERY_FIELD_RE = re.compile(
+    r"\b(?P<field>abstract|title|claims):\s*"
+    r"|\b(?P<meta>assignee|inventor|country|status|language)\s*=\s*",
+    re.IGNORECASE,
+)
+
+
+def _replace_query_field(m: "re.Match[str]") -> str:
+    field = m.group("field")
+    if field is not None:
+        return _FIELD_ABBREVIATIONS[field.lower()]
+    # 원래 규칙과 같이 소문자 필드명으로 통일
+    return m.group("meta").lower() + ":"
+
+
+@lru_cache(maxsize=1024)
+def _normalize_query(query: str) -> str:
+    # 필드 약어 치환 + 메타데이터 필드 정규화를 한 번의 스캔으로 적용
+    # (한 쿼리가 캡처/warm 세션/캐시 키/메타데이터에서 반복 정규화되므로 캐시)
+    return _QUERY_FIELD_RE.sub(_replace_query_field, query)
+
+# 상세 페이지의 <meta name="citation_pdf_url" content="..."> 추출용
+_PDF_META_RE = re.compile(
+    r"""<meta[^>]+name=["']citation_pdf_url["'][^>]+content=["']([^"']+)""", re.I
+)
+
+# 파일명/경로 슬러그 정리용 (호출마다 패턴을 다시 만들지 않도록 모듈 수준에 둔다)
+_FN_TRANS = str.maketrans({c: "_" for c in '<>:"/\\|?*'})
+_SLUG_BAD = re.compile(r"[^A-Za-z0-9_\-]+")
+
+# PDF 스트리밍 청크 크기와 디스크 기록 단위
+PDF_CHUNK_SIZE = 256 * 1024
+PDF_FLUSH_BYTES = 1024 * 1024
+# 이 크기 이하(Content-Length 기준)는 스트리밍 없이 통째로 받는다
+PDF_SMALL_BODY_BYTES = 2 * 1024 * 1024
+
+# 쿼리 하나에서 동시에 진행할 상세 페이지/PDF 다운로드 수
+PDF_FETCH_CONCURRENCY = 6
+
+# count_only 검색 결과 캐시 유효기간(초). Google Patents 색인은 대체로 하루 단위로 갱신됨
+QUERY_CACHE_TTL = 24 * 60 * 60.0
+
+# 검색 화면 폴백 페이징(page=/start=)에서 한 묶음으로 요청할 페이지 수 (시작 간격은 페이서가 제한)
+PAGINATION_WINDOW = 5
+
+# full recall 결과 페이지 기본 크기 (Google Patents 검색 화면의 최대 표시 개수)
+DEFAULT_PAGE_SIZE = 100
+
+# full recall 수집 시 동시에 요청할 결과 페이지 수 (공유 HTTP/2 연결 위에서 다중화)
+PAGE_FETCH_CONCURRENCY = 8
+
+# httpx 클라이언트 기본 헤더 (캡처된 XHR 헤더로 일부 덮어씀)
+DEFAULT_CLIENT_HEADERS: Dict[str, str] = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/126.0.0.0 Safari/537.36",
+    "Accept-Language": "en-US,en;q=0.9,ko;q=0.8",
+    "Accept": "text/html,application/xhtml+xml,application/xml;"
+    "q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+    "Referer": GOOGLE_PATENTS_ORIGIN + "/",
+}
+
+# 동의(Consent) 버튼 후보. 셀렉터 목록을 하나로 합쳐 프레임당 한 번만 조회한다
+# (`:has-text()`는 Playwright 전용이라 document.querySelector로는 검사 불가)
+CONSENT_SELECTOR = ", ".join(
+    [
+        "button:has-text('I agree')",
+        "button:has-text('Agree')",
+        "button:has-text('Accept all')",
+        "button[aria-label*='Agree']",
+        "#L2AGLb",
+        "#introAgreeButton",
+        "form[action*='consent'] button[type='submit']",
+        "[role='dialog'] button:has-text('Accept')",
+        "[role='dialog'] button:has-text('동의')",
+    ]
+)
+
+# 다음 페이지 링크 후보. 셀렉터를 합쳐 단계당 한 번만 조회한다.
+# 합친 셀렉터는 문서 순서로 매칭되므로, 오탐 가능성이 낮은 속성 기반 후보를
+# 텍스트 기반 후보('›' 등)보다 먼저 별도로 검사한다.
+NEXT_PAGE_SELECTORS = (
+    ", ".join(
+        [
+            "a[rel='next' i]",
+            "a[aria-label='Next' i]",
+            "a[aria-label*='Next' i]",
+            "a#pnnext",
+            "a[aria-label*='›']",
+        ]
+    ),
+    ", ".join(
+        [
+            "a:has-text('Next')",
+            "a:has-text('다음')",
+            "button:has-text('Next')",
+            "[role='link']:has-text('Next')",
+            "a:has-text('›')",
+        ]
+    ),
+)
+
+# 검색 결과가 렌더링되었음을 알리는 요소
+RESULTS_SELECTOR = "article, state-modifier.result-title, #resultsContainer"
+
+# XHR 캡처에 불필요한 Chromium 기능/백그라운드 스로틀링 비활성화
+# (headless 모드 선택은 Playwright에 맡기고, 샌드박스는 유지한다)
+CHROMIUM_LAUNCH_ARGS = [
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-features=Translate,BackForwardCache,MediaRouter,OptimizationHints",
+]
+
+# _parse_results_from_dom에서 article 목록을 한 번에 직렬화하는 스크립트
+_DOM_RESULTS_JS = """
+(articles) => articles.map((a) => {
+  const t = a.querySelector("h3 a");
+  const h = a.querySelector("h4 a");
+  return {
+    title: ((t && t.innerText) || "").trim(),
+    href: (t && t.getAttribute("href")) || "",
+    pub: ((h && h.innerText) || "").trim(),
+  };
+}).filter((r) => r.href)
+"""
+
+# 스크롤/다음 페이지 후 결과 목록이 바뀌었는지 판단하는 값 (article 수 + 첫 결과 링크)
+_RESULTS_SIGNATURE_JS = """() => {
+  const articles = document.querySelectorAll("article");
+  const first = articles.length ? articles[0].querySelector("h3 a") : null;
+  return articles.length + "|" + ((first && first.getAttribute("href")) || "");
+}"""
+
+# 속성 기반 다음 페이지 후보의 href를 한 번에 조회 (없으면 null, 버튼형이면 "")
+# 텍스트 기반 후보는 Playwright 전용 :has-text를 쓰므로 locator로 따로 조회한다
+_NEXT_LINK_JS = """(sel) => {
+  const el = document.querySelector(sel);
+  return el ? (el.getAttribute("href") || "") : null;
+}"""
+
+# XHR 캡처/결과 파싱에 필요 없는 리소스 유형 (브라우저에서 차단)
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+
+# 검색 XHR과 무관한 분석/광고 스크립트 호스트 (리소스 유형과 무관하게 차단)
+_BLOCKED_HOST_RE = re.compile(
+    r"^https?://[^/]*(?:google-analytics\.com|googletagmanager\.com|doubleclick\.net)/"
+)
+
+
+def _task_succeeded(task: "asyncio.Task[Any]") -> bool:
+    """완료된 태스크가 취소/예외 없이 끝났는지 확인한다."""
+
+    return task.done() and not task.cancelled() and task.exception() is None
+
+
+async def _write_text_async(path: Path, text: str) -> None:
+    """이벤트 루프를 막지 않도록 파일 쓰기를 스레드에서 수행한다."""
+
+    await asyncio.to_thread(path.write_text, text, encoding="utf-8")
+
+
+def _json_loads(content: str) -> Any:
+    """orjson이 있으면 사용하고 없으면 표준 json으로 디코딩."""
+
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _json_dumps_pretty(obj: Any) -> bytes:
+    """들여쓰기 2칸, 비ASCII 보존 JSON (UTF-8 바이트, 파일에 그대로 기록)."""
+
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+async def _write_json_async(path: Path, obj: Any) -> None:
+    """JSON을 직렬화해 스레드에서 기록한다 (str 경유 없이 바이트로 저장)."""
+
+    await asyncio.to_thread(path.write_bytes, _json_dumps_pretty(obj))
+
+
+def _title_shingles(title: str, k: int = 5) -> set[str]:
+    text = _WS_RE.sub(" ", title.casefold()).strip()
+    if len(text) <= k:
+        return {text} if text else set()
+    return {text[i : i + k] for i in range(len(text) - k + 1)}
+
+
+def _dedup_near_titles(results: List["PatentSummary"], threshold: float) -> List["PatentSummary"]:
+    """제목의 문자 5-gram Jaccard 유사도가 threshold 이상인 뒤쪽 결과를 제거한다.
+
+    같은 발명의 패밀리 특허(US/EP/WO 등)는 제목이 거의 같아 PDF를 중복으로 받게 된다.
+    결과 수가 페이지 단위(수십~수백 건)이므로 MinHash 없이 쌍별 비교로 충분하다.
+    """
+
+    kept: List["PatentSummary"] = []
+    kept_shingles: List[set[str]] = []
+    for item in results:
+        shingles = _title_shingles(item.title or "")
+        duplicate = False
+        if shingles:
+            for other in kept_shingles:
+                if other and len(shingles & other) / len(shingles | other) >= threshold:
+                    duplicate = True
+                    break
+        if not duplicate:
+            kept.append(item)
+            kept_shingles.append(shingles)
+    return kept
+
+
+async def _block_heavy_resources(route: Route) -> None:
+    """이미지/폰트/CSS 및 분석 스크립트 등 불필요한 리소스 요청을 중단한다."""
+
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or _BLOCKED_HOST_RE.match(
+        request.url
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
 
 @dataclass
 class CapturedRequest:
@@ -201,6 +495,30 @@ class CapturedRequest:
     referer: Optional[str]
 
 
+class RequestPacer:
+    """요청 시작 간격을 보장하는 페이서 (용량 1의 토큰 버킷).
+
+    여러 코루틴이 공유해도 요청 시작 시점 사이에 최소 `interval`초 간격을 두므로,
+    작업을 직렬화하지 않고도 호스트당 요청 속도를 제한할 수 있다.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = max(0.0, interval)
+        self._lock: Optional[asyncio.Lock] = None
+        self._next_at = 0.0
+
+    async def wait(self) -> None:
+        if self._lock is None:
+            # 실행 중인 이벤트 루프에 묶이도록 지연 생성
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            if self._next_at > now:
+                await asyncio.sleep(self._next_at - now)
+                now = self._next_at
+            self._next_at = now + self.interval
+
+
 @dataclass
 class PatentSummary:
     """검색 결과에서 추출된 특허 요약 정보."""
@@ -220,26 +538,135 @@ class GooglePatentsXHRDownloader:
         timeout: int = 30,
         delay: float = 1.0,
         diagnostics: bool = False,
+        concurrency: int = 3,
+        xhr_first: bool = True,
+        cache_ttl: Optional[float] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        pdf_concurrency: int = PDF_FETCH_CONCURRENCY,
+        dedup_threshold: Optional[float] = None,
     ) -> None:
         self.download_dir = Path(download_dir)
         self.download_dir.mkdir(parents=True, exist_ok=True)
+        # 메타데이터의 절대 경로용 (결과마다 resolve()를 호출하지 않도록 한 번만 계산)
+        self._resolved_download_dir = self.download_dir.resolve()
         self.headless = headless
         self.timeout = timeout
         self.delay = delay
         self.diagnostics = diagnostics
+        # search_and_download_many에서 동시에 처리할 최대 쿼리 수
+        self.concurrency = max(1, concurrency)
+        # 쿼리 하나에서 동시에 진행할 상세 페이지/PDF 다운로드 수
+        self.pdf_concurrency = max(1, pdf_concurrency)
+        # 제목 유사도(문자 5-gram Jaccard)가 이 값 이상인 결과는 PDF를 한 번만 받음 (None이면 비활성)
+        self.dedup_threshold = (
+            dedup_threshold if dedup_threshold is not None and dedup_threshold < 1.0 else None
+        )
         self.diagnostics_dir = self.download_dir / "diagnostics"
         if self.diagnostics:
             self.diagnostics_dir.mkdir(parents=True, exist_ok=True)
+        # 여러 쿼리가 공유하는 Playwright/Chromium 프로세스 (__aenter__에서 기동)
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._log_sink_id: Optional[int] = None
+        self._enter_depth = 0
+        # 상세/PDF 요청 간격 제어 (쿼리 간에도 공유)
+        self._pacer = RequestPacer(delay)
+        # 직전 쿼리 컨텍스트의 쿠키(NID/CONSENT 등). 새 컨텍스트에 미리 심어 재사용
+        self._shared_cookies: List[Dict[str, Any]] = []
+        # 브라우저 없이 재사용할 직전 `/xhr/query` 요청 (만료 시 None으로 초기화)
+        self._warm_session: Optional[CapturedRequest] = None
+        # True면 브라우저는 warm 세션 확보(부트스트랩)/만료 시에만 사용하고 나머지는 httpx로 검색
+        self.xhr_first = xhr_first
+        # 부트스트랩 중 동시 쿼리가 각자 브라우저 컨텍스트를 띄우지 않도록, 진행 중인
+        # 부트스트랩이 XHR 세션을 캡처하면 set되는 이벤트 (실행 중인 루프에서 지연 생성)
+        self._bootstrap_event: Optional[asyncio.Event] = None
+        self._bootstrap_failed = False
+        # count_only 검색 결과 디스크 캐시 (None/0이면 사용 안 함)
+        self.cache_ttl = cache_ttl
+        self._cache_dir = self.download_dir / ".xhr_cache"
+        # 공보번호 → 저장된 PDF 메타데이터 (쿼리/실행 간 중복 다운로드 방지)
+        self._pdf_index_path = self.download_dir / ".pdf_index.json"
+        self._pdf_index: Dict[str, Dict[str, Any]] = {}
+        self._pdf_index_loaded = False
+        self._pdf_index_dirty = False
+        # 인덱스 로드/저장 직렬화 (실행 중인 이벤트 루프에 묶이도록 지연 생성)
+        self._pdf_index_lock: Optional[asyncio.Lock] = None
+        # full recall 페이지 크기. 기본값보다 크면 첫 사용 시 검증한 값을 계속 사용
+        self.page_size = max(1, page_size)
+        self._page_size_verified: Optional[int] = (
+            None if self.page_size > DEFAULT_PAGE_SIZE else self.page_size
+        )
+        # 쿼리 간 공유하는 httpx 클라이언트 (_get_client에서 생성, aclose에서 종료)
+        self._client: Optional[httpx.AsyncClient] = None
 
-    async def _launch_browser(self) -> Tuple[Browser, BrowserContext, Page]:
-        """브라우저/컨텍스트/페이지를 초기화한다."""
+    async def __aenter__(self) -> "GooglePatentsXHRDownloader":
+        # 중첩 진입 허용: 바깥(예: 여러 PDF/전략 반복)에서 연 세션은
+        # 안쪽 `async with`가 끝나도 닫지 않는다
+        self._enter_depth += 1
+        try:
+            await self._launch_browser()
+        except BaseException:
+            self._enter_depth -= 1
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self._enter_depth -= 1
+        if self._enter_depth <= 0:
+            self._enter_depth = 0
+            await self.aclose()
+
+    async def _launch_browser(self) -> Browser:
+        """공유 브라우저를 기동한다 (이미 떠 있으면 재사용).
+
+        Chromium 기동은 쿼리당 가장 큰 고정 비용이므로 브라우저는 한 번만 띄우고,
+        쿼리마다 새 BrowserContext를 만든다. 컨텍스트에는 직전 쿼리의 쿠키만
+        미리 심고, 페이지 상태와 XSRF 등 요청별 토큰은 쿼리마다 새로 받는다.
+        """
 
-        playwright = await async_playwright().start()
-        browser = await playwright.chromium.launch(headless=self.headless)
-        context = await browser.new_context()
-        page = await context.new_page()
-        page.set_default_timeout(self.timeout * 1000)
-        return browser, context, page
+        if self._browser is None:
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(
+                headless=self.headless, args=CHROMIUM_LAUNCH_ARGS
+            )
+            # run.log 파일 sink (동일 폴더 내, 존재할 경우 이어쓰기)
+            # 쿼리 단위로 추가하면 동시 실행 시 같은 줄이 중복 기록되므로 브라우저 수명에 묶는다
+            try:
+                log_path = (self.download_dir / "run.log").resolve()
+                self._log_sink_id = logger.add(str(log_path), level="INFO")
+            except Exception:
+                self._log_sink_id = None
+        return self._browser
+
+    async def aclose(self) -> None:
+        """공유 httpx 클라이언트, 브라우저와 Playwright 세션을 종료한다."""
+
+        if self._client is not None:
+            try:
+                await self._client.aclose()
+            except Exception:
+                pass
+            self._client = None
+
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+        # 로그 sink 제거
+        if self._log_sink_id is not None:
+            try:
+                logger.remove(self._log_sink_id)
+            except Exception:
+                pass
+            self._log_sink_id = None
 
     @staticmethod
     def _normalize_query_string(query: str) -> str:
@@ -260,58 +687,20 @@ class GooglePatentsXHRDownloader:
         이미 표준 구문을 사용 중이면 변환하지 않습니다.
         """
 
-        # 필드 약어 치환
-        field_replacements = {
-            r"\babstract:\s*": "AB=",
-            r"\btitle:\s*": "TI=", 
-            r"\bclaims:\s*": "CL=",
-        }
-        
-        # 메타데이터 필드 정규화 (일관성을 위해)
-        metadata_replacements = {
-            r"\bassignee\s*=\s*": "assignee:",
-            r"\binventor\s*=\s*": "inventor:",
-            r"\bcountry\s*=\s*": "country:",
-            r"\bstatus\s*=\s*": "status:",
-            r"\blanguage\s*=\s*": "language:",
-        }
-
-        normalized = query
-        
-        # 필드 약어 치환 적용
-        for pattern, repl in field_replacements.items():
-            normalized = re.sub(pattern, repl, normalized, flags=re.IGNORECASE)
-            
-        # 메타데이터 필드 정규화 적용
-        for pattern, repl in metadata_replacements.items():
-            normalized = re.sub(pattern, repl, normalized, flags=re.IGNORECASE)
-            
-        return normalized
+        return _normalize_query(query)
 
     async def _try_accept_consent(self, page: Page) -> None:
         """구글 동의(Consent) 배너가 있는 경우 최대한 닫는다."""
 
         async def try_click_targets(target_page: Page) -> bool:
-            selectors = [
-                "button:has-text('I agree')",
-                "button:has-text('Agree')",
-                "button:has-text('Accept all')",
-                "button[aria-label*='Agree']",
-                "#L2AGLb",
-                "#introAgreeButton",
-                "form[action*='consent'] button[type='submit']",
-                "[role='dialog'] button:has-text('Accept')",
-                "[role='dialog'] button:has-text('동의')",
-            ]
-            for sel in selectors:
-                try:
-                    count = await target_page.locator(sel).count()
-                    if count:
-                        await target_page.locator(sel).first.click()
-                        await target_page.wait_for_timeout(500)
-                        return True
-                except Exception:
-                    continue
+            try:
+                targets = target_page.locator(CONSENT_SELECTOR)
+                if await targets.count():
+                    await targets.first.click()
+                    await target_page.wait_for_timeout(500)
+                    return True
+            except Exception:
+                pass
             return False
 
         try:
@@ -336,19 +725,28 @@ class GooglePatentsXHRDownloader:
 
     async def _capture_xhr_request(
         self, page: Page, query: str, diag_dir: Optional[Path] = None
-    ) -> Tuple[Optional[CapturedRequest], str, Optional[str]]:
+    ) -> Tuple[
+        Optional[CapturedRequest],
+        str,
+        Optional[Tuple[List[PatentSummary], Optional[int]]],
+    ]:
         """검색 중 `/xhr/query` 요청을 하나 캡처한다.
 
         우선 기본 홈에서 입력→엔터로 시도하고, 실패 시 검색 URL로 직접 이동해
-        결과 HTML을 확보한다.
+        결과 HTML을 확보한다. XHR JSON 응답만으로 결과를 파싱할 수 있으면
+        DOM 대기와 `page.content()` 직렬화를 생략하고 빈 HTML을 반환한다.
 
         Returns:
-            (captured, search_results_html, xhr_response_text)
+            (captured, search_results_html, xhr_parsed)
+            xhr_parsed는 브라우저가 받은 XHR 응답의 파싱 결과(results, total_count)이며,
+            호출자가 같은 본문을 다시 파싱하지 않도록 그대로 넘긴다.
         """
 
         captured: Optional[CapturedRequest] = None
         search_results_html: str = ""
         xhr_response_text: Optional[str] = None
+        xhr_parsed: Optional[Tuple[List[PatentSummary], Optional[int]]] = None
+        xhr_ok = False
 
         # 필드 별칭 정규화(abstract:/title:/claims: → AB=/TI=/CL=)
         effective_query = self._normalize_query_string(query)
@@ -385,43 +783,77 @@ class GooglePatentsXHRDownloader:
             except Exception:
                 await page.wait_for_selector("input")
                 await page.locator("input").first.fill(effective_query)
-            await page.keyboard.press("Enter")
 
-            try:
-                resp = await page.wait_for_response(
+            # XHR 응답과 결과 DOM 중 먼저 오는 신호를 기다린다.
+            # Enter 전에 대기를 걸어 두어야 빠른 응답을 놓치지 않는다.
+            xhr_task = asyncio.create_task(
+                page.wait_for_response(
                     lambda r: "/xhr/query" in r.url, timeout=self.timeout * 1000
                 )
+            )
+            dom_task = asyncio.create_task(
+                page.wait_for_selector(
+                    RESULTS_SELECTOR, timeout=min(15000, self.timeout * 1000)
+                )
+            )
+            try:
+                await page.keyboard.press("Enter")
+                done, _ = await asyncio.wait(
+                    {xhr_task, dom_task}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if xhr_task not in done:
+                    # DOM이 먼저 준비되면 XHR 응답은 잠깐만 더 기다린다
+                    await asyncio.wait(
+                        {xhr_task}, timeout=1.0 if _task_succeeded(dom_task) else None
+                    )
+                elif not _task_succeeded(xhr_task):
+                    # XHR 대기가 실패했으면 DOM 신호를 끝까지 기다린다
+                    await asyncio.wait({dom_task})
+            finally:
+                for task in (xhr_task, dom_task):
+                    if not task.done():
+                        task.cancel()
+                await asyncio.gather(xhr_task, dom_task, return_exceptions=True)
+
+            dom_ready = _task_succeeded(dom_task)
+            if _task_succeeded(xhr_task):
                 try:
-                    xhr_response_text = await resp.text()
+                    xhr_response_text = await xhr_task.result().text()
                 except Exception:
                     xhr_response_text = None
-            except Exception:
-                xhr_response_text = None
 
-            # 결과가 올라올 때까지 보조 대기(결과 컨테이너 또는 article)
-            try:
-                await page.wait_for_selector(
-                    "article, state-modifier.result-title, #resultsContainer",
-                    timeout=min(15000, self.timeout * 1000),
-                )
-            except Exception:
-                pass
+            # XHR JSON으로 결과를 얻었다면 HTML 확보 단계는 불필요
+            # (검색 결과 0건도 total_num_results=0으로 확정되므로 DOM을 기다리지 않는다)
+            if xhr_response_text:
+                xhr_parsed = self._parse_results_from_xhr(xhr_response_text)
+                xhr_results, xhr_total = xhr_parsed
+                xhr_ok = bool(xhr_results) or xhr_total == 0
 
-            try:
-                await page.wait_for_load_state("networkidle", timeout=1500)
-            except Exception:
-                pass
-            await page.wait_for_timeout(250)
+            if not xhr_ok:
+                if not dom_ready:
+                    # 결과가 올라올 때까지 보조 대기(결과 컨테이너 또는 article)
+                    try:
+                        await page.wait_for_selector(
+                            RESULTS_SELECTOR,
+                            timeout=min(15000, self.timeout * 1000),
+                        )
+                    except Exception:
+                        pass
+                    # 결과 컨테이너만 먼저 뜬 경우 article이 붙을 때까지만 짧게 대기
+                    try:
+                        await page.wait_for_selector("article", timeout=1500)
+                    except Exception:
+                        pass
 
-            try:
-                search_results_html = await page.content()
-            except Exception:
-                search_results_html = ""
+                try:
+                    search_results_html = await page.content()
+                except Exception:
+                    search_results_html = ""
         except Exception:
             search_results_html = ""
 
         # 2차 폴백: 검색 URL 직접 이동
-        if not search_results_html or "<article" not in search_results_html:
+        if not xhr_ok and (not search_results_html or "<article" not in search_results_html):
             from urllib.parse import quote_plus
             search_url = f"{GOOGLE_PATENTS_ORIGIN}/?q={quote_plus(effective_query)}&hl=en&num=100"
             try:
@@ -429,16 +861,15 @@ class GooglePatentsXHRDownloader:
                 await self._try_accept_consent(page)
                 try:
                     await page.wait_for_selector(
-                        "article, state-modifier.result-title, #resultsContainer",
+                        RESULTS_SELECTOR,
                         timeout=min(15000, self.timeout * 1000),
                     )
                 except Exception:
                     pass
                 try:
-                    await page.wait_for_load_state("networkidle", timeout=1500)
+                    await page.wait_for_selector("article", timeout=1500)
                 except Exception:
                     pass
-                await page.wait_for_timeout(250)
                 search_results_html = await page.content()
             except Exception:
                 # 마지막 시도: domcontentloaded 기준으로라도 HTML 확보
@@ -452,29 +883,27 @@ class GooglePatentsXHRDownloader:
         if self.diagnostics:
             try:
                 target_dir = diag_dir or self.diagnostics_dir
-                target_dir.mkdir(parents=True, exist_ok=True)
-                (target_dir / "search_results_page.html").write_text(
-                    search_results_html or "", encoding="utf-8"
+                await _write_text_async(
+                    target_dir / "search_results_page.html", search_results_html or ""
                 )
                 if xhr_response_text is not None:
-                    (target_dir / "xhr_query_response_original.html").write_text(
-                        xhr_response_text, encoding="utf-8"
+                    await _write_text_async(
+                        target_dir / "xhr_query_response_original.html",
+                        xhr_response_text,
                     )
             except Exception:
                 pass
 
-        return captured, search_results_html, xhr_response_text
+        return captured, search_results_html, xhr_parsed
 
     # 불용 함수 제거: _build_client_from_context는 사용하지 않으므로 삭제
 
     @staticmethod
-    async def _build_client_with_cookies(
-        context: BrowserContext, captured: Optional[CapturedRequest]
-    ) -> httpx.AsyncClient:
-        """Playwright 컨텍스트의 쿠키/헤더로 httpx.AsyncClient 생성."""
+    def _merge_cookies(
+        cookies_jar: httpx.Cookies, cookies_list: List[Dict[str, Any]]
+    ) -> None:
+        """Playwright 쿠키 목록을 httpx 쿠키 저장소에 반영(덮어쓰기)한다."""
 
-        cookies_list = await context.cookies()
-        cookies_jar = httpx.Cookies()
         for c in cookies_list:
             # httpx 쿠키에 도메인/경로 지정
             domain = c.get("domain") or ".google.com"
@@ -486,15 +915,32 @@ class GooglePatentsXHRDownloader:
                 path=path,
             )
 
-        default_headers: Dict[str, str] = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/126.0.0.0 Safari/537.36",
-            "Accept-Language": "en-US,en;q=0.9,ko;q=0.8",
-            "Accept": "text/html,application/xhtml+xml,application/xml;"
-            "q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-            "Referer": GOOGLE_PATENTS_ORIGIN + "/",
-        }
+    def _get_client(
+        self, cookies_list: List[Dict[str, Any]], captured: Optional[CapturedRequest]
+    ) -> httpx.AsyncClient:
+        """다운로더 수명 동안 공유하는 httpx 클라이언트를 반환한다.
+
+        처음 호출 시 캡처된 헤더로 클라이언트를 만들고(TLS/HTTP2 연결 재사용),
+        이후에는 새로 받은 쿠키만 병합한다. 요청별로 달라지는 헤더는
+        각 요청에서 직접 넘긴다.
+        """
+
+        if self._client is None:
+            self._client = self._build_client_with_cookies(cookies_list, captured)
+        else:
+            self._merge_cookies(self._client.cookies, cookies_list)
+        return self._client
+
+    @staticmethod
+    def _build_client_with_cookies(
+        cookies_list: List[Dict[str, Any]], captured: Optional[CapturedRequest]
+    ) -> httpx.AsyncClient:
+        """Playwright 컨텍스트의 쿠키/헤더로 httpx.AsyncClient 생성."""
+
+        cookies_jar = httpx.Cookies()
+        GooglePatentsXHRDownloader._merge_cookies(cookies_jar, cookies_list)
+
+        default_headers: Dict[str, str] = dict(DEFAULT_CLIENT_HEADERS)
 
         if captured:
             # 중요 헤더만 선별 반영
@@ -510,11 +956,22 @@ class GooglePatentsXHRDownloader:
             else:
                 default_headers["x-same-domain"] = "1"
 
+        # 같은 origin으로 병렬 요청이 몰리므로 연결을 유지해 HTTP/2로 다중화한다.
+        # transport를 직접 넘기면 client의 http2/limits는 무시되므로 transport에 지정
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=2,
+            limits=httpx.Limits(
+                max_connections=32,
+                max_keepalive_connections=32,
+                keepalive_expiry=60.0,
+            ),
+        )
         client = httpx.AsyncClient(
             headers=default_headers,
             cookies=cookies_jar,
-            http2=True,
-            timeout=httpx.Timeout(30.0),
+            transport=transport,
+            timeout=httpx.Timeout(30.0, connect=10.0, pool=10.0),
         )
         return client
 
@@ -525,28 +982,27 @@ class GooglePatentsXHRDownloader:
         if not html:
             return []
 
-        soup = BeautifulSoup(html, "lxml")
+        # lexbor(C) 파서로 CSS 셀렉터만 실행
+        tree = LexborHTMLParser(html)
         results: List[PatentSummary] = []
 
-        for article in soup.select("article"):
+        for article in tree.css("article"):
             try:
-                title_el = article.select_one("h3 a")
+                title_el = article.css_first("h3 a")
                 if not title_el:
                     continue
-                title = (title_el.get_text() or "").strip()
-                href = title_el.get("href") or ""
+                title = (title_el.text() or "").strip()
+                href = title_el.attributes.get("href") or ""
                 if href and not href.startswith("http"):
                     detail_url = GOOGLE_PATENTS_ORIGIN + href
                 else:
                     detail_url = href
 
                 pub = None
-                h4_el = article.select_one("h4")
-                if h4_el:
-                    # 종종 h4 내부 a의 텍스트가 공보번호
-                    pub_link = h4_el.select_one("a")
-                    if pub_link and pub_link.get_text():
-                        pub = pub_link.get_text().strip()
+                # 종종 h4 내부 a의 텍스트가 공보번호
+                pub_link = article.css_first("h4 a")
+                if pub_link and pub_link.text():
+                    pub = pub_link.text().strip()
 
                 if title and detail_url:
                     results.append(
@@ -563,52 +1019,66 @@ class GooglePatentsXHRDownloader:
 
         XHR 응답 또는 정적 HTML 파싱이 실패하는 경우의 마지막 폴백.
         """
-        results: List[PatentSummary] = []
         try:
             # 결과가 느리게 나타나는 경우 대비
             await page.wait_for_selector("article", timeout=self.timeout * 1000)
         except Exception:
             # article이 없으면 빈 리스트
-            return results
+            return []
+        return await self._snapshot_dom_results(page)
+
+    @staticmethod
+    async def _results_signature(page: Page) -> str:
+        """현재 결과 목록의 변화 감지용 값 (article 수 + 첫 결과 링크)."""
 
         try:
-            articles = await page.query_selector_all("article")
+            return await page.evaluate(_RESULTS_SIGNATURE_JS)
         except Exception:
-            articles = []
+            return ""
 
-        for article in articles:
-            try:
-                title_el = await article.query_selector("h3 a")
-                if not title_el:
-                    continue
-                raw_title = (await title_el.inner_text()) or ""
-                title = raw_title.strip()
-                href = await title_el.get_attribute("href")
-                if not href:
-                    continue
-                if not href.startswith("http"):
-                    detail_url = GOOGLE_PATENTS_ORIGIN + href
-                else:
-                    detail_url = href
+    @staticmethod
+    async def _wait_for_results_change(page: Page, before: str, timeout_ms: int) -> bool:
+        """결과 목록이 `before`와 달라질 때까지 기다린다 (제한 시간 내 변화 없으면 False)."""
 
-                pub = None
-                h4_link = await article.query_selector("h4 a")
-                if h4_link:
-                    try:
-                        pub_text = await h4_link.inner_text()
-                        if pub_text:
-                            pub = pub_text.strip()
-                    except Exception:
-                        pub = None
-
-                results.append(
-                    PatentSummary(
-                        title=title or (pub or ""),
-                        publication_number=pub,
-                        detail_url=detail_url,
-                    ))
-            except Exception:
+        try:
+            await page.wait_for_function(
+                f"(before) => ({_RESULTS_SIGNATURE_JS})() !== before",
+                arg=before,
+                timeout=timeout_ms,
+            )
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    async def _snapshot_dom_results(page: Page) -> List[PatentSummary]:
+        """현재 DOM에 있는 결과만 대기 없이 추출한다 (`page.content()` 직렬화 불필요)."""
+
+        results: List[PatentSummary] = []
+        # 기사별 CDP 왕복(query_selector/inner_text/get_attribute) 대신
+        # 한 번의 JS 실행으로 모든 결과를 추출한다
+        try:
+            records: List[Dict[str, str]] = await page.eval_on_selector_all(
+                "article", _DOM_RESULTS_JS
+            )
+        except Exception:
+            records = []
+
+        for record in records:
+            href = record.get("href") or ""
+            if not href:
                 continue
+            if not href.startswith("http"):
+                detail_url = GOOGLE_PATENTS_ORIGIN + href
+            else:
+                detail_url = href
+            pub = record.get("pub") or None
+            results.append(
+                PatentSummary(
+                    title=record.get("title") or (pub or ""),
+                    publication_number=pub,
+                    detail_url=detail_url,
+                ))
 
         return results
 
@@ -628,8 +1098,8 @@ class GooglePatentsXHRDownloader:
 
         # 1) JSON 응답 시
         try:
-            if content.strip().startswith("{"):
-                data = json.loads(content)
+            if _JSON_START_RE.match(content):
+                data = _json_loads(content)
                 results_node = data.get("results") or {}
                 clusters = results_node.get("cluster") or []
                 total_results = results_node.get("total_num_results")
@@ -640,8 +1110,10 @@ class GooglePatentsXHRDownloader:
                         pat = item.get("patent") or {}
                         pub = pat.get("publication_number")
                         raw_title = pat.get("title") or ""
-                        # 제목에 포함된 태그 제거
-                        title = BeautifulSoup(raw_title, "lxml").get_text(" ").strip()
+                        # 제목에 포함된 태그 제거 (파서 없이 정규식 + 엔티티 복원)
+                        title = unescape(
+                            _WS_RE.sub(" ", _TAG_RE.sub(" ", raw_title))
+                        ).strip()
 
                         if not item_id:
                             continue
@@ -664,8 +1136,7 @@ class GooglePatentsXHRDownloader:
 
     @staticmethod
     def _sanitize_filename(filename: str) -> str:
-        clean = re.sub(r"[<>:\"/\\|?*]", "_", filename)
-        return clean[:200]
+        return filename.translate(_FN_TRANS)[:200]
 
     async def _fetch_detail_and_pdf(
         self, client: httpx.AsyncClient, detail_url: str
@@ -677,18 +1148,22 @@ class GooglePatentsXHRDownloader:
             logger.warning(f"detail GET {detail_url} -> {r.status_code}")
             return None
 
-        html = r.text
-        soup = BeautifulSoup(html, "lxml")
+        # 1순위: citation_pdf_url (대부분 <head>에 있으므로 파싱 전에 정규식으로 확인)
+        m = _PDF_META_RE.search(r.text)
+        if m:
+            return unescape(m.group(1))
 
-        # 1순위: citation_pdf_url
-        meta = soup.select_one('meta[name="citation_pdf_url"]')
-        if meta and meta.get("content"):
-            return str(meta.get("content"))
+        tree = LexborHTMLParser(r.text)
+
+        # 속성 순서가 다른 경우 등 정규식이 놓친 meta 태그
+        meta = tree.css_first('meta[name="citation_pdf_url"]')
+        if meta and meta.attributes.get("content"):
+            return str(meta.attributes.get("content"))
 
         # 2순위: a[href*='.pdf'] 링크
-        a = soup.select_one("a[href$='.pdf'], a[href*='.pdf?']")
-        if a and a.get("href"):
-            href = a.get("href")
+        a = tree.css_first("a[href$='.pdf'], a[href*='.pdf?']")
+        if a and a.attributes.get("href"):
+            href = a.attributes.get("href")
             if href.startswith("http"):
                 return href
             return GOOGLE_PATENTS_ORIGIN + href
@@ -697,25 +1172,260 @@ class GooglePatentsXHRDownloader:
 
     async def _download_pdf(
         self, client: httpx.AsyncClient, pdf_url: str, target_path: Path, referer: str
-    ) -> bool:
-        """PDF를 스트리밍으로 저장한다."""
+    ) -> Optional[int]:
+        """PDF를 스트리밍으로 저장한다.
+
+        Returns:
+            저장된 파일 크기(바이트). 실패 시 None
+        """
 
         headers = {"Referer": referer, "Accept": "application/pdf,*/*"}
         try:
+            # 이전 실행에서 받은 파일이 있고 크기가 같으면 다시 받지 않는다
+            if target_path.exists():
+                try:
+                    existing_size = target_path.stat().st_size
+                    head = await client.head(pdf_url, headers=headers, follow_redirects=True)
+                    length = head.headers.get("content-length")
+                    if (
+                        head.status_code < 400
+                        and length
+                        and int(length) == existing_size
+                    ):
+                        logger.info(f"PDF already downloaded: {target_path.name}")
+                        return existing_size
+                except Exception:
+                    pass
+
             async with client.stream("GET", pdf_url, headers=headers) as resp:
                 if resp.status_code >= 400:
                     logger.error(
                         f"PDF GET {pdf_url} -> {resp.status_code}"
                     )
-                    return False
-                with target_path.open("wb") as f:
-                    async for chunk in resp.aiter_bytes():
-                        f.write(chunk)
-            return True
+                    return None
+                # 작은 PDF는 한 번에 읽어 한 번에 기록 (청크 루프 생략)
+                length = resp.headers.get("content-length")
+                if length and length.isdigit() and int(length) <= PDF_SMALL_BODY_BYTES:
+                    body = await resp.aread()
+                    await asyncio.to_thread(target_path.write_bytes, body)
+                    return len(body)
+
+                # 디스크 쓰기는 스레드로 넘겨 다른 다운로드가 멈추지 않게 한다
+                # (기록한 바이트 수를 세어 두어 저장 후 stat 호출을 생략)
+                written = 0
+                f = await asyncio.to_thread(target_path.open, "wb")
+                try:
+                    buf = bytearray()
+                    async for chunk in resp.aiter_bytes(chunk_size=PDF_CHUNK_SIZE):
+                        buf += chunk
+                        if len(buf) >= PDF_FLUSH_BYTES:
+                            await asyncio.to_thread(f.write, buf)
+                            written += len(buf)
+                            buf.clear()
+                    if buf:
+                        await asyncio.to_thread(f.write, buf)
+                        written += len(buf)
+                finally:
+                    await asyncio.to_thread(f.close)
+            return written
         except Exception as exc:
             logger.error(f"PDF download error: {exc}")
-            return False
+            return None
     
+    async def _process_one(
+        self,
+        client: httpx.AsyncClient,
+        sem: asyncio.Semaphore,
+        idx: int,
+        total: int,
+        item: PatentSummary,
+    ) -> Optional[Tuple[Path, Dict[str, Any]]]:
+        """결과 하나의 상세 페이지에서 PDF URL을 찾아 저장한다.
+
+        Returns:
+            (저장 경로, 메타데이터) 또는 실패 시 None
+        """
+
+        # 이전 쿼리/실행에서 이미 받은 공보번호는 상세 페이지와 PDF 요청 없이 재사용
+        cached = await self._lookup_saved_pdf(item.publication_number)
+        if cached is not None:
+            logger.info(f"[{idx}/{total}] {item.publication_number} already saved")
+            return cached
+
+        async with sem:
+            await self._pacer.wait()
+            logger.info(f"[{idx}/{total}] {item.publication_number} → detail")
+
+            try:
+                pdf_url = await self._fetch_detail_and_pdf(client, item.detail_url)
+            except Exception as exc:
+                logger.warning(f"detail GET {item.detail_url} failed: {exc}")
+                return None
+            if not pdf_url:
+                logger.warning("PDF URL을 찾지 못했습니다. 건너뜁니다.")
+                return None
+
+            base_name = item.publication_number or f"Patent_{idx}"
+            base_name = self._sanitize_filename(base_name)
+            out_path = self.download_dir / f"{base_name}.pdf"
+
+            size = await self._download_pdf(
+                client, pdf_url, out_path, referer=item.detail_url
+            )
+            if size is None:
+                logger.error(f"❌ Failed to save {out_path.name}")
+                return None
+
+            logger.info(f"✅ Saved {out_path.name} ({size:,} bytes)")
+            meta = {
+                "publication_number": item.publication_number,
+                "title": item.title,
+                "detail_url": item.detail_url,
+                "pdf_url": pdf_url,
+                "saved_path": str(self._resolved_download_dir / out_path.name),
+                "size_bytes": size,
+            }
+            if item.publication_number:
+                self._pdf_index[item.publication_number] = meta
+                self._pdf_index_dirty = True
+            return out_path, meta
+
+    def _get_pdf_index_lock(self) -> asyncio.Lock:
+        if self._pdf_index_lock is None:
+            self._pdf_index_lock = asyncio.Lock()
+        return self._pdf_index_lock
+
+    async def _lookup_saved_pdf(
+        self, publication_number: Optional[str]
+    ) -> Optional[Tuple[Path, Dict[str, Any]]]:
+        """PDF 인덱스에 있고 파일 크기가 그대로인 공보번호면 (경로, 메타데이터)를 반환한다."""
+
+        if not publication_number:
+            return None
+        if not self._pdf_index_loaded:
+            # 동시에 들어온 조회는 로드가 끝날 때까지 기다려야 저장된 PDF를 놓치지 않는다
+            async with self._get_pdf_index_lock():
+                if not self._pdf_index_loaded:
+                    try:
+                        raw = await asyncio.to_thread(
+                            self._pdf_index_path.read_text, encoding="utf-8"
+                        )
+                        # 이번 실행 중 이미 기록된 항목이 우선
+                        self._pdf_index = {**_json_loads(raw), **self._pdf_index}
+                    except Exception:
+                        pass
+                    self._pdf_index_loaded = True
+
+        meta = self._pdf_index.get(publication_number)
+        if not meta:
+            return None
+        path = Path(meta.get("saved_path") or "")
+        try:
+            size = (await asyncio.to_thread(path.stat)).st_size
+        except Exception:
+            return None
+        if size != meta.get("size_bytes"):
+            return None
+        return path, meta
+
+    async def _save_pdf_index(self) -> None:
+        """이번 쿼리에서 새로 받은 PDF가 있으면 인덱스 파일을 갱신한다."""
+
+        if not self._pdf_index_dirty:
+            return
+        async with self._get_pdf_index_lock():
+            if not self._pdf_index_dirty:
+                return
+            self._pdf_index_dirty = False
+            try:
+                await _write_json_async(self._pdf_index_path, dict(self._pdf_index))
+            except Exception as exc:
+                logger.warning(f"Failed to write PDF index: {exc}")
+
+    async def _iter_result_pages(
+        self,
+        client: httpx.AsyncClient,
+        captured: CapturedRequest,
+        total_count: int,
+        replay_headers: Dict[str, str],
+    ) -> AsyncIterator[Tuple[int, List[PatentSummary]]]:
+        """전체 검색 결과 페이지를 병렬로 요청하고 페이지 순서대로 (페이지 번호, 결과)를 내보낸다.
+
+        요청 시작은 공유 `RequestPacer`로 간격을 둔다. 먼저 끝난 뒷 페이지는 앞 페이지가
+        끝날 때까지 보류하므로, 페이지 요청이 실패하면 그 앞까지의 연속된 페이지만
+        내보내고 종료한다 (이후 페이지도 실패할 가능성이 높고, 중간이 빈 결과는 Recall을 왜곡).
+        소비자가 중간에 반복을 멈추면(aclose) 남은 페이지 요청은 취소된다.
+        """
+        # URL은 한 번만 파싱하고, 페이지별로 num/start만 덮어쓴다
+        # (httpx.URL은 다중 값 파라미터를 보존하고 인코딩도 처리한다)
+        base_url = httpx.URL(captured.url)
+        sem = asyncio.Semaphore(PAGE_FETCH_CONCURRENCY)
+
+        async def fetch_page(page: int, start_idx: int, num: int) -> Tuple[int, List[PatentSummary]]:
+            page_url = base_url.copy_merge_params({"num": str(num), "start": str(start_idx)})
+
+            async with sem:
+                # Google Patents 요청 속도 제한 (상세/PDF 요청과 같은 간격 공유)
+                await self._pacer.wait()
+                logger.info(f"Fetching page {page + 1} (results {start_idx + 1}-{start_idx + num})")
+                resp = await client.get(page_url, headers=replay_headers, timeout=15.0)
+            if resp.status_code >= 400:
+                raise RuntimeError(f"status {resp.status_code}")
+            page_results, _ = self._parse_results_from_xhr(resp.text)
+            return page, page_results
+
+        # 기본 페이지 크기보다 큰 page_size는 첫 페이지로 한 번 검증한다.
+        # 서버가 조용히 100건으로 잘라 보내면 큰 페이지 간격으로는 결과가 누락되므로
+        # 요청한 만큼 돌아온 경우에만 사용하고, 아니면 기본 크기로 되돌린다.
+        page_size = self._page_size_verified or DEFAULT_PAGE_SIZE
+        first_page: Optional[List[PatentSummary]] = None
+        if (
+            self._page_size_verified is None
+            and self.page_size > DEFAULT_PAGE_SIZE
+            and total_count > DEFAULT_PAGE_SIZE
+        ):
+            probe_num = min(self.page_size, total_count)
+            try:
+                _, probe_results = await fetch_page(0, 0, probe_num)
+            except Exception as exc:
+                logger.info(f"Page size probe failed ({exc}); using {DEFAULT_PAGE_SIZE}")
+                probe_results = []
+            if len(probe_results) >= probe_num:
+                page_size = self.page_size
+                first_page = probe_results
+            else:
+                logger.info(f"Server capped page size; using {DEFAULT_PAGE_SIZE}")
+            self._page_size_verified = page_size
+
+        max_pages = (total_count + page_size - 1) // page_size  # 올림 계산
+
+        logger.info(f"Fetching up to {max_pages} pages of {page_size} ({total_count} total results)")
+
+        if first_page is not None:
+            yield 0, first_page
+
+        # 페이지 요청 계획 (start, num)을 미리 만들고, 공유 클라이언트로 병렬 요청
+        plan = [
+            (page, page * page_size, min(page_size, total_count - page * page_size))
+            for page in range(1 if first_page is not None else 0, max_pages)
+        ]
+
+        tasks = [asyncio.create_task(fetch_page(*p)) for p in plan]
+        try:
+            # 계획 순서대로 기다리면 먼저 끝난 뒷 페이지는 태스크에 보류된다
+            for task in tasks:
+                try:
+                    yield await task
+                except Exception as exc:
+                    # 403/429 등은 이후 페이지도 실패할 가능성이 높으므로 남은 요청을 중단
+                    logger.error(f"Failed to fetch a result page: {exc}")
+                    return
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     async def _fetch_all_results(
         self, 
         client: httpx.AsyncClient, 
@@ -726,526 +1436,759 @@ class GooglePatentsXHRDownloader:
     ) -> List[PatentSummary]:
         """전체 검색 결과를 페이지별로 수집 (Seed Recall 계산용)"""
         all_results = []
-        page_size = 100  # 한 번에 가져올 최대 결과 수
-        
-        # URL 파라미터 파싱
-        from urllib.parse import urlparse, parse_qs
-        parsed_url = urlparse(captured.url)
-        base_params = parse_qs(parsed_url.query)
-        
-        # 기본 파라미터를 dict로 변환
-        params = {}
-        for k, v in base_params.items():
-            params[k] = v[0] if v else ""
-        
-        pages_fetched = 0
-        max_pages = (total_count + page_size - 1) // page_size  # 올림 계산
-        
-        logger.info(f"Fetching up to {max_pages} pages ({total_count} total results)")
-        
-        for page in range(max_pages):
-            start_idx = page * page_size
-            params["num"] = str(min(page_size, total_count - start_idx))
-            params["start"] = str(start_idx)
-            
-            # URL 재구성
-            query_string = "&".join([f"{k}={v}" for k, v in params.items() if v])
-            fetch_url = f"{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}?{query_string}"
-            
-            try:
-                logger.info(f"Fetching page {page + 1}/{max_pages} (results {start_idx + 1}-{start_idx + int(params['num'])})")
-                
-                resp = await client.get(fetch_url, headers=replay_headers, timeout=15.0)
-                if resp.status_code >= 400:
-                    logger.warning(f"Page {page + 1} failed with status {resp.status_code}")
+        normalized_target = (
+            target_patent.upper().translate(_PUB_NUMBER_DELETE) if target_patent else None
+        )
+
+        pages: Dict[int, List[PatentSummary]] = {}
+        fetched_count = 0
+        page_iter = self._iter_result_pages(client, captured, total_count, replay_headers)
+        try:
+            async for page, page_results in page_iter:
+                pages[page] = page_results
+                fetched_count += len(page_results)
+
+                # Early termination: 타겟 특허를 찾으면 남은 페이지 요청을 취소
+                if normalized_target and any(
+                    patent.publication_number
+                    and patent.publication_number.upper().translate(_PUB_NUMBER_DELETE)
+                    == normalized_target
+                    for patent in page_results
+                ):
+                    logger.info(f"🎯 Target patent {target_patent} found on page {page + 1}! Early termination.")
                     break
-                
-                page_results, _ = self._parse_results_from_xhr(resp.text)
-                all_results.extend(page_results)
-                pages_fetched += 1
-                
-                # Early termination: 타겟 특허를 찾으면 중단
-                if target_patent:
-                    normalized_target = target_patent.upper().replace(" ", "").replace(",", "").replace("-", "")
-                    for patent in page_results:
-                        if patent.publication_number:
-                            normalized_found = patent.publication_number.upper().replace(" ", "").replace(",", "").replace("-", "")
-                            if normalized_found == normalized_target:
-                                logger.info(f"🎯 Target patent {target_patent} found on page {page + 1}! Early termination.")
-                                return all_results
-                
+
                 # 진행률 로그
-                if pages_fetched % 5 == 0 or page == max_pages - 1:
-                    logger.info(f"Progress: {len(all_results)}/{total_count} results fetched ({len(all_results)/total_count*100:.1f}%)")
-                
-                # 요청 간 지연
-                await asyncio.sleep(0.5)
-                
-            except Exception as exc:
-                logger.error(f"Failed to fetch page {page + 1}: {exc}")
-                break
-        
-        logger.info(f"Collected {len(all_results)} results across {pages_fetched} pages")
+                if len(pages) % 5 == 0:
+                    logger.info(f"Progress: {fetched_count}/{total_count} results fetched ({fetched_count/total_count*100:.1f}%)")
+        finally:
+            # 조기 종료 시 남은 페이지 요청이 즉시 취소되도록 명시적으로 닫는다
+            await page_iter.aclose()
+
+        # 완료 순서와 무관하게 페이지 순서대로 결과를 합친다
+        for page in sorted(pages):
+            all_results.extend(pages[page])
+
+        logger.info(f"Collected {len(all_results)} results across {len(pages)} pages")
         return all_results
 
+    @staticmethod
+    def _replay_headers(captured: CapturedRequest) -> Dict[str, str]:
+        """캡처된 헤더 중 httpx로 전달해도 안전한 헤더만 선별한다."""
+
+        banned = {
+            "cookie",
+            "host",
+            "authority",
+            "method",
+            "path",
+            "scheme",
+            "content-length",
+            "origin",
+            # 브라우저는 br/zstd까지 광고하지만 httpx는 설치된 디코더(brotli 등)에
+            # 맞춰 Accept-Encoding을 직접 채우므로 캡처값을 그대로 쓰지 않는다
+            "accept-encoding",
+        }
+        replay_headers = {
+            k.title(): v
+            for k, v in captured.headers.items()
+            if k.lower() not in banned
+        }
+        # 최소 요구 헤더 보강
+        replay_headers.setdefault("X-Same-Domain", "1")
+        replay_headers.setdefault("Referer", captured.referer or GOOGLE_PATENTS_ORIGIN + "/")
+        return replay_headers
+
+    @staticmethod
+    def _xhr_url_for_query(xhr_url: str, effective_query: str, num: int) -> str:
+        """캡처된 `/xhr/query` URL의 내부 질의(q/oq)만 새 검색어로 바꾼다."""
+
+        from urllib.parse import parse_qsl, unquote, urlencode, urlsplit, urlunsplit
+
+        split = urlsplit(xhr_url)
+        params = dict(parse_qsl(split.query, keep_blank_values=True))
+        inner_params = dict(parse_qsl(unquote(params.get("url", "")), keep_blank_values=True))
+        inner_params["q"] = effective_query
+        inner_params["oq"] = effective_query
+        inner_params["num"] = str(num)
+        for stale in ("page", "start"):
+            inner_params.pop(stale, None)
+        params["url"] = urlencode(inner_params)
+        return urlunsplit(
+            (split.scheme, split.netloc, split.path, urlencode(params), split.fragment)
+        )
+
+    async def _search_via_warm_session(
+        self, query: str, max_results: int, count_only: bool, full_recall: bool
+    ) -> Optional[Tuple[List[Path], Optional[int], List[PatentSummary]]]:
+        """직전 쿼리의 XHR 요청/쿠키를 재사용해 브라우저 없이 검색한다.
+
+        세션이 만료(403/429 등)되었거나 응답을 해석할 수 없으면 warm 세션을
+        폐기하고 None을 반환하여 Playwright 경로로 넘긴다.
+        """
+
+        warm = self._warm_session
+        if warm is None:
+            return None
+
+        effective_query = self._normalize_query_string(query)
+        captured = replace(
+            warm,
+            url=self._xhr_url_for_query(warm.url, effective_query, min(max_results, 100)),
+        )
+        client = self._get_client(self._shared_cookies, captured)
+        try:
+            resp = await client.get(
+                captured.url, headers=self._replay_headers(captured), timeout=10.0
+            )
+        except Exception as exc:
+            logger.info(f"Warm XHR request failed ({exc}); using browser")
+            return None
+
+        if resp.status_code >= 400 or not resp.text:
+            logger.info(f"Warm XHR -> {resp.status_code}; re-capturing with browser")
+            if resp.status_code in (401, 403, 429):
+                self._warm_session = None
+            return None
+
+        results, total_count = self._parse_results_from_xhr(resp.text)
+        if not results and total_count is None:
+            # JSON이 아닌 응답(동의/차단 페이지 등) → 세션 재캡처 필요
+            self._warm_session = None
+            return None
+
+        logger.info(f"Warm XHR results: {len(results)} (total={total_count})")
+        if not results:
+            logger.warning("검색 결과를 찾지 못했습니다.")
+            return [], total_count, []
+        if len(results) < max_results and total_count and total_count > len(results):
+            # 추가 페이지가 필요하면 기존 브라우저 경로의 페이징 로직을 사용
+            return None
+
+        return await self._finish_query(
+            client,
+            captured,
+            query,
+            results,
+            total_count,
+            max_results,
+            count_only,
+            full_recall,
+        )
+
+    def _query_cache_path(self, query: str, max_results: int, full_recall: bool) -> Path:
+        """정규화된 쿼리와 수집 범위로 결정되는 캐시 파일 경로."""
+
+        target = getattr(self, "_target_patent", None) or ""
+        key_src = "|".join(
+            (
+                self._normalize_query_string(query),
+                str(max_results),
+                "full" if full_recall else "top",
+                # full recall은 타겟 발견 시 조기 종료하므로 타겟별로 결과가 다르다
+                target if full_recall else "",
+            )
+        )
+        key = hashlib.sha256(key_src.encode("utf-8")).hexdigest()
+        return self._cache_dir / key[:2] / f"{key}.json"
+
+    async def _load_cached_outcome(
+        self, path: Path
+    ) -> Optional[Tuple[Optional[int], List[PatentSummary]]]:
+        """유효기간 안의 캐시가 있으면 (total_count, results)를 반환한다."""
+
+        def load() -> Optional[Tuple[Optional[int], List[PatentSummary]]]:
+            try:
+                if time.time() - path.stat().st_mtime >= (self.cache_ttl or 0):
+                    return None
+                data = _json_loads(path.read_text(encoding="utf-8"))
+                results = [PatentSummary(**item) for item in data["results"]]
+                return data.get("total_count"), results
+            except Exception:
+                return None
+
+        return await asyncio.to_thread(load)
+
+    async def _store_cached_outcome(
+        self, path: Path, total_count: Optional[int], results: List[PatentSummary]
+    ) -> None:
+        """count_only 검색 결과를 캐시에 기록한다 (실패해도 검색 결과에는 영향 없음)."""
+
+        payload = _json_dumps_pretty(
+            {"total_count": total_count, "results": [asdict(r) for r in results]}
+        )
+
+        def store() -> None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(payload)
+
+        try:
+            await asyncio.to_thread(store)
+        except Exception as exc:
+            logger.warning(f"Failed to write query cache: {exc}")
+
+    async def _finish_query(
+        self,
+        client: httpx.AsyncClient,
+        captured: Optional[CapturedRequest],
+        query: str,
+        results: List[PatentSummary],
+        total_count: Optional[int],
+        max_results: int,
+        count_only: bool,
+        full_recall: bool,
+    ) -> Tuple[List[Path], Optional[int], List[PatentSummary]]:
+        """파싱된 결과로 count_only/full_recall 처리 또는 PDF 다운로드를 마무리한다."""
+
+        if not results:
+            logger.warning("검색 결과를 찾지 못했습니다.")
+            return [], total_count, []
+
+        # PDF를 받을 때만 패밀리 특허 등 제목이 거의 같은 결과를 하나로 줄인다
+        # (count_only 결과는 Recall 계산에 쓰이므로 그대로 둔다)
+        if not count_only and self.dedup_threshold is not None:
+            deduped = _dedup_near_titles(results, self.dedup_threshold)
+            if len(deduped) < len(results):
+                logger.info(f"Skipped {len(results) - len(deduped)} near-duplicate titles")
+            results = deduped
+
+        results = results[:max_results]
+        logger.info(f"Parsed {len(results)} results")
+
+        # count_only 모드에서는 PDF 다운로드 건너뛰고 특허 정보만 반환
+        if count_only:
+            # full_recall 모드에서는 가능한 모든 결과 수집
+            if full_recall and captured and total_count and total_count > len(results):
+                logger.info(f"Full recall mode: fetching all {total_count} results...")
+                # target_patent을 인자로 전달하여 early termination 활용
+                target_patent = getattr(self, '_target_patent', None)
+                results = await self._fetch_all_results(
+                    client,
+                    captured,
+                    total_count,
+                    self._replay_headers(captured),
+                    target_patent,
+                )
+            if self.cache_ttl:
+                await self._store_cached_outcome(
+                    self._query_cache_path(query, max_results, full_recall),
+                    total_count,
+                    results,
+                )
+            return [], total_count, results
+
+        # 상세 페이지/PDF는 결과별로 독립적이므로 제한된 동시성으로 병렬 처리
+        sem = asyncio.Semaphore(self.pdf_concurrency)
+        outcomes = await asyncio.gather(
+            *(
+                self._process_one(client, sem, idx, len(results), item)
+                for idx, item in enumerate(results, 1)
+            )
+        )
+
+        # 동시에 끝난 쿼리들이 각자 기록하지 않도록 쿼리 단위로 한 번만 저장
+        await self._save_pdf_index()
+
+        # 원래 결과 순서대로 정리
+        saved: List[Path] = []
+        saved_meta: List[Dict[str, Any]] = []
+        for outcome in outcomes:
+            if outcome is not None:
+                saved.append(outcome[0])
+                saved_meta.append(outcome[1])
+
+        # 쿼리 메타데이터 저장 (쿼리가 동시에 실행되므로 쿼리별 파일에 기록)
+        try:
+            stem = f"query_{self._slugify_for_path(query)}"
+            meta = {
+                "query": query,
+                "effective_query": self._normalize_query_string(query),
+                "timestamp": datetime.now().isoformat(),
+                "download_dir": str(self._resolved_download_dir),
+                "count": len(saved_meta),
+                "items": saved_meta,
+            }
+            await _write_json_async(self.download_dir / f"{stem}.json", meta)
+            await _write_text_async(self.download_dir / f"{stem}.txt", query)
+        except Exception:
+            pass
+
+        return saved, total_count, results
+
     async def search_and_download(
         self, query: str, max_results: int, count_only: bool = False, full_recall: bool = False
     ) -> Tuple[List[Path], Optional[int], List[PatentSummary]]:
         """단일 쿼리로 검색하고 상위 N개의 PDF를 다운로드한다.
 
-        매 쿼리마다 새로운 브라우저/컨텍스트를 생성하여 보안 토큰을 재캡처한다.
+        직전 쿼리에서 캡처한 XHR 세션이 유효하면 httpx만으로 검색하고, 없거나
+        만료되면 공유 브라우저 위에 새 컨텍스트를 생성하여 보안 토큰을 재캡처한다.
+        `async with` 밖에서 호출되면 이 쿼리 동안만 브라우저를 띄운다.
         """
 
+        # 같은 count_only 검색을 최근에 수행했다면 브라우저/네트워크 없이 캐시 사용
+        if count_only and self.cache_ttl:
+            cached = await self._load_cached_outcome(
+                self._query_cache_path(query, max_results, full_recall)
+            )
+            if cached is not None:
+                logger.info(f"Cached results: {len(cached[1])} (total={cached[0]})")
+                return [], cached[0], cached[1]
+
+        if self._browser is None:
+            async with self:
+                return await self.search_and_download(
+                    query, max_results, count_only, full_recall
+                )
+
+        if self.xhr_first and not self.diagnostics:
+            # 아직 warm 세션이 없으면 첫 쿼리 하나만 브라우저로 세션을 확보하고,
+            # 동시에 들어온 나머지 쿼리는 세션이 캡처되는 즉시(부트스트랩 쿼리의
+            # 페이징/다운로드 완료를 기다리지 않고) httpx로 처리한다
+            while self._warm_session is None and not self._bootstrap_failed:
+                event = self._bootstrap_event
+                if event is not None and not event.is_set():
+                    await event.wait()
+                    continue
+                event = self._bootstrap_event = asyncio.Event()
+                try:
+                    outcome = await self._search_with_browser(
+                        query, max_results, count_only, full_recall
+                    )
+                    if self._warm_session is None:
+                        # XHR 세션을 얻지 못하면 이후 쿼리는 각자 브라우저 경로로 진행
+                        self._bootstrap_failed = True
+                    return outcome
+                finally:
+                    # 실패(예외)한 경우 대기 중인 쿼리 하나가 부트스트랩을 이어받음
+                    if self._bootstrap_event is event:
+                        self._bootstrap_event = None
+                    event.set()
+
+            # 직전 쿼리의 세션이 살아 있으면 브라우저 없이 httpx로 바로 검색
+            if self._warm_session is not None:
+                warm_outcome = await self._search_via_warm_session(
+                    query, max_results, count_only, full_recall
+                )
+                if warm_outcome is not None:
+                    return warm_outcome
+
+        return await self._search_with_browser(query, max_results, count_only, full_recall)
+
+    async def _search_with_browser(
+        self, query: str, max_results: int, count_only: bool, full_recall: bool
+    ) -> Tuple[List[Path], Optional[int], List[PatentSummary]]:
+        """공유 브라우저에 새 컨텍스트를 열어 XHR을 캡처하고 검색/다운로드한다."""
+
+        assert self._browser is not None
+
         # 쿼리 별 진단 폴더
         diag_dir: Optional[Path] = None
         if self.diagnostics:
             qslug = self._slugify_for_path(query)
             diag_dir = self.diagnostics_dir / qslug
-
-        async with async_playwright() as p:  # 쿼리마다 새로운 Playwright 세션
-            browser = await p.chromium.launch(headless=self.headless)
-            context = await browser.new_context()
-            page = await context.new_page()
-            page.set_default_timeout(self.timeout * 1000)
-            # per-query log 파일 추가 (동일 폴더 내)
-            log_sink_id: Optional[int] = None
+            # 쿼리 진단 파일(캡처/재현 응답)이 모두 이 폴더에 기록되므로 한 번만 생성
+            await asyncio.to_thread(diag_dir.mkdir, parents=True, exist_ok=True)
+
+        # 쿼리마다 새로운 컨텍스트 (브라우저는 공유)
+        context = await self._browser.new_context()
+        # 라우트는 쿼리별 컨텍스트에 걸어 컨텍스트 종료와 함께 정리되게 한다
+        await context.route("**/*", _block_heavy_resources)
+        # 이전 쿼리에서 받은 쿠키를 심어 두면 동의 배너/세션 쿠키 발급을 건너뛴다
+        if self._shared_cookies:
             try:
-                log_path = (self.download_dir / "run.log").resolve()
-                # 존재할 경우 이어쓰기
-                log_sink_id = logger.add(str(log_path), level="INFO")
+                await context.add_cookies(self._shared_cookies)
             except Exception:
-                log_sink_id = None
+                pass
+        page = await context.new_page()
+        page.set_default_timeout(self.timeout * 1000)
 
-            try:
-                captured, page_html, xhr_text = await self._capture_xhr_request(
-                    page, query, diag_dir=diag_dir
+        try:
+            captured, page_html, xhr_parsed = await self._capture_xhr_request(
+                page, query, diag_dir=diag_dir
+            )
+
+            # httpx 클라이언트 구성 (쿠키는 다음 쿼리 컨텍스트에도 재사용)
+            cookies_list = await context.cookies()
+            self._shared_cookies = cookies_list
+            client = self._get_client(cookies_list, captured)
+
+            # XHR 우선 시도: 먼저 브라우저에서 받은 원문 XHR 응답으로 파싱
+            results: List[PatentSummary] = []
+            total_count: Optional[int] = None
+            if xhr_parsed is not None:
+                results, total_count = xhr_parsed
+                logger.info(f"Initial XHR results: {len(results)}")
+                if total_count is not None:
+                    logger.info(f"Total search results available: {total_count}")
+
+            # XHR이 0건을 확정했으면 재현/HTML/DOM 폴백과 추가 페이징은 의미가 없다
+            no_hits = total_count == 0
+
+            # 필요 시 캡처된 요청으로 httpx 재현
+            if not results and not no_hits and captured and "/xhr/query" in captured.url:
+                logger.info("Replaying captured XHR query via httpx ...")
+                try:
+                    replay_headers = self._replay_headers(captured)
+
+                    resp = await client.get(captured.url, headers=replay_headers, timeout=10.0)
+                    if self.diagnostics and diag_dir is not None:
+                        await _write_text_async(
+                            diag_dir / "xhr_query_response.html", resp.text
+                        )
+                        await _write_json_async(
+                            diag_dir / "captured_request.json",
+                            {
+                                "url": captured.url,
+                                "headers": captured.headers,
+                                "referer": captured.referer,
+                            },
+                        )
+
+                    if resp.status_code < 400 and resp.text:
+                        results, total_count = self._parse_results_from_xhr(resp.text)
+                        logger.info(f"Replayed XHR results: {len(results)}")
+                        if total_count is not None:
+                            logger.info(f"Total search results available: {total_count}")
+                    else:
+                        logger.warning(
+                            f"XHR {resp.status_code}; falling back to page HTML parse"
+                        )
+                except Exception as exc:
+                    logger.warning(f"XHR replay failed: {exc}")
+
+            # XHR로 결과를 얻었다면 이 요청/쿠키를 다음 쿼리의 warm 세션으로 보관
+            if (results or no_hits) and captured and "/xhr/query" in captured.url:
+                self._warm_session = captured
+                # 부트스트랩을 기다리는 쿼리는 여기서 바로 warm 세션으로 진행
+                if self._bootstrap_event is not None:
+                    self._bootstrap_event.set()
+
+            # 폴백: Playwright로 확보한 페이지 전체 HTML 파싱
+            if not results and not no_hits:
+                results = self._parse_results_from_html(page_html)
+
+            # 최종 폴백: DOM 직접 파싱
+            # (검색 URL 직접 이동은 _capture_xhr_request에서 이미 수행했으므로
+            #  현재 페이지를 그대로 사용한다)
+            if not results and not no_hits:
+                try:
+                    results = await self._parse_results_from_dom(page)
+                except Exception:
+                    results = []
+
+            # 추가 페이징/스크롤: 더 많은 결과가 필요하면 XHR 재요청, 스크롤 로드 또는 다음 페이지를 따라가며 수집
+            if len(results) < max_results and not no_hits:
+                # detail_url 기준 중복 제거 (dict는 삽입 순서 유지)
+                results_map: Dict[str, PatentSummary] = {}
+                for r in results:
+                    results_map.setdefault(r.detail_url, r)
+
+                # Recall 분석(count_only)에서는 원본 특허를 찾는 즉시 추가 페이징을 멈춘다
+                target = getattr(self, "_target_patent", None) if count_only else None
+                normalized_target = (
+                    target.upper().translate(_PUB_NUMBER_DELETE) if target else None
                 )
 
-                # httpx 클라이언트 구성
-                client = await self._build_client_with_cookies(context, captured)
+                def is_target(m: PatentSummary) -> bool:
+                    return bool(
+                        normalized_target
+                        and m.publication_number
+                        and m.publication_number.upper().translate(_PUB_NUMBER_DELETE)
+                        == normalized_target
+                    )
 
-                # XHR 우선 시도: 먼저 브라우저에서 받은 원문 XHR 응답으로 파싱
-                results: List[PatentSummary] = []
-                total_count: Optional[int] = None
-                if xhr_text:
-                    results, total_count = self._parse_results_from_xhr(xhr_text)
-                    logger.info(f"Initial XHR results: {len(results)}")
-                    if total_count is not None:
-                        logger.info(f"Total search results available: {total_count}")
-
-                # 필요 시 캡처된 요청으로 httpx 재현
-                if not results and captured and "/xhr/query" in captured.url:
-                    logger.info("Replaying captured XHR query via httpx ...")
+                target_found = any(is_target(r) for r in results_map.values())
+
+                def collected_enough() -> bool:
+                    return target_found or len(results_map) >= max_results
+
+                def merge(items: List[PatentSummary]) -> int:
+                    """새 detail_url만 results_map에 추가하고 추가된 개수를 반환한다."""
+                    nonlocal target_found
+                    added = 0
+                    for m in items:
+                        if len(results_map) >= max_results:
+                            break
+                        if m.detail_url and m.detail_url not in results_map:
+                            results_map[m.detail_url] = m
+                            added += 1
+                            if is_target(m):
+                                target_found = True
+                                logger.info(f"🎯 Target patent {target} found while paging! Early termination.")
+                    return added
+
+                # 0) XHR 기반 파라미터 페이지네이션(가능한 경우): page/start/num 조합 시도
+                if not collected_enough() and captured and "/xhr/query" in captured.url:
                     try:
-                        # 캡처된 헤더 중 httpx로 전달해도 안전한 헤더만 선별 전달
-                        banned = {
-                            "cookie",
-                            "host",
-                            "authority",
-                            "method",
-                            "path",
-                            "scheme",
-                            "content-length",
-                            "origin",
-                        }
+                        from urllib.parse import (
+                            urlsplit,
+                            urlunsplit,
+                            parse_qsl,
+                            urlencode,
+                            unquote,
+                        )
+
+                        split = urlsplit(captured.url)
+                        params = dict(parse_qsl(split.query, keep_blank_values=True))
+
+                        # 캡처된 쿼리는 상위 파라미터 url= 안에 실제 질의 파라미터가 존재함
+                        # 예: /xhr/query?url=q=...&oq=...
+                        inner_raw = params.get("url", "")
+                        inner_qs = unquote(inner_raw)
+                        inner_params = dict(parse_qsl(inner_qs, keep_blank_values=True))
+                        # 한 페이지당 최대한 많이 가져오도록 시도
+                        inner_params.setdefault("num", "100")
+
+                        # 페이지마다 바뀌는 것은 url= 안쪽 파라미터뿐이므로 나머지는 미리 조립
+                        # (원래 파라미터 순서 유지: url= 앞/뒤 부분을 각각 인코딩해 둠)
+                        keys = list(params)
+                        url_pos = keys.index("url") if "url" in params else len(keys)
+                        outer_head = urlencode({k: params[k] for k in keys[:url_pos]})
+                        outer_tail = urlencode({k: params[k] for k in keys[url_pos + 1 :]})
+                        url_prefix = (
+                            urlunsplit((split.scheme, split.netloc, split.path, "", ""))
+                            + "?"
+                            + (outer_head + "&" if outer_head else "")
+                        )
+                        url_suffix = ("&" + outer_tail if outer_tail else "") + (
+                            "#" + split.fragment if split.fragment else ""
+                        )
+
+                        def build_url(updated_inner: dict[str, str]) -> str:
+                            return url_prefix + urlencode({"url": urlencode(updated_inner)}) + url_suffix
+
+                        # 공통 재생 헤더(최소 요구)
                         replay_headers = {
-                            k.title(): v
-                            for k, v in captured.headers.items()
-                            if k.lower() not in banned
+                            "X-Same-Domain": "1",
+                            "Referer": captured.referer or GOOGLE_PATENTS_ORIGIN + "/",
                         }
-                        # 최소 요구 헤더 보강
-                        replay_headers.setdefault("X-Same-Domain", "1")
-                        replay_headers.setdefault("Referer", captured.referer or GOOGLE_PATENTS_ORIGIN + "/")
-
-                        resp = await client.get(captured.url, headers=replay_headers, timeout=10.0)
-                        if self.diagnostics and diag_dir is not None:
-                            (diag_dir / "xhr_query_response.html").write_text(
-                                resp.text, encoding="utf-8"
-                            )
-                            (diag_dir / "captured_request.json").write_text(
-                                json.dumps(
-                                    {
-                                        "url": captured.url,
-                                        "headers": captured.headers,
-                                        "referer": captured.referer,
-                                    },
-                                    indent=2,
-                                    ensure_ascii=False,
-                                ),
-                                encoding="utf-8",
-                            )
 
-                        if resp.status_code < 400 and resp.text:
-                            results, total_count = self._parse_results_from_xhr(resp.text)
-                            logger.info(f"Replayed XHR results: {len(results)}")
-                            if total_count is not None:
-                                logger.info(f"Total search results available: {total_count}")
-                        else:
-                            logger.warning(
-                                f"XHR {resp.status_code}; falling back to page HTML parse"
-                            )
-                    except Exception as exc:
-                        logger.warning(f"XHR replay failed: {exc}")
-
-                # 폴백: Playwright로 확보한 페이지 전체 HTML 파싱
-                if not results:
-                    results = self._parse_results_from_html(page_html)
-
-                # 추가 폴백: 검색 URL로 직접 이동하여 다시 파싱
-                if not results:
-                    from urllib.parse import quote_plus
-                    effective_query = self._normalize_query_string(query)
-                    search_url = GOOGLE_PATENTS_ORIGIN + "/?q=" + quote_plus(effective_query) + "&hl=en&num=100"
-                    try:
-                        await page.goto(search_url)
-                        await page.wait_for_load_state("domcontentloaded")
+                        async def paced_get(variant: Dict[str, str]) -> httpx.Response:
+                            # 비정상 응답에 대한 폴백 경로이므로 요청 시작 간격은 공유 페이서를 따른다
+                            await self._pacer.wait()
+                            return await client.get(build_url(variant), headers=replay_headers, timeout=10.0)
+
+                        # 우선 현재 파라미터로 한 번 더 최대 개수 요청 시도
                         try:
-                            await page.wait_for_load_state("networkidle", timeout=1500)
+                            inner_params["num"] = str(min(max_results, 100))
+                            resp0 = await paced_get(inner_params)
+                            if resp0.status_code < 400 and resp0.text:
+                                more0, _ = self._parse_results_from_xhr(resp0.text)
+                                merge(more0)
                         except Exception:
                             pass
-                        await page.wait_for_timeout(250)
-                        html2 = await page.content()
-                        results = self._parse_results_from_html(html2)
-                    except Exception:
-                        pass
-
-                # 최종 폴백: DOM 직접 파싱
-                if not results:
-                    try:
-                        results = await self._parse_results_from_dom(page)
-                    except Exception:
-                        results = []
-
-                # 추가 페이징/스크롤: 더 많은 결과가 필요하면 XHR 재요청, 스크롤 로드 또는 다음 페이지를 따라가며 수집
-                if len(results) < max_results:
-                    seen: set[str] = {r.detail_url for r in results}
 
-                    # 0) XHR 기반 파라미터 페이지네이션(가능한 경우): page/start/num 조합 시도
-                    if captured and "/xhr/query" in captured.url:
-                        try:
-                            from urllib.parse import (
-                                urlsplit,
-                                urlunsplit,
-                                parse_qsl,
-                                urlencode,
-                                unquote,
+                        async def fetch_window(variants: List[Dict[str, str]]) -> bool:
+                            """파라미터 묶음을 간격을 두고 요청해 순서대로 병합하고, 다음 묶음을 계속 요청할지 반환한다."""
+                            resps = await asyncio.gather(
+                                *(paced_get(v) for v in variants),
+                                return_exceptions=True,
                             )
+                            for resp in resps:
+                                if isinstance(resp, BaseException) or resp.status_code >= 400 or not resp.text:
+                                    return False
+                                add_items, _ = self._parse_results_from_xhr(resp.text)
+                                if merge(add_items) == 0:
+                                    # 동일 결과만 반복되면 중단
+                                    return False
+                                if collected_enough():
+                                    return False
+                            return True
+
+                        page_num = str(min(max_results, 100))
+
+                        # page=2..N 시도 (PAGINATION_WINDOW개씩, 요청 간격은 페이서가 조절)
+                        page_try_max = 10
+                        for base in range(2, page_try_max + 1, PAGINATION_WINDOW):
+                            if collected_enough():
+                                break
+                            variants = [
+                                {**inner_params, "page": str(page_no), "num": page_num}
+                                for page_no in range(base, min(base + PAGINATION_WINDOW, page_try_max + 1))
+                            ]
+                            if not await fetch_window(variants):
+                                break
 
-                            split = urlsplit(captured.url)
-                            params = dict(parse_qsl(split.query, keep_blank_values=True))
-
-                            # 캡처된 쿼리는 상위 파라미터 url= 안에 실제 질의 파라미터가 존재함
-                            # 예: /xhr/query?url=q=...&oq=...
-                            inner_raw = params.get("url", "")
-                            inner_qs = unquote(inner_raw)
-                            inner_params = dict(parse_qsl(inner_qs, keep_blank_values=True))
-                            # 한 페이지당 최대한 많이 가져오도록 시도
-                            inner_params.setdefault("num", "100")
-
-                            def build_url(updated_inner: dict[str, str]) -> str:
-                                outer = dict(params)
-                                outer["url"] = urlencode(updated_inner)
-                                return urlunsplit(
-                                    (
-                                        split.scheme,
-                                        split.netloc,
-                                        split.path,
-                                        urlencode(outer),
-                                        split.fragment,
-                                    )
-                                )
-
-                            # 공통 재생 헤더(최소 요구)
-                            replay_headers = {
-                                "X-Same-Domain": "1",
-                                "Referer": captured.referer or GOOGLE_PATENTS_ORIGIN + "/",
-                            }
-
-                            # 우선 현재 파라미터로 한 번 더 최대 개수 요청 시도
-                            try:
-                                inner_params["num"] = str(min(max_results, 100))
-                                resp0 = await client.get(build_url(inner_params), headers=replay_headers, timeout=10.0)
-                                if resp0.status_code < 400 and resp0.text:
-                                    more0, _ = self._parse_results_from_xhr(resp0.text)
-                                    for m in more0:
-                                        if m.detail_url and m.detail_url not in seen:
-                                            results.append(m)
-                                            seen.add(m.detail_url)
-                                            if len(results) >= max_results:
-                                                break
-                            except Exception:
-                                pass
-
-                            # page=2..N 시도
-                            page_try_max = 10
-                            if len(results) < max_results:
-                                for page_no in range(2, page_try_max + 1):
-                                    params_page = dict(inner_params)
-                                    params_page["page"] = str(page_no)
-                                    try:
-                                        params_page["num"] = str(min(max_results, 100))
-                                        resp = await client.get(build_url(params_page), headers=replay_headers, timeout=10.0)
-                                        if resp.status_code >= 400 or not resp.text:
-                                            break
-                                        add_items, _ = self._parse_results_from_xhr(resp.text)
-                                        new_added = 0
-                                        for m in add_items:
-                                            if m.detail_url and m.detail_url not in seen:
-                                                results.append(m)
-                                                seen.add(m.detail_url)
-                                                new_added += 1
-                                                if len(results) >= max_results:
-                                                    break
-                                        if new_added == 0:
-                                            # 동일 결과만 반복되면 중단
-                                            break
-                                    except Exception:
-                                        break
-                                    if len(results) >= max_results:
-                                        break
-
-                            # start=offset 시도(10 단위)
-                            if len(results) < max_results:
-                                for start_offset in range(10, 1000, 10):
-                                    params_start = dict(inner_params)
-                                    params_start["start"] = str(start_offset)
-                                    try:
-                                        params_start["num"] = str(min(max_results, 100))
-                                        resp = await client.get(build_url(params_start), headers=replay_headers, timeout=10.0)
-                                        if resp.status_code >= 400 or not resp.text:
-                                            break
-                                        add_items, _ = self._parse_results_from_xhr(resp.text)
-                                        new_added = 0
-                                        for m in add_items:
-                                            if m.detail_url and m.detail_url not in seen:
-                                                results.append(m)
-                                                seen.add(m.detail_url)
-                                                new_added += 1
-                                                if len(results) >= max_results:
-                                                    break
-                                        if new_added == 0:
-                                            break
-                                    except Exception:
-                                        break
-                                    if len(results) >= max_results:
-                                        break
-                        except Exception:
-                            pass
+                        # start=offset 시도(10 단위, PAGINATION_WINDOW개씩, 요청 간격은 페이서가 조절)
+                        offsets = list(range(10, 1000, 10))
+                        for i in range(0, len(offsets), PAGINATION_WINDOW):
+                            if collected_enough():
+                                break
+                            variants = [
+                                {**inner_params, "start": str(start_offset), "num": page_num}
+                                for start_offset in offsets[i : i + PAGINATION_WINDOW]
+                            ]
+                            if not await fetch_window(variants):
+                                break
+                    except Exception:
+                        pass
 
-                    async def collect_from_current_page() -> int:
-                        """현재 페이지에서 결과를 파싱해 results에 병합하고 새로 추가된 개수를 반환한다."""
-                        added = 0
+                async def collect_from_current_page() -> int:
+                    """현재 페이지에서 결과를 파싱해 results_map에 병합하고 새로 추가된 개수를 반환한다."""
+                    # 페이지 안에서 결과 필드만 추출해 받는다. 전체 HTML 직렬화/재파싱은
+                    # DOM 추출이 비었을 때만 수행
+                    more = await self._snapshot_dom_results(page)
+                    if not more:
                         try:
                             html_now = await page.content()
                         except Exception:
                             html_now = ""
                         more = self._parse_results_from_html(html_now)
-                        if not more:
-                            try:
-                                more = await self._parse_results_from_dom(page)
-                            except Exception:
-                                more = []
-                        for item in more:
-                            if item.detail_url and item.detail_url not in seen:
-                                results.append(item)
-                                seen.add(item.detail_url)
-                                added += 1
-                                if len(results) >= max_results:
-                                    break
-                        return added
+                    return merge(more)
+
+                # 1) 무한 스크롤 형태 지원: 스크롤을 내려 더 많은 article을 로드
+                try:
+                    while not collected_enough():
+                        prev_len = len(results_map)
+                        before = await self._results_signature(page)
+                        try:
+                            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                        except Exception:
+                            break
+                        # 고정 sleep 대신 새 결과가 DOM에 붙는 순간까지만 대기
+                        await self._wait_for_results_change(page, before, 2000)
+                        added = await collect_from_current_page()
+                        if added == 0 and len(results_map) == prev_len:
+                            break
+                except Exception:
+                    pass
 
-                    # 1) 무한 스크롤 형태 지원: 스크롤을 내려 더 많은 article을 로드
+                # 2) 다음 페이지 링크 탐색: 다양한 셀렉터 시도
+                while not collected_enough():
                     try:
-                        while len(results) < max_results:
-                            prev_len = len(results)
+                        # 속성 기반 후보는 존재 여부와 href를 한 번의 evaluate로 조회하고,
+                        # 없을 때만 텍스트 기반 후보를 locator로 조회
+                        attr_sel, text_sel = NEXT_PAGE_SELECTORS
+                        try:
+                            href = await page.evaluate(_NEXT_LINK_JS, attr_sel)
+                        except Exception:
+                            href = None
+                        if href is not None:
+                            next_locator = page.locator(attr_sel).first
+                        else:
+                            next_locator = page.locator(text_sel).first
                             try:
-                                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                                if not await next_locator.count():
+                                    break
                             except Exception:
                                 break
+                            href = await next_locator.get_attribute("href")
+
+                        prefetched: List[PatentSummary] = []
+                        if not href:
+                            # 링크가 버튼 형태인 경우 클릭 시도 (같은 페이지에서 결과 목록이 교체됨)
+                            before = await self._results_signature(page)
                             try:
-                                await page.wait_for_load_state("networkidle", timeout=1500)
+                                await next_locator.click()
                             except Exception:
-                                pass
-                            await page.wait_for_timeout(250)
-                            added = await collect_from_current_page()
-                            if added == 0 and len(results) == prev_len:
                                 break
-                    except Exception:
-                        pass
-
-                    # 2) 다음 페이지 링크 탐색: 다양한 셀렉터 시도
-                    next_selectors = [
-                        "a[rel='next' i]",
-                        "a[aria-label='Next' i]",
-                        "a[aria-label*='Next' i]",
-                        "a:has-text('Next')",
-                        "a:has-text('다음')",
-                        "button:has-text('Next')",
-                        "[role='link']:has-text('Next')",
-                        "a#pnnext",
-                        "a:has-text('›')",
-                        "a[aria-label*='›']",
-                    ]
-
-                    while len(results) < max_results:
-                        try:
-                            next_locator = None
-                            # 셀렉터 후보를 순서대로 검사
-                            for sel in next_selectors:
-                                loc = page.locator(sel).first
-                                try:
-                                    if await loc.count():
-                                        next_locator = loc
-                                        break
-                                except Exception:
-                                    continue
-                            if next_locator is None or not await next_locator.count():
-                                break
-
-                            href = await next_locator.get_attribute("href")
-                            if not href:
-                                # 링크가 버튼 형태인 경우 클릭 시도
-                                try:
-                                    await next_locator.click()
-                                except Exception:
-                                    break
-                                try:
-                                    await page.wait_for_load_state("networkidle", timeout=1500)
-                                except Exception:
-                                    pass
-                                await page.wait_for_timeout(250)
-                            else:
-                                next_url = href if href.startswith("http") else GOOGLE_PATENTS_ORIGIN + href
+                            await self._wait_for_results_change(page, before, 3000)
+                        else:
+                            next_url = href if href.startswith("http") else GOOGLE_PATENTS_ORIGIN + href
+                            # 브라우저 이동과 동시에 같은 URL을 httpx로 받아 둔다. 이동이 끝났을 때
+                            # 정적 HTML에 결과가 있으면 article 대기/DOM 추출을 생략한다
+                            # (다음 링크 탐색에는 브라우저 페이지가 필요하므로 이동은 그대로 수행)
+                            async def paced_prefetch(url: str) -> httpx.Response:
+                                # 추가 요청이므로 다른 폴백 요청과 같이 공유 페이서 간격을 따른다
+                                await self._pacer.wait()
+                                return await client.get(url, timeout=10.0)
+
+                            prefetch = asyncio.create_task(paced_prefetch(next_url))
+                            try:
                                 await page.goto(next_url)
+                            finally:
+                                if not prefetch.done():
+                                    prefetch.cancel()
+                                await asyncio.gather(prefetch, return_exceptions=True)
+                            if _task_succeeded(prefetch) and prefetch.result().status_code < 400:
+                                prefetched = self._parse_results_from_html(prefetch.result().text)
+                            if not prefetched:
                                 try:
-                                    await page.wait_for_load_state("networkidle", timeout=1500)
-                                except Exception:
-                                    pass
-                                await page.wait_for_timeout(250)
-
-                            added = await collect_from_current_page()
-                            if added == 0:
-                                # 스크롤 보조 시도 후 종료
-                                try:
-                                    await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                                    await page.wait_for_selector("article", timeout=3000)
                                 except Exception:
                                     pass
-                                await page.wait_for_timeout(200)
-                                added2 = await collect_from_current_page()
-                                if added2 == 0:
-                                    break
-                        except Exception:
-                            break
-
-                if not results:
-                    logger.warning("검색 결과를 찾지 못했습니다.")
-                    return [], total_count, []
-
-                results = results[:max_results]
-                logger.info(f"Parsed {len(results)} results")
-
-                # count_only 모드에서는 PDF 다운로드 건너뛰고 특허 정보만 반환
-                if count_only:
-                    # full_recall 모드에서는 가능한 모든 결과 수집
-                    if full_recall and total_count and total_count > len(results):
-                        logger.info(f"Full recall mode: fetching all {total_count} results...")
-                        # target_patent을 인자로 전달하여 early termination 활용
-                        target_patent = getattr(self, '_target_patent', None)
-                        results = await self._fetch_all_results(client, captured, total_count, replay_headers, target_patent)
-                    return [], total_count, results
-
-                saved: List[Path] = []
-                saved_meta: List[Dict[str, Any]] = []
-                for idx, item in enumerate(results, 1):
-                    await asyncio.sleep(self.delay)
-                    logger.info(
-                        f"[{idx}/{len(results)}] {item.publication_number} → detail"
-                    )
-
-                    pdf_url = await self._fetch_detail_and_pdf(client, item.detail_url)
-                    if not pdf_url:
-                        logger.warning("PDF URL을 찾지 못했습니다. 건너뜁니다.")
-                        continue
 
-                    base_name = item.publication_number or f"Patent_{idx}"
-                    base_name = self._sanitize_filename(base_name)
-                    out_path = self.download_dir / f"{base_name}.pdf"
-
-                    ok = await self._download_pdf(
-                        client, pdf_url, out_path, referer=item.detail_url
-                    )
-                    if ok:
-                        size = out_path.stat().st_size
-                        logger.info(f"✅ Saved {out_path.name} ({size:,} bytes)")
-                        saved.append(out_path)
-                        saved_meta.append({
-                            "publication_number": item.publication_number,
-                            "title": item.title,
-                            "detail_url": item.detail_url,
-                            "pdf_url": pdf_url,
-                            "saved_path": str(out_path.resolve()),
-                            "size_bytes": size,
-                        })
-                    else:
-                        logger.error(f"❌ Failed to save {out_path.name}")
-
-                # 쿼리 메타데이터 저장
-                try:
-                    meta = {
-                        "query": query,
-                        "effective_query": self._normalize_query_string(query),
-                        "timestamp": datetime.now().isoformat(),
-                        "download_dir": str(self.download_dir.resolve()),
-                        "count": len(saved_meta),
-                        "items": saved_meta,
-                    }
-                    (self.download_dir / "query.json").write_text(
-                        json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8"
-                    )
-                    (self.download_dir / "query.txt").write_text(query, encoding="utf-8")
-                except Exception:
-                    pass
-
-                return saved, total_count, results
-            finally:
-                # httpx 클라이언트 종료
-                try:
-                    if 'client' in locals():
-                        await client.aclose()
-                except Exception:
-                    pass
-                await context.close()
-                await browser.close()
-                # 로그 sink 제거
-                if log_sink_id is not None:
-                    try:
-                        logger.remove(log_sink_id)
+                        added = merge(prefetched) if prefetched else await collect_from_current_page()
+                        if added == 0:
+                            # 스크롤 보조 시도 후 종료
+                            before = await self._results_signature(page)
+                            try:
+                                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                            except Exception:
+                                pass
+                            await self._wait_for_results_change(page, before, 2000)
+                            added2 = await collect_from_current_page()
+                            if added2 == 0:
+                                break
                     except Exception:
-                        pass
+                        break
+
+                results = list(results_map.values())
+
+            return await self._finish_query(
+                client,
+                captured,
+                query,
+                results,
+                total_count,
+                max_results,
+                count_only,
+                full_recall,
+            )
+        finally:
+            # httpx 클라이언트는 공유하므로 컨텍스트만 닫는다
+            await context.close()
 
     async def search_and_download_many(
         self, queries: List[str], max_results: int, count_only: bool = False, full_recall: bool = False
     ) -> Dict[str, Tuple[List[Path], Optional[int], List[PatentSummary]]]:
-        """여러 쿼리를 순차 처리. 각 쿼리마다 보안 토큰을 재캡처한다."""
+        """여러 쿼리를 동시 처리. 각 쿼리마다 보안 토큰을 재캡처한다.
 
+        브라우저는 한 번만 기동해 모든 쿼리가 공유하고, 동시에 실행되는 쿼리 수는
+        `self.concurrency`로 제한한다(429 방지). 결과 dict는 입력 쿼리 순서를 유지한다.
+        """
+
+        if self._browser is None:
+            async with self:
+                return await self.search_and_download_many(
+                    queries, max_results, count_only, full_recall
+                )
+
+        # 같은 쿼리는 한 번만 실행 (결과 dict는 쿼리 문자열 키이므로 중복이 합쳐짐)
+        queries = list(dict.fromkeys(queries))
+        sem = asyncio.Semaphore(self.concurrency)
+
+        async def bounded(
+            i: int, q: str
+        ) -> Tuple[List[Path], Optional[int], List[PatentSummary]]:
+            async with sem:
+                logger.info(f"◇ Query {i}/{len(queries)}: {q}")
+                try:
+                    return await self.search_and_download(q, max_results, count_only, full_recall)
+                except Exception as exc:
+                    logger.error(f"Query failed: {q} ({exc})")
+                    return [], None, []
+                finally:
+                    # 슬롯을 바로 넘기지 않고 쿼리 간 지연을 유지
+                    if i < len(queries):
+                        await asyncio.sleep(max(self.delay, 0.5))
+
+        outcomes = await asyncio.gather(
+            *(bounded(i, q) for i, q in enumerate(queries, 1))
+        )
         results: Dict[str, Tuple[List[Path], Optional[int], List[PatentSummary]]] = {}
-        for i, q in enumerate(queries, 1):
-            logger.info(f"◇ Query {i}/{len(queries)}: {q}")
-            try:
-                saved, total_count, patents = await self.search_and_download(q, max_results, count_only, full_recall)
-                results[q] = (saved, total_count, patents)
-            except Exception as exc:
-                logger.error(f"Query failed: {q} ({exc})")
-                results[q] = ([], None, [])
-            if i < len(queries):
-                await asyncio.sleep(max(self.delay, 0.5))
+        for q, outcome in zip(queries, outcomes):
+            results[q] = outcome
         return results
 
     @staticmethod
     def _slugify_for_path(text: str) -> str:
-        slug = re.sub(r"\s+", "_", text.strip())
-        slug = re.sub(r"[^A-Za-z0-9_\-]+", "", slug)
-        return slug[:50] or "query"
+        """쿼리별 파일/폴더 이름. 비ASCII 쿼리는 슬러그가 비거나 겹칠 수 있으므로
+        동시 실행 쿼리끼리 덮어쓰지 않도록 쿼리 해시 8자리를 붙인다."""
+        slug = _WS_RE.sub("_", text.strip())
+        slug = _SLUG_BAD.sub("", slug)
+        digest = hashlib.sha1(text.encode("utf-8")).hexdigest()[:8]
+        return f"{slug[:50].strip('_') or 'query'}_{digest}"
 
 
 def _build_cli_parser() -> Any:
@@ -1290,6 +2233,31 @@ def _build_cli_parser() -> Any:
         action="store_true",
         help="검색 결과 개수만 확인 (PDF 다운로드 건너뛰기)",
     )
+    parser.add_argument(
+        "--concurrency", type=int, default=3, help="동시에 처리할 최대 쿼리 수"
+    )
+    parser.add_argument(
+        "--pdf-concurrency",
+        type=int,
+        default=PDF_FETCH_CONCURRENCY,
+        help="쿼리당 동시에 받을 상세 페이지/PDF 수 (요청 시작 간격은 --delay로 제한)",
+    )
+    parser.add_argument(
+        "--dedup-threshold",
+        type=float,
+        default=None,
+        help="제목 유사도(0~1)가 이 값 이상인 결과는 PDF를 한 번만 받음 (미지정/1.0이면 비활성)",
+    )
+    parser.add_argument(
+        "--browser-only",
+        action="store_true",
+        help="warm XHR 세션을 재사용하지 않고 쿼리마다 브라우저로 검색",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="--count-only 결과를 <out>/.xhr_cache에 24시간 캐시",
+    )
     return parser
 
 
@@ -1306,23 +2274,47 @@ async def _amain(argv: List[str]) -> int:
         timeout=args.timeout,
         delay=args.delay,
         diagnostics=args.diagnostics,
+        concurrency=args.concurrency,
+        pdf_concurrency=args.pdf_concurrency,
+        dedup_threshold=args.dedup_threshold,
+        xhr_first=not args.browser_only,
+        cache_ttl=QUERY_CACHE_TTL if args.cache else None,
     )
 
     # 쿼리 수집
     queries: List[str] = []
-    if args.query:
-        queries.extend([q for q in args.query if q and q.strip()])
+    # 같은 검색어는 한 번만 실행 (입력 순서 유지)
+    seen: set[str] = set()
+
+    def add_query(raw: str) -> None:
+        q = raw.strip()
+        if q and q not in seen:
+            seen.add(q)
+            queries.append(q)
+
+    for q in args.query or []:
+        add_query(q or "")
     if args.query_file:
         qpath = Path(args.query_file).expanduser().resolve()
         if not qpath.exists():
             raise SystemExit(f"query-file not found: {qpath}")
-        for line in qpath.read_text(encoding="utf-8").splitlines():
-            if line.strip():
-                queries.append(line.strip())
+        with qpath.open(encoding="utf-8") as fh:
+            for line in fh:
+                add_query(line)
 
     if not queries:
         raise SystemExit("--query 또는 --query-file 중 하나는 필요합니다.")
 
+    async with downloader:
+        return await _run_queries(downloader, queries, args, out_dir)
+
+
+async def _run_queries(
+    downloader: GooglePatentsXHRDownloader,
+    queries: List[str],
+    args: Any,
+    out_dir: Path,
+) -> int:
     if len(queries) == 1:
         saved, total_count, patents = await downloader.search_and_download(
             query=queries[0], max_results=args.max_results, count_only=args.count_only
@@ -1355,7 +2347,19 @@ async def _amain(argv: List[str]) -> int:
     return 0
 
 
+def install_uvloop() -> bool:
+    """uvloop이 설치되어 있으면 기본 이벤트 루프로 사용한다 (Windows 제외)."""
+
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    uvloop.install()
+    return True
+
+
 def main() -> None:
+    install_uvloop()
     try:
         rc = asyncio.run(_amain(sys.argv[1:]))
         raise SystemExit(rc)
@@ -11,6 +11,15 @@ PDF 특허 입력부터 Seed Recall 분석까지 원클릭으로 실행하는 
   
   # 커스텀 설정으로 실행
   python patent_pipeline.py --pdf patent.pdf --prompt custom_prompt.txt --delay 2.0 --max-results 20
+  
+  # 다중 전략을 2개씩 동시에 실행
+  python patent_pipeline.py --pdf patent.pdf --multi-strategy technical_depth prior_art application_focus --strategy-concurrency 2 --output multi.json
+  
+  # 검색식을 5개씩 동시에 실행
+  python patent_pipeline.py --pdf patent.pdf --query-concurrency 5 --output full_analysis.json
+  
+  # 같은 PDF+프롬프트의 Gemini 응답 재사용 (검색 단계만 다시 볼 때; 성과 이력에 중복 기록됨)
+  python patent_pipeline.py --pdf patent.pdf --gemini-cache --output full_analysis.json
 
 워크플로우:
 1. PDF 분석 → Gemini API → 검색식 생성 (query_generator.py)
@@ -35,19 +44,38 @@ import argparse
 import asyncio
 import json
 import os
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from dotenv import load_dotenv
 from loguru import logger
 
+try:  # 선택 의존성: 있으면 결과 JSON 저장에 사용
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 # 기존 모듈들 임포트
-from query_generator import PatentQueryGenerator, load_prompt_template, extract_patent_number_from_filename
+from query_generator import (
+    GeminiPdfContext,
+    PatentQueryGenerator,
+    load_prompt_template,
+    extract_patent_number_from_filename,
+)
 from recall_analyzer import RecallAnalyzer
+from patent_downloader import install_uvloop
 from prompt_manager import PromptManager, create_default_prompt_manager
 
 
+@dataclass(frozen=True)
+class PipelineSettings:
+    """통합 결과 metadata.settings에 기록하는 실행 설정"""
+    max_results: int
+    delay: float
+    full_recall: bool
+
+
 class PatentAnalysisPipeline:
     """특허 분석 완전 자동화 파이프라인"""
     
@@ -59,7 +87,10 @@ class PatentAnalysisPipeline:
         delay: float = 1.5,
         full_recall: bool = False,
         save_intermediate: bool = True,
-        prompt_manager: Optional[PromptManager] = None
+        prompt_manager: Optional[PromptManager] = None,
+        strategy_concurrency: int = 3,
+        query_concurrency: int = 3,
+        gemini_cache_dir: Optional[Path] = None
     ):
         self.api_key = api_key
         self.download_dir = download_dir
@@ -67,17 +98,28 @@ class PatentAnalysisPipeline:
         self.delay = delay
         self.full_recall = full_recall
         self.save_intermediate = save_intermediate
+        # 결과마다 같은 settings dict를 새로 만들지 않도록 한 번만 변환해 공유
+        self._settings = PipelineSettings(max_results, delay, full_recall)
+        self._settings_dict = asdict(self._settings)
+        # --multi-strategy에서 동시에 실행할 전략 수
+        self.strategy_concurrency = max(1, strategy_concurrency)
+        # 다중 전략 실행 중 기록 대기 중인 프롬프트 성과 (strategy, patent_number, performance)
+        self._pending_performance: List[Tuple[str, str, Dict[str, Any]]] = []
         
         # 프롬프트 매니저 초기화
         self.prompt_manager = prompt_manager or create_default_prompt_manager()
         
         # 모듈들 초기화
-        self.query_generator = PatentQueryGenerator(api_key)
+        # Gemini 응답 캐시는 기본으로 끔: 반복 실행이 예전 검색식을 재사용하면
+        # 프롬프트 성과 이력에 같은 표본이 중복 기록된다
+        self.query_generator = PatentQueryGenerator(api_key, cache_dir=gemini_cache_dir)
         self.recall_analyzer = RecallAnalyzer(
             download_dir=download_dir,
             max_results=max_results,
             delay=delay,
-            full_recall=full_recall
+            full_recall=full_recall,
+            # 한 전략 안에서 동시에 실행할 검색식 수 (브라우저 하나를 공유)
+            concurrency=query_concurrency
         )
         
         logger.info(f"Pipeline initialized (full_recall={full_recall}, max_results={max_results})")
@@ -86,9 +128,15 @@ class PatentAnalysisPipeline:
         self,
         pdf_path: Path,
         prompt_template: str,
-        output_dir: Path = Path("./temp_results")
+        output_dir: Path = Path("./temp_results"),
+        pdf_context: Optional[GeminiPdfContext] = None,
+        queries_data: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """완전 자동화 파이프라인 실행"""
+        """완전 자동화 파이프라인 실행
+        
+        pdf_context가 주어지면 이미 업로드된 PDF/컨텍스트 캐시를 재사용한다.
+        queries_data가 주어지면(같은 프롬프트로 이미 생성한 검색식) STEP 1을 건너뛴다.
+        """
         logger.info(f"Starting complete patent analysis pipeline for: {pdf_path.name}")
         
         # 출력 디렉터리 생성
@@ -97,17 +145,24 @@ class PatentAnalysisPipeline:
         # 특허 번호 추출
         patent_number = extract_patent_number_from_filename(pdf_path)
         
+        # 검색 브라우저/HTTP 세션을 검색식 생성(Gemini 호출) 동안 미리 띄워 두고,
+        # analyze_recall 안에서는 이미 열린 세션을 그대로 사용
+        session = asyncio.create_task(self.recall_analyzer.__aenter__())
+        
         try:
             # STEP 1: 검색식 생성
-            logger.info("STEP 1: Generating search queries with AI...")
-            queries_data = await self.query_generator.generate_queries_from_pdf(
-                pdf_path, prompt_template
-            )
+            if queries_data is None:
+                logger.info("STEP 1: Generating search queries with AI...")
+                queries_data = await self.query_generator.generate_queries_from_pdf(
+                    pdf_path, prompt_template, pdf_context
+                )
+            else:
+                logger.info("STEP 1: Reusing already generated search queries")
             
             # 중간 결과 저장 (선택적)
             if self.save_intermediate:
                 queries_file = output_dir / f"{patent_number}_queries.json"
-                self._save_json(queries_data, queries_file)
+                await asyncio.to_thread(self._save_json, queries_data, queries_file)
                 logger.info(f"Queries saved to: {queries_file}")
             
             # 생성된 검색식 수 확인
@@ -116,6 +171,7 @@ class PatentAnalysisPipeline:
             
             # STEP 2: Seed Recall 분석
             logger.info("STEP 2: Executing searches and analyzing recall...")
+            await session
             recall_results = await self.recall_analyzer.analyze_recall(
                 queries_data, patent_number
             )
@@ -123,7 +179,7 @@ class PatentAnalysisPipeline:
             # 중간 결과 저장 (선택적)
             if self.save_intermediate:
                 recall_file = output_dir / f"{patent_number}_recall.json"
-                self._save_json(recall_results, recall_file)
+                await asyncio.to_thread(self._save_json, recall_results, recall_file)
                 logger.info(f"Recall analysis saved to: {recall_file}")
             
             # STEP 3: 결과 통합
@@ -141,8 +197,7 @@ class PatentAnalysisPipeline:
             # 성과 기록 (프롬프트 전략이 있는 경우)
             strategy = getattr(self, '_current_strategy', None)
             if strategy and strategy != 'custom':
-                prompt_manager = PromptManager()
-                prompt_manager.record_performance(
+                self.prompt_manager.record_performance(
                     strategy=strategy,
                     patent_number=patent_number,
                     performance_data={
@@ -159,6 +214,12 @@ class PatentAnalysisPipeline:
         except Exception as exc:
             logger.error(f"Complete analysis pipeline failed: {exc}")
             raise
+        
+        finally:
+            # 기동 도중 취소하면 Playwright 드라이버가 남을 수 있으므로 기동은 끝까지 기다린 뒤 닫는다
+            await asyncio.gather(session, return_exceptions=True)
+            if not session.cancelled() and session.exception() is None:
+                await self.recall_analyzer.__aexit__(None, None, None)
     
     async def run_multi_prompt_analysis(
         self,
@@ -177,89 +238,92 @@ class PatentAnalysisPipeline:
         # 각 전략별 결과 저장
         strategy_results = {}
         best_result = None
+        best_strategy = None
         best_recall_rate = -1.0
         
         try:
-            for i, strategy in enumerate(strategies, 1):
-                logger.info(f"STRATEGY {i}/{len(strategies)}: {strategy}")
+            # 전략마다 검색 브라우저를 다시 띄우지 않도록 세션을 한 번만 열고,
+            # PDF도 한 번만 업로드해 Gemini 컨텍스트 캐시로 전략 간 공유
+            async with self.recall_analyzer, \
+                    self.query_generator.pdf_context(pdf_path) as pdf_context:
+                # 전략끼리는 서로 독립적이므로 동시에 실행 (Gemini/검색 요청량은 세마포어로 제한)
+                sem = asyncio.Semaphore(self.strategy_concurrency)
                 
-                # 프롬프트 로드
-                try:
-                    prompt_template = self.prompt_manager.get_prompt(strategy)
-                except Exception as exc:
-                    logger.error(f"Failed to load prompt '{strategy}': {exc}")
-                    continue
-                
-                # 1. 검색식 생성
-                logger.info(f"Generating queries with {strategy} strategy...")
-                queries_data = await self.query_generator.generate_queries_from_pdf(
-                    pdf_path, prompt_template
-                )
-                
-                # 2. Recall 분석
-                logger.info(f"Analyzing recall for {strategy}...")
-                recall_results = await self.recall_analyzer.analyze_recall(
-                    queries_data, patent_number
-                )
-                
-                # 3. 결과 통합 (단일 전략 결과)
-                integrated_result = self._integrate_results(
-                    pdf_path, queries_data, recall_results
-                )
-                
-                strategy_results[strategy] = integrated_result
-                
-                # 중간 결과 저장
+                # 전략이 끝날 때마다 결과를 NDJSON으로 바로 기록 (중단되어도 부분 결과 보존)
+                stream_path = output_dir / f"{patent_number}_stream.ndjson"
+                stream_lock = asyncio.Lock()
                 if self.save_intermediate:
-                    result_file = output_dir / f"{patent_number}_{strategy}.json"
-                    self._save_json(integrated_result, result_file)
-                    logger.info(f"Strategy result saved: {result_file}")
+                    stream_path.write_bytes(b"")
                 
-                # 최고 성과 추적
-                performance = recall_results.get("performance_analysis", {})
-                recall_rate = performance.get("seed_recall_rate", 0)
+                async def bounded(i: int, strategy: str) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+                    async with sem:
+                        logger.info(f"STRATEGY {i}/{len(strategies)}: {strategy}")
+                        outcome = await self._run_single_strategy(
+                            strategy, pdf_path, patent_number, pdf_context
+                        )
+                    if outcome is not None and self.save_intermediate:
+                        # 전략별 통합 결과는 중간 결과를 저장할 때만 만든다
+                        integrated_result = self._integrate_results(pdf_path, *outcome)
+                        result_file = output_dir / f"{patent_number}_{strategy}.json"
+                        await asyncio.to_thread(self._save_json, integrated_result, result_file)
+                        logger.info(f"Strategy result saved: {result_file}")
+                        async with stream_lock:
+                            await asyncio.to_thread(
+                                self._append_ndjson, {"strategy": strategy, **integrated_result}, stream_path
+                            )
+                    return outcome
                 
-                if recall_rate > best_recall_rate:
-                    best_recall_rate = recall_rate
-                    best_result = integrated_result
-                    
-                # 프롬프트 성과 기록
-                self.prompt_manager.record_performance(
-                    strategy, patent_number, performance
-                )
-                
-                logger.info(f"Strategy {strategy}: Seed Recall = {recall_rate:.2%}")
-                
-                # 전략간 지연
-                if i < len(strategies):
-                    await asyncio.sleep(1.0)
-                    
-            # 통합 결과 생성
-            # 전략별 쿼리 데이터와 리콜 결과 분리
+                try:
+                    outcomes = await asyncio.gather(
+                        *(bounded(i, s) for i, s in enumerate(strategies, 1)),
+                        return_exceptions=True
+                    )
+                finally:
+                    # 성과 이력 파일은 전략마다 쓰지 않고 한 번만 저장
+                    pending, self._pending_performance = self._pending_performance, []
+                    await asyncio.to_thread(self.prompt_manager.record_performance_batch, pending)
+            
+            # 입력 순서대로 정리 (동률이면 앞선 전략을 최고 성과로 유지)
+            # 전략별 단일 통합 결과를 만들지 않고 원본 결과에서 바로 다중 통합 입력을 구성
             multi_queries_data = {}
             multi_recall_results = {}
             
-            for strategy, result in strategy_results.items():
-                multi_queries_data[strategy] = result.get("query_generation", {})
+            for strategy, outcome in zip(strategies, outcomes):
+                if isinstance(outcome, BaseException):
+                    logger.error(f"Strategy {strategy} failed: {outcome}")
+                    continue
+                if outcome is None:
+                    continue
+                queries_data, recall_results = outcome
+                strategy_results[strategy] = outcome
+                performance = recall_results.get("performance_analysis", {})
+                
+                multi_queries_data[strategy] = self._query_generation_section(queries_data)
                 # 리콜 결과는 전체 성과 분석을 포함한 딕셔너리 형태로 전달
                 multi_recall_results[strategy] = {
-                    "performance_analysis": result.get("performance_analysis", {}),
-                    "search_results": result.get("search_execution", {}).get("search_results", [])
+                    "performance_analysis": {
+                        **performance,
+                        "query_performance": self._build_query_performance(performance)
+                    },
+                    "search_results": recall_results.get("search_results", [])
                 }
                 
+                # 최고 성과 추적
+                recall_rate = performance.get("seed_recall_rate", 0)
+                if recall_rate > best_recall_rate:
+                    best_recall_rate = recall_rate
+                    best_strategy = strategy
+            
+            # 최고 성과 전략만 단일 통합 결과로 구성
+            if best_strategy is not None:
+                best_result = self._integrate_results(pdf_path, *strategy_results[best_strategy])
+                
             multi_result = self._integrate_results_multi(
                 pdf_path, multi_queries_data, multi_recall_results
             )
             
             # 최고 성과 전략 기록
             if best_result:
-                best_strategy = None
-                for strategy, result in strategy_results.items():
-                    recall_rate = result.get("performance_analysis", {}).get("seed_recall_rate", 0)
-                    if recall_rate == best_recall_rate:
-                        best_strategy = strategy
-                        break
-                        
                 multi_result["metadata"]["best_strategy"] = best_strategy
                 multi_result["best_result"] = best_result
                 
@@ -291,6 +355,45 @@ class PatentAnalysisPipeline:
             
             return partial_result
     
+    async def _run_single_strategy(
+        self,
+        strategy: str,
+        pdf_path: Path,
+        patent_number: str,
+        pdf_context: Optional[GeminiPdfContext] = None
+    ) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """전략 하나의 검색식 생성 → Recall 분석을 실행
+        
+        Returns:
+            (검색식 생성 결과, Recall 분석 결과) 또는 프롬프트 로드 실패 시 None
+        """
+        # 프롬프트 로드
+        try:
+            prompt_template = self.prompt_manager.get_prompt(strategy)
+        except Exception as exc:
+            logger.error(f"Failed to load prompt '{strategy}': {exc}")
+            return None
+        
+        # 1. 검색식 생성
+        logger.info(f"Generating queries with {strategy} strategy...")
+        queries_data = await self.query_generator.generate_queries_from_pdf(
+            pdf_path, prompt_template, pdf_context
+        )
+        
+        # 2. Recall 분석
+        logger.info(f"Analyzing recall for {strategy}...")
+        # 전략들이 동시에 실행되므로 검색식별 결과 스트림은 전략마다 별도 파일에 기록
+        recall_results = await self.recall_analyzer.analyze_recall(
+            queries_data, patent_number, run_label=strategy
+        )
+        
+        # 프롬프트 성과는 모아 두었다가 전략 실행이 모두 끝난 뒤 한 번에 저장
+        performance = recall_results.get("performance_analysis", {})
+        self._pending_performance.append((strategy, patent_number, performance))
+        
+        logger.info(f"Strategy {strategy}: Seed Recall = {performance.get('seed_recall_rate', 0):.2%}")
+        return queries_data, recall_results
+    
     def _integrate_results(
         self, 
         pdf_path: Path, 
@@ -305,15 +408,7 @@ class PatentAnalysisPipeline:
         search_results = recall_results.get("search_results", [])
         
         # 각 검색식별 성과 요약
-        query_performance = []
-        for detail in performance.get("query_details", []):
-            query_performance.append({
-                "strategy": detail.get("strategy", "Unknown"),
-                "query": detail.get("query", ""),
-                "found_target": detail.get("found", False),
-                "total_results": detail.get("total_results", 0),
-                "parsed_results": detail.get("parsed_results", 0)
-            })
+        query_performance = self._build_query_performance(performance)
         
         # 통합 결과 구성
         integrated_result = {
@@ -323,19 +418,11 @@ class PatentAnalysisPipeline:
                 "analysis_timestamp": datetime.now().isoformat(),
                 "pipeline_version": "1.0",
                 "pipeline_status": "completed",
-                "settings": {
-                    "max_results": self.max_results,
-                    "delay": self.delay,
-                    "full_recall": self.full_recall
-                }
+                "settings": self._settings_dict
             },
             
             # 1단계: 검색식 생성 결과
-            "query_generation": {
-                "patent_info": queries_data.get("patent_info", {}),
-                "search_queries": queries_data.get("search_queries", []),
-                "generation_metadata": queries_data.get("metadata", {})
-            },
+            "query_generation": self._query_generation_section(queries_data),
             
             # 2단계: 검색 실행 결과
             "search_execution": {
@@ -362,6 +449,29 @@ class PatentAnalysisPipeline:
         
         return integrated_result
     
+    @staticmethod
+    def _build_query_performance(performance: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Recall 성과 분석의 query_details를 검색식별 성과 요약 목록으로 변환"""
+        return [
+            {
+                "strategy": detail.get("strategy", "Unknown"),
+                "query": detail.get("query", ""),
+                "found_target": detail.get("found", False),
+                "total_results": detail.get("total_results", 0),
+                "parsed_results": detail.get("parsed_results", 0)
+            }
+            for detail in performance.get("query_details", [])
+        ]
+    
+    @staticmethod
+    def _query_generation_section(queries_data: Dict[str, Any]) -> Dict[str, Any]:
+        """검색식 생성 결과를 통합 결과의 query_generation 형태로 정리"""
+        return {
+            "patent_info": queries_data.get("patent_info", {}),
+            "search_queries": queries_data.get("search_queries", []),
+            "generation_metadata": queries_data.get("metadata", {})
+        }
+    
     def _integrate_results_multi(
         self, 
         pdf_path: Path, 
@@ -371,15 +481,16 @@ class PatentAnalysisPipeline:
         """다중 프롬프트 결과 통합"""
         patent_number = extract_patent_number_from_filename(pdf_path)
         
-        # 전략별 성과 요약
+        # 전략별 성과 요약과 상세 결과를 한 번의 순회로 구성
+        # (검색 결과 리스트는 복사하지 않고 원본을 그대로 참조)
         strategy_performances = {}
-        all_queries = []
+        strategy_results = {}
         
         for strategy, recall_data in multi_recall_results.items():
             performance = recall_data.get("performance_analysis", {})
             queries_data = multi_queries_data.get(strategy, {})
             
-            strategy_performances[strategy] = {
+            summary = {
                 "strategy_name": strategy,
                 "total_queries": len(queries_data.get("search_queries", [])),
                 "successful_searches": performance.get("successful_queries", 0),
@@ -387,19 +498,17 @@ class PatentAnalysisPipeline:
                 "queries_found_target": performance.get("queries_found_patent", 0),
                 "avg_results_per_query": performance.get("avg_parsed_results", 0)
             }
-            
-            # 모든 쿼리 수집
-            for query_detail in performance.get("query_details", []):
-                all_queries.append({
-                    **query_detail,
-                    "strategy": strategy
-                })
-        
-        # 최고 성과 전략 식별
-        best_strategy, best_performance = self._get_best_strategy(strategy_performances)
+            strategy_performances[strategy] = summary
+            strategy_results[strategy] = {
+                "query_generation": queries_data,
+                "recall_analysis": recall_data,
+                "performance_summary": summary
+            }
         
-        # 전략 비교 분석
+        # 전략 비교 분석 (성과순 정렬은 한 번만 하고 최고 성과 전략은 1순위를 사용)
         comparison = self._compare_strategies(strategy_performances)
+        ranking = comparison["ranking"]
+        best_strategy, best_performance = ranking[0] if ranking else ("none", {})
         
         # 추천 사항 생성
         recommendations = self._generate_recommendations(strategy_performances, comparison)
@@ -414,22 +523,11 @@ class PatentAnalysisPipeline:
                 "pipeline_status": "completed",
                 "analysis_type": "multi_prompt",
                 "strategies_used": list(multi_queries_data.keys()),
-                "settings": {
-                    "max_results": self.max_results,
-                    "delay": self.delay,
-                    "full_recall": self.full_recall
-                }
+                "settings": self._settings_dict
             },
             
             # 전략별 상세 결과
-            "strategy_results": {
-                strategy: {
-                    "query_generation": multi_queries_data.get(strategy, {}),
-                    "recall_analysis": recall_data,
-                    "performance_summary": strategy_performances[strategy]
-                }
-                for strategy, recall_data in multi_recall_results.items()
-            },
+            "strategy_results": strategy_results,
             
             # 전략 비교 및 분석
             "strategy_comparison": {
@@ -445,9 +543,9 @@ class PatentAnalysisPipeline:
             # 종합 성과 요약  
             "summary": {
                 "total_strategies": len(multi_queries_data),
-                "total_queries_generated": sum(len(data.get("search_queries", [])) for data in multi_queries_data.values()),
+                "total_queries_generated": sum(perf["total_queries"] for perf in strategy_performances.values()),
                 "best_seed_recall_rate": best_performance.get("seed_recall_rate", 0),
-                "strategies_found_target": sum(1 for perf in strategy_performances.values() if perf["queries_found_target"] > 0),
+                "strategies_found_target": comparison["analysis"]["strategies_found_target"],
                 "analysis_success": best_performance.get("seed_recall_rate", 0) > 0,
                 "recommended_strategy": recommendations.get("primary_recommendation")
             }
@@ -460,46 +558,40 @@ class PatentAnalysisPipeline:
         if not strategy_performances:
             return "none", {}
         
-        # 1차: Seed Recall Rate 기준
-        # 2차: 타겟 발견 쿼리 수 기준
-        # 3차: 성공 쿼리 수 기준
-        best_strategy = max(
-            strategy_performances.items(),
-            key=lambda x: (
-                x[1]["seed_recall_rate"],
-                x[1]["queries_found_target"],
-                x[1]["successful_searches"]
-            )
-        )
+        best_strategy = max(strategy_performances.items(), key=self._rank_key)
         
         return best_strategy[0], best_strategy[1]
     
+    @staticmethod
+    def _rank_key(item: Tuple[str, Dict[str, Any]]) -> Tuple[float, int, int]:
+        """전략 성과 순위 기준
+        
+        1차: Seed Recall Rate, 2차: 타겟 발견 쿼리 수, 3차: 성공 쿼리 수
+        """
+        perf = item[1]
+        return (perf["seed_recall_rate"], perf["queries_found_target"], perf["successful_searches"])
+    
     def _compare_strategies(self, strategy_performances: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
         """전략간 성과 비교 분석"""
-        # 성과순 순위
-        ranking = sorted(
-            strategy_performances.items(),
-            key=lambda x: (
-                x[1]["seed_recall_rate"],
-                x[1]["queries_found_target"],
-                x[1]["successful_searches"]
-            ),
-            reverse=True
-        )
+        # 성과순 순위 (안정 정렬이므로 동률이면 입력 순서 유지 → max()와 같은 1순위)
+        ranking = sorted(strategy_performances.items(), key=self._rank_key, reverse=True)
         
-        # 성과 분석
+        # 성과 분석 (한 번의 순회로 집계)
         recall_rates = [perf["seed_recall_rate"] for perf in strategy_performances.values()]
-        target_found_counts = [perf["queries_found_target"] for perf in strategy_performances.values()]
+        min_rate = min(recall_rates, default=0)
+        max_rate = max(recall_rates, default=0)
         
         analysis = {
             "recall_rate_range": {
-                "min": min(recall_rates) if recall_rates else 0,
-                "max": max(recall_rates) if recall_rates else 0,
+                "min": min_rate,
+                "max": max_rate,
                 "avg": sum(recall_rates) / len(recall_rates) if recall_rates else 0
             },
-            "strategies_found_target": sum(1 for count in target_found_counts if count > 0),
+            "strategies_found_target": sum(
+                1 for perf in strategy_performances.values() if perf["queries_found_target"] > 0
+            ),
             "most_effective": ranking[0][0] if ranking else None,
-            "performance_gap": (max(recall_rates) - min(recall_rates)) if recall_rates else 0
+            "performance_gap": max_rate - min_rate
         }
         
         return {
@@ -561,9 +653,24 @@ class PatentAnalysisPipeline:
         return recommendations
     
     def _save_json(self, data: Dict[str, Any], file_path: Path) -> None:
-        """JSON 데이터를 파일로 저장"""
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        """JSON 데이터를 파일로 저장 (이벤트 루프에서는 asyncio.to_thread로 호출)"""
+        if orjson is not None:
+            file_path.write_bytes(
+                orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
+        else:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+    
+    @staticmethod
+    def _append_ndjson(data: Dict[str, Any], file_path: Path) -> None:
+        """결과 한 건을 NDJSON 파일 끝에 한 줄로 추가"""
+        if orjson is not None:
+            line = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+        else:
+            line = (json.dumps(data, ensure_ascii=False) + "\n").encode("utf-8")
+        with open(file_path, 'ab') as f:
+            f.write(line)
 
 
 def setup_api_key(args) -> str:
@@ -571,6 +678,12 @@ def setup_api_key(args) -> str:
     if args.api_key:
         return args.api_key
     
+    # 이미 환경 변수에 있으면 .env 파일을 읽지 않음
+    api_key = os.environ.get('GOOGLE_API_KEY')
+    if api_key:
+        return api_key
+    
+    from dotenv import load_dotenv
     load_dotenv()
     api_key = os.getenv('GOOGLE_API_KEY')
     
@@ -666,6 +779,26 @@ def build_cli_parser() -> argparse.ArgumentParser:
         help="전체 검색 수행 (early termination 비활성화, 더 정확하지만 오래 걸림)"
     )
     
+    parser.add_argument(
+        "--strategy-concurrency",
+        type=int,
+        default=3,
+        help="--multi-strategy에서 동시에 실행할 전략 수 (기본값: 3)"
+    )
+    
+    parser.add_argument(
+        "--query-concurrency",
+        type=int,
+        default=3,
+        help="전략 하나에서 동시에 실행할 검색식 수 (기본값: 3)"
+    )
+    
+    parser.add_argument(
+        "--gemini-cache",
+        action="store_true",
+        help="같은 PDF+프롬프트의 Gemini 응답을 temp_results/.gemini_cache에 캐시해 재사용 (기본값: 사용 안 함)"
+    )
+    
     parser.add_argument(
         "--no-intermediate",
         action="store_true",
@@ -679,6 +812,7 @@ async def main() -> int:
     """메인 실행 함수"""
     parser = build_cli_parser()
     args = parser.parse_args()
+    pdf_context: Optional[GeminiPdfContext] = None
     
     try:
         # 입력 검증
@@ -696,7 +830,10 @@ async def main() -> int:
             max_results=args.max_results,
             delay=args.delay,
             full_recall=args.full_recall,
-            save_intermediate=not args.no_intermediate
+            save_intermediate=not args.no_intermediate,
+            strategy_concurrency=args.strategy_concurrency,
+            query_concurrency=args.query_concurrency,
+            gemini_cache_dir=Path("temp_results/.gemini_cache") if args.gemini_cache else None
         )
         
         # 출력 디렉터리 설정
@@ -731,18 +868,23 @@ async def main() -> int:
                 print(f"최고 성과 전략: {best['name']} ({best['performance'].get('seed_recall_rate', 0):.2%})")
             
         else:
-            # 단일 전략 실행
-            prompt_manager = PromptManager()
+            # 단일 전략 실행 (파이프라인의 프롬프트 매니저를 재사용)
+            prompt_manager = pipeline.prompt_manager
+            # auto 선택에 쓴 검색식을 그대로 쓸 수 있으면 재사용 (같은 프롬프트일 때)
+            reuse_queries: Optional[Dict[str, Any]] = None
             
             if args.strategy:
                 if args.strategy == "auto":
                     # PDF 분석 후 자동 선택
                     logger.info("Auto-selecting prompt strategy based on patent content...")
+                    # auto 선택용 분석과 실제 실행이 같은 업로드/컨텍스트 캐시를 쓰도록 공유
+                    # (Gemini 호출이 한 번뿐인 다른 경로는 캐시 생성 비용만 들므로 만들지 않음)
+                    pdf_context = pipeline.query_generator.pdf_context(args.pdf)
                     
                     # 기본 PDF 분석을 위해 임시로 base template 사용
                     temp_template = prompt_manager.get_prompt("base_template")
                     temp_queries = await pipeline.query_generator.generate_queries_from_pdf(
-                        args.pdf, temp_template
+                        args.pdf, temp_template, pdf_context
                     )
                     
                     # 자동 선택
@@ -750,6 +892,8 @@ async def main() -> int:
                         temp_queries.get("patent_info", {})
                     )
                     logger.info(f"Auto-selected strategy: {strategy}")
+                    if strategy == "base_template":
+                        reuse_queries = temp_queries
                     
                 else:
                     # 지정된 전략 사용
@@ -775,7 +919,9 @@ async def main() -> int:
             results = await pipeline.run_complete_analysis(
                 args.pdf, 
                 prompt_template, 
-                output_dir
+                output_dir,
+                pdf_context,
+                reuse_queries
             )
             
             # 단일 전략 결과 요약 출력
@@ -791,7 +937,7 @@ async def main() -> int:
             print(f"타겟 발견 검색식: {summary.get('queries_found_target', 0)}개")
         
         # 최종 결과 저장
-        pipeline._save_json(results, args.output)
+        await asyncio.to_thread(pipeline._save_json, results, args.output)
         print(f"최종 결과: {args.output}")
         
         # 성공 여부 판단
@@ -809,8 +955,13 @@ async def main() -> int:
     except Exception as exc:
         logger.error(f"Pipeline execution failed: {exc}")
         return 1
+    
+    finally:
+        if pdf_context is not None:
+            await pdf_context.close()
 
 
 if __name__ == "__main__":
+    install_uvloop()
     exit_code = asyncio.run(main())
     exit(exit_code)
\ No newline at end of file
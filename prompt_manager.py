@@ -15,18 +15,50 @@
   
   # 멀티 프롬프트 실행  
   prompts = manager.get_multi_prompts(["technical_depth", "competitor_analysis"])
+  
+  # 비동기 코드에서 멀티 프롬프트 로드 (파일을 동시에 읽음)
+  prompts = await manager.get_multi_prompts_async(["technical_depth", "prior_art"])
+
+성과 이력:
+  새 기록은 performance_history.jsonl에 추가되고, HISTORY_COMPACT_THRESHOLD개가
+  쌓이면 performance_history.json 스냅샷으로 합쳐진다. 수동 압축:
+  python prompt_manager.py --compact
 """
 
+import asyncio
 import json
 import re
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Tuple, Any
+from dataclasses import asdict, dataclass, field
 from enum import Enum
+from types import MappingProxyType
 
 from loguru import logger
 
+try:  # 선택 의존성: 있으면 성과 이력 JSON 읽기/쓰기에 사용
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+# auto_select_prompt 전략별 키워드 (그룹마다 한 번의 검색으로 부분 문자열 매칭)
+_CHEMISTRY_KEYWORDS_RE = re.compile(
+    "|".join(["chemical", "polymer", "membrane", "catalyst", "synthesis", "composition", "material"])
+)
+_APPLICATION_KEYWORDS_RE = re.compile(
+    "|".join(["system", "device", "method", "apparatus", "application", "use"])
+)
+_COMPETITIVE_KEYWORDS_RE = re.compile(
+    "|".join(["improvement", "enhanced", "optimized", "advanced", "novel"])
+)
+
+
+# JSONL 로그에 이만큼 기록이 쌓이면 JSON 스냅샷으로 합치고 로그를 비움
+HISTORY_COMPACT_THRESHOLD = 200
+
 
 class PromptStrategy(Enum):
     """프롬프트 전략 유형"""
@@ -38,19 +70,85 @@ class PromptStrategy(Enum):
     EVOLUTION_TRACKING = "evolution_tracking"
 
 
-@dataclass
+@dataclass(frozen=True)
 class PromptMetadata:
     """프롬프트 메타데이터"""
     strategy: str
     name: str
     description: str
-    best_for: List[str]  # 최적 사용 사례
-    tech_domains: List[str]  # 적합한 기술 도메인
+    best_for: Tuple[str, ...]  # 최적 사용 사례
+    tech_domains: Tuple[str, ...]  # 적합한 기술 도메인
     query_count: int  # 생성할 검색식 수
-    focus_areas: List[str]  # 주요 포커스 영역
+    focus_areas: Tuple[str, ...]  # 주요 포커스 영역
+    # 추천 점수 계산용 파생 필드 (생성 시 한 번만 계산)
+    _tech_domains_lc: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _all_domains: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_tech_domains_lc", tuple(d.lower() for d in self.tech_domains))
+        object.__setattr__(self, "_all_domains", "모든 분야" in self.tech_domains)
 
 
-@dataclass
+# 전략별 기본 메타데이터 (모든 PromptManager 인스턴스가 같은 읽기 전용 매핑을 공유)
+_DEFAULT_PROMPT_METADATA: Mapping[str, PromptMetadata] = MappingProxyType({
+    "base_template": PromptMetadata(
+        strategy="base_template",
+        name="기본 템플릿",
+        description="표준 검색식 생성 (broad/medium/narrow)",
+        best_for=("일반적 특허 분석", "기본 검색"),
+        tech_domains=("모든 분야",),
+        query_count=3,
+        focus_areas=("키워드", "분류코드", "출원인")
+    ),
+    "technical_depth": PromptMetadata(
+        strategy="technical_depth", 
+        name="기술적 세부사항 중심",
+        description="기술 메커니즘과 구현 세부사항 중심 검색",
+        best_for=("기술 분석", "R&D 검토", "기술적 무효 자료"),
+        tech_domains=("화학", "반도체", "소재", "제조"),
+        query_count=5,
+        focus_areas=("메커니즘", "소재", "공정", "파라미터", "구조")
+    ),
+    "application_focus": PromptMetadata(
+        strategy="application_focus",
+        name="응용 분야 중심", 
+        description="기술의 응용 분야와 사용 사례 중심 검색",
+        best_for=("시장 분석", "제품 개발", "라이센싱"),
+        tech_domains=("소프트웨어", "의료기기", "자동차", "전자제품"),
+        query_count=5,
+        focus_areas=("산업", "제품", "용도", "시장", "사용자")
+    ),
+    "competitor_analysis": PromptMetadata(
+        strategy="competitor_analysis",
+        name="경쟁사 분석 중심",
+        description="경쟁사 및 경쟁 기술 발굴 중심 검색",
+        best_for=("경쟁 분석", "FTO 분석", "침해 분석"),
+        tech_domains=("모든 분야",),
+        query_count=6,
+        focus_areas=("경쟁사", "대안기술", "우회설계", "시장점유")
+    ),
+    "prior_art": PromptMetadata(
+        strategy="prior_art",
+        name="선행기술 발굴 중심",
+        description="무효 자료 및 선행기술 발굴 특화 검색",
+        best_for=("무효심판", "재심사", "특허 무효화"),
+        tech_domains=("모든 분야",),
+        query_count=7,
+        focus_areas=("선행기술", "무효포인트", "청구항", "시간제한")
+    ),
+    "evolution_tracking": PromptMetadata(
+        strategy="evolution_tracking", 
+        name="기술 진화 추적",
+        description="기술의 시간적 진화와 발전 경로 추적",
+        best_for=("기술 동향", "로드맵 수립", "미래 예측"),
+        tech_domains=("모든 분야",),
+        query_count=6,
+        focus_areas=("시간축", "진화경로", "트렌드", "미래예측")
+    )
+})
+
+
+@dataclass(frozen=True)
 class PerformanceRecord:
     """프롬프트 성과 기록"""
     strategy: str
@@ -67,101 +165,85 @@ class PromptManager:
     
     def __init__(self, prompts_dir: Path = Path("./prompts")):
         self.prompts_dir = prompts_dir
-        self.prompt_metadata = {}
+        self.prompt_metadata: Mapping[str, PromptMetadata] = {}
         self.performance_history = []
+        # 성과 이력: JSON 스냅샷 + 이후 추가된 기록의 JSONL 로그 (기록마다 전체를 다시 쓰지 않음)
+        self._history_file = prompts_dir.parent / "performance_history.json"
+        self._history_log = prompts_dir.parent / "performance_history.jsonl"
+        # 아직 로그에 기록하지 않은 성과 기록
+        self._unsaved_records: List[PerformanceRecord] = []
+        # JSONL 로그에 들어 있는 기록 수 (HISTORY_COMPACT_THRESHOLD 이상이면 자동 압축)
+        self._log_records = 0
+        # 전략별 누적 성과 (count, sum_recall, success_count, patents) — 기록 추가 시 갱신
+        self._perf_agg: Dict[str, Dict[str, Any]] = {}
+        # 프롬프트 파일 → (수정 시각, 텍스트). 파일이 바뀌지 않았으면 다시 읽지 않음
+        self._prompt_cache: Dict[Path, Tuple[float, str]] = {}
         self._load_prompt_metadata()
         self._load_performance_history()
     
     def _load_prompt_metadata(self):
         """프롬프트 메타데이터 초기화"""
-        self.prompt_metadata = {
-            "base_template": PromptMetadata(
-                strategy="base_template",
-                name="기본 템플릿",
-                description="표준 검색식 생성 (broad/medium/narrow)",
-                best_for=["일반적 특허 분석", "기본 검색"],
-                tech_domains=["모든 분야"],
-                query_count=3,
-                focus_areas=["키워드", "분류코드", "출원인"]
-            ),
-            "technical_depth": PromptMetadata(
-                strategy="technical_depth", 
-                name="기술적 세부사항 중심",
-                description="기술 메커니즘과 구현 세부사항 중심 검색",
-                best_for=["기술 분석", "R&D 검토", "기술적 무효 자료"],
-                tech_domains=["화학", "반도체", "소재", "제조"],
-                query_count=5,
-                focus_areas=["메커니즘", "소재", "공정", "파라미터", "구조"]
-            ),
-            "application_focus": PromptMetadata(
-                strategy="application_focus",
-                name="응용 분야 중심", 
-                description="기술의 응용 분야와 사용 사례 중심 검색",
-                best_for=["시장 분석", "제품 개발", "라이센싱"],
-                tech_domains=["소프트웨어", "의료기기", "자동차", "전자제품"],
-                query_count=5,
-                focus_areas=["산업", "제품", "용도", "시장", "사용자"]
-            ),
-            "competitor_analysis": PromptMetadata(
-                strategy="competitor_analysis",
-                name="경쟁사 분석 중심",
-                description="경쟁사 및 경쟁 기술 발굴 중심 검색",
-                best_for=["경쟁 분석", "FTO 분석", "침해 분석"],  
-                tech_domains=["모든 분야"],
-                query_count=6,
-                focus_areas=["경쟁사", "대안기술", "우회설계", "시장점유"]
-            ),
-            "prior_art": PromptMetadata(
-                strategy="prior_art",
-                name="선행기술 발굴 중심",
-                description="무효 자료 및 선행기술 발굴 특화 검색",
-                best_for=["무효심판", "재심사", "특허 무효화"],
-                tech_domains=["모든 분야"],
-                query_count=7,
-                focus_areas=["선행기술", "무효포인트", "청구항", "시간제한"]
-            ),
-            "evolution_tracking": PromptMetadata(
-                strategy="evolution_tracking", 
-                name="기술 진화 추적",
-                description="기술의 시간적 진화와 발전 경로 추적",
-                best_for=["기술 동향", "로드맵 수립", "미래 예측"],
-                tech_domains=["모든 분야"],
-                query_count=6,
-                focus_areas=["시간축", "진화경로", "트렌드", "미래예측"]
-            )
-        }
+        self.prompt_metadata = _DEFAULT_PROMPT_METADATA
     
     def _load_performance_history(self):
-        """성과 이력 로드"""
-        history_file = self.prompts_dir.parent / "performance_history.json"
+        """성과 이력 로드 (JSON 스냅샷 다음에 JSONL 로그를 이어서 읽음)"""
+        self.performance_history = []
+        self._perf_agg = {}
+        self._log_records = 0
+        self._history_load_failed = False
         
-        if not history_file.exists():
-            logger.debug(f"Performance history file not found: {history_file}")
+        if not self._history_file.exists() and not self._history_log.exists():
+            logger.debug(f"Performance history file not found: {self._history_file}")
             return
             
         try:
-            with open(history_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if self._history_file.exists():
+                if orjson is not None:
+                    data = orjson.loads(self._history_file.read_bytes())
+                else:
+                    with open(self._history_file, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
                 
-            # JSON 데이터를 PerformanceRecord 객체로 변환
-            self.performance_history = []
-            for record_data in data.get("records", []):
-                record = PerformanceRecord(
-                    strategy=record_data["strategy"],
-                    patent_number=record_data["patent_number"],
-                    seed_recall_rate=record_data["seed_recall_rate"],
-                    total_queries=record_data["total_queries"],
-                    successful_queries=record_data["successful_queries"],
-                    found_target=record_data["found_target"],
-                    timestamp=record_data["timestamp"]
-                )
-                self.performance_history.append(record)
+                # JSON 데이터를 PerformanceRecord 객체로 변환
+                for record_data in data.get("records", []):
+                    self._add_loaded_record(record_data)
+            
+            if self._history_log.exists():
+                with open(self._history_log, 'rb') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            record_data = orjson.loads(line) if orjson is not None else json.loads(line)
+                            self._add_loaded_record(record_data)
+                            self._log_records += 1
+                        except Exception as exc:
+                            # 중단 중 잘린 마지막 줄 등은 건너뜀
+                            logger.warning(f"Skipping unreadable performance log line: {exc}")
                 
             logger.info(f"Loaded {len(self.performance_history)} performance records")
             
         except Exception as exc:
             logger.error(f"Failed to load performance history: {exc}")
+            # 읽지 못한 스냅샷을 압축으로 덮어쓰지 않도록 표시
+            self._history_load_failed = True
             self.performance_history = []
+            self._perf_agg = {}
+    
+    def _add_loaded_record(self, record_data: Dict[str, Any]):
+        """파일에서 읽은 기록 하나를 이력과 누적 성과에 추가"""
+        record = PerformanceRecord(
+            strategy=record_data["strategy"],
+            patent_number=record_data["patent_number"],
+            seed_recall_rate=record_data["seed_recall_rate"],
+            total_queries=record_data["total_queries"],
+            successful_queries=record_data["successful_queries"],
+            found_target=record_data["found_target"],
+            timestamp=record_data["timestamp"]
+        )
+        self.performance_history.append(record)
+        self._fold_record(record)
     
     def get_available_strategies(self) -> List[str]:
         """사용 가능한 전략 목록 반환"""
@@ -172,7 +254,7 @@ class PromptManager:
         return self.prompt_metadata.get(strategy)
     
     def get_prompt(self, strategy: str) -> str:
-        """특정 전략의 프롬프트 텍스트 반환"""
+        """특정 전략의 프롬프트 텍스트 반환 (수정되지 않은 파일은 캐시 사용)"""
         prompt_file = self.prompts_dir / f"{strategy}.txt"
         
         if not prompt_file.exists():
@@ -183,7 +265,18 @@ class PromptManager:
         if not prompt_file.exists():
             raise FileNotFoundError(f"No prompt files available in {self.prompts_dir}")
             
-        return prompt_file.read_text(encoding='utf-8')
+        mtime = prompt_file.stat().st_mtime
+        cached = self._prompt_cache.get(prompt_file)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        prompt = prompt_file.read_text(encoding='utf-8')
+        self._prompt_cache[prompt_file] = (mtime, prompt)
+        return prompt
+    
+    def clear_prompt_cache(self):
+        """캐시된 프롬프트 텍스트 비우기"""
+        self._prompt_cache.clear()
     
     def auto_select_prompt(self, patent_analysis: Dict[str, Any]) -> Tuple[str, str]:
         """특허 내용 분석 기반 최적 프롬프트 자동 선택"""
@@ -193,29 +286,28 @@ class PromptManager:
         title = patent_analysis.get("title", "").lower()
         keywords = [k.lower() for k in patent_analysis.get("keywords", [])]
         
-        # 키워드 기반 전략 점수 계산
-        strategy_scores = {}
-        
+        # 키워드 기반 전략 점수 계산 (키워드 가산점을 받지 못한 전략은 기본 1점)
+        strategy_scores = defaultdict(float)
+        # 검사 대상 텍스트는 한 번만 만든다 (부분 문자열 매칭이므로 복수형 등도 포함)
+        text = tech_field + title + " ".join(keywords)
+
         # 화학/소재 관련 키워드
-        chemistry_keywords = ["chemical", "polymer", "membrane", "catalyst", "synthesis", "composition", "material"]
-        if any(keyword in tech_field + title + " ".join(keywords) for keyword in chemistry_keywords):
-            strategy_scores["technical_depth"] = strategy_scores.get("technical_depth", 0) + 3
-            
-        # 응용/제품 관련 키워드  
-        application_keywords = ["system", "device", "method", "apparatus", "application", "use"]
-        if any(keyword in tech_field + title + " ".join(keywords) for keyword in application_keywords):
-            strategy_scores["application_focus"] = strategy_scores.get("application_focus", 0) + 2
-            
+        if _CHEMISTRY_KEYWORDS_RE.search(text):
+            strategy_scores["technical_depth"] += 3
+
+        # 응용/제품 관련 키워드
+        if _APPLICATION_KEYWORDS_RE.search(text):
+            strategy_scores["application_focus"] += 2
+
         # 경쟁 분석이 유용한 키워드
-        competitive_keywords = ["improvement", "enhanced", "optimized", "advanced", "novel"]
-        if any(keyword in tech_field + title + " ".join(keywords) for keyword in competitive_keywords):
-            strategy_scores["competitor_analysis"] = strategy_scores.get("competitor_analysis", 0) + 2
-            
+        if _COMPETITIVE_KEYWORDS_RE.search(text):
+            strategy_scores["competitor_analysis"] += 2
+
         # 기본 점수 설정
         for strategy in self.prompt_metadata:
             if strategy not in strategy_scores:
                 strategy_scores[strategy] = 1
-                
+
         # 과거 성과 기반 보정 (있는 경우)
         for strategy in strategy_scores:
             performance = self.get_strategy_performance(strategy)
@@ -244,6 +336,21 @@ class PromptManager:
                 
         return result
     
+    async def get_multi_prompts_async(self, strategies: List[str]) -> Dict[str, str]:
+        """다중 프롬프트 반환 (파일 읽기를 스레드에서 동시에 수행, 이벤트 루프 비차단)"""
+        loaded = await asyncio.gather(
+            *(asyncio.to_thread(self.get_prompt, strategy) for strategy in strategies),
+            return_exceptions=True
+        )
+        result = {}
+        for strategy, prompt in zip(strategies, loaded):
+            if isinstance(prompt, BaseException):
+                logger.error(f"Failed to load prompt '{strategy}': {prompt}")
+                continue
+            result[strategy] = prompt
+        
+        return result
+    
     def get_recommended_strategies(self, 
                                  patent_analysis: Dict[str, Any], 
                                  top_k: int = 3) -> List[Tuple[str, float]]:
@@ -259,12 +366,10 @@ class PromptManager:
             score = 0.0
             
             # 기술 도메인 매칭
-            if "모든 분야" in metadata.tech_domains:
+            if metadata._all_domains:
                 score += 1.0
             else:
-                for domain in metadata.tech_domains:
-                    if domain.lower() in content:
-                        score += 2.0
+                score += 2.0 * sum(1 for domain in metadata._tech_domains_lc if domain in content)
                         
             # 과거 성과 기반 점수 (향후 구현)
             # historical_performance = self._get_historical_performance(strategy)
@@ -281,6 +386,25 @@ class PromptManager:
                           patent_number: str, 
                           performance_data: Dict[str, Any]):
         """프롬프트 성과 기록"""
+        self._append_record(strategy, patent_number, performance_data)
+        
+        # 자동으로 히스토리 저장
+        self._save_performance_history()
+    
+    def record_performance_batch(self, records: List[Tuple[str, str, Dict[str, Any]]]):
+        """여러 전략의 성과를 기록하고 히스토리 파일은 한 번만 저장
+        
+        Args:
+            records: (strategy, patent_number, performance_data) 목록
+        """
+        if not records:
+            return
+        for strategy, patent_number, performance_data in records:
+            self._append_record(strategy, patent_number, performance_data)
+        self._save_performance_history()
+    
+    def _append_record(self, strategy: str, patent_number: str, performance_data: Dict[str, Any]):
+        """성과 기록을 메모리 이력에 추가 (저장은 호출자가 담당)"""
         record = PerformanceRecord(
             strategy=strategy,
             patent_number=patent_number,
@@ -292,14 +416,42 @@ class PromptManager:
         )
         
         self.performance_history.append(record)
+        self._fold_record(record)
+        self._unsaved_records.append(record)
         logger.info(f"Recorded performance for {strategy}: Seed Recall = {record.seed_recall_rate:.2%}")
-        
-        # 자동으로 히스토리 저장
-        self._save_performance_history()
     
     def _save_performance_history(self):
-        """성과 이력 저장"""
-        history_file = self.prompts_dir.parent / "performance_history.json"
+        """아직 저장하지 않은 성과 기록만 JSONL 로그 끝에 추가"""
+        if not self._unsaved_records:
+            return
+        
+        try:
+            self._history_log.parent.mkdir(parents=True, exist_ok=True)
+            lines = []
+            for record in self._unsaved_records:
+                record_data = asdict(record)
+                if orjson is not None:
+                    lines.append(orjson.dumps(record_data) + b"\n")
+                else:
+                    lines.append((json.dumps(record_data, ensure_ascii=False) + "\n").encode("utf-8"))
+            with open(self._history_log, 'ab') as f:
+                f.write(b"".join(lines))
+            self._unsaved_records = []
+            self._log_records += len(lines)
+            
+            logger.debug(f"Performance records appended to: {self._history_log}")
+            
+        except Exception as exc:
+            logger.error(f"Failed to save performance history: {exc}")
+            return
+        
+        # 로그가 길어지면 스냅샷(performance_history.json)으로 합쳐 로드 시간과 파일 수를 유지
+        if self._log_records >= HISTORY_COMPACT_THRESHOLD and not self._history_load_failed:
+            self.compact_performance_history()
+    
+    def compact_performance_history(self):
+        """전체 성과 이력을 JSON 스냅샷으로 다시 쓰고 JSONL 로그를 비움"""
+        history_file = self._history_file
         
         try:
             # 디렉터리 생성
@@ -312,44 +464,51 @@ class PromptManager:
                     "total_records": len(self.performance_history),
                     "version": "1.0"
                 },
-                "records": []
+                # 필드 목록을 따로 유지하지 않도록 dataclass에서 바로 변환
+                "records": [asdict(record) for record in self.performance_history]
             }
             
-            for record in self.performance_history:
-                data["records"].append({
-                    "strategy": record.strategy,
-                    "patent_number": record.patent_number,
-                    "seed_recall_rate": record.seed_recall_rate,
-                    "total_queries": record.total_queries,
-                    "successful_queries": record.successful_queries,
-                    "found_target": record.found_target,
-                    "timestamp": record.timestamp
-                })
-            
             # JSON 파일로 저장
-            with open(history_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                history_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(history_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+            
+            # 스냅샷에 모든 기록이 들어갔으므로 로그와 미저장 목록은 비움
+            self._history_log.unlink(missing_ok=True)
+            self._unsaved_records = []
+            self._log_records = 0
                 
             logger.debug(f"Performance history saved to: {history_file}")
             
         except Exception as exc:
             logger.error(f"Failed to save performance history: {exc}")
     
+    def _fold_record(self, record: PerformanceRecord):
+        """성과 기록 하나를 전략별 누적 성과에 반영"""
+        agg = self._perf_agg.get(record.strategy)
+        if agg is None:
+            agg = {"count": 0, "sum_recall": 0.0, "success_count": 0, "patents": set()}
+            self._perf_agg[record.strategy] = agg
+        agg["count"] += 1
+        agg["sum_recall"] += record.seed_recall_rate
+        agg["success_count"] += 1 if record.found_target else 0
+        agg["patents"].add(record.patent_number)
+    
     def get_strategy_performance(self, strategy: str) -> Dict[str, Any]:
-        """특정 전략의 평균 성과 반환"""
-        records = [r for r in self.performance_history if r.strategy == strategy]
+        """특정 전략의 평균 성과 반환 (누적 성과에서 바로 계산)"""
+        agg = self._perf_agg.get(strategy)
         
-        if not records:
+        if not agg:
             return {"count": 0, "avg_recall": 0.0, "success_rate": 0.0}
-            
-        avg_recall = sum(r.seed_recall_rate for r in records) / len(records)
-        success_rate = sum(1 for r in records if r.found_target) / len(records)
         
+        count = agg["count"]
         return {
-            "count": len(records),
-            "avg_recall": avg_recall,
-            "success_rate": success_rate,
-            "total_patents": len(set(r.patent_number for r in records))
+            "count": count,
+            "avg_recall": agg["sum_recall"] / count,
+            "success_rate": agg["success_count"] / count,
+            "total_patents": len(agg["patents"])
         }
     
     def get_performance_summary(self) -> Dict[str, Dict[str, Any]]:
@@ -389,10 +548,19 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Prompt Manager CLI")
     parser.add_argument("--list", action="store_true", help="List available strategies")
     parser.add_argument("--test-auto", help="Test auto-selection with patent info JSON file")
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Merge performance_history.jsonl into performance_history.json"
+    )
     
     args = parser.parse_args()
     
-    if args.list:
+    if args.compact:
+        manager = create_default_prompt_manager()
+        manager.compact_performance_history()
+        print(f"Compacted {len(manager.performance_history)} performance records")
+    elif args.list:
         list_available_strategies()
     elif args.test_auto:
         manager = create_default_prompt_manager()
@@ -410,4 +578,5 @@ if __name__ == "__main__":
         recommendations = manager.get_recommended_strategies(test_analysis)
         print(f"Top recommendations: {recommendations}")
     else:
-        print("Use --list to see available strategies or --test-auto to test auto-selection")
\ No newline at end of file
+        print("Use --list to see available strategies, --test-auto to test auto-selection "
+              "or --compact to compact performance history")
\ No newline at end of file
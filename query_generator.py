@@ -12,6 +12,12 @@ Google Gemini API를 사용하여 특허 PDF를 분석하고,
   
   # API 키 직접 지정
   python query_generator.py --pdf patent.pdf --api-key YOUR_API_KEY --output queries.json
+  
+  # 캐시된 Gemini 응답을 쓰지 않고 새로 생성
+  python query_generator.py --pdf patent.pdf --no-cache --output queries.json
+  
+  # 여러 PDF를 동시에 처리 (결과는 queries_<특허번호>.json으로 각각 저장)
+  python query_generator.py --pdf a.pdf b.pdf c.pdf --output temp_results/queries.json
 
 주요 기능:
 - PDF를 Gemini API에 직접 업로드하여 분석
@@ -27,16 +33,48 @@ Google Gemini API를 사용하여 특허 PDF를 분석하고,
 
 import argparse
 import asyncio
+import hashlib
 import json
-import re
-from datetime import datetime
+import os
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
-import google.generativeai as genai
-from dotenv import load_dotenv
 from loguru import logger
 
+try:  # 선택 의존성: 있으면 JSON 파싱/저장에 사용
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+# google.generativeai는 grpc/protobuf까지 끌어와 임포트가 느리므로(~1초)
+# 실제로 Gemini를 쓰는 시점에 한 번만 임포트한다 (--help 등은 즉시 응답)
+_genai: Any = None
+
+
+def _get_genai() -> Any:
+    """google.generativeai 모듈을 지연 임포트하여 반환"""
+    global _genai
+    if _genai is None:
+        import google.generativeai as genai_module
+        _genai = genai_module
+    return _genai
+
+
+# Gemini 파일 처리(PROCESSING) 완료를 기다리는 최대 시간(초)
+UPLOAD_PROCESSING_TIMEOUT = 60.0
+
+# 한 PDF를 여러 프롬프트로 분석하는 동안 유지할 Gemini 컨텍스트 캐시 TTL(초)
+CONTEXT_CACHE_TTL = 600.0
+
+
+def _json_loads(text: str) -> Any:
+    """orjson이 있으면 사용하고 없으면 표준 json으로 디코딩"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
 
 def extract_patent_number_from_filename(pdf_path: Path) -> str:
     """PDF 파일명에서 특허번호 추출 (확장자 제거)
@@ -49,28 +87,84 @@ def extract_patent_number_from_filename(pdf_path: Path) -> str:
 class PatentQueryGenerator:
     """특허 PDF 기반 검색식 생성 클래스"""
     
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        cache_dir: Optional[Path] = Path("temp_results/.gemini_cache")
+    ):
         self.api_key = api_key
+        genai = _get_genai()
+        # 같은 PDF+프롬프트의 Gemini 응답 캐시 디렉터리 (None이면 캐시 사용 안 함)
+        self.cache_dir = cache_dir
         
         # Gemini 설정
         genai.configure(api_key=api_key)
         self.model = genai.GenerativeModel("gemini-2.0-flash-exp")
+    
+    @staticmethod
+    def _cache_key(pdf_path: Path, prompt_template: str) -> str:
+        """PDF 내용 + 프롬프트 + 모델명으로 캐시 키 생성"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(pdf_path.read_bytes())
+        digest.update(prompt_template.encode("utf-8"))
+        digest.update(b"gemini-2.0-flash-exp")
+        return digest.hexdigest()
+    
+    def _load_cached_queries(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시된 Gemini 응답(JSON) 로드, 없거나 손상되었으면 None"""
+        if self.cache_dir is None:
+            return None
+        cache_file = self.cache_dir / f"{key}.json"
+        if not cache_file.exists():
+            return None
+        try:
+            return _json_loads(cache_file.read_text(encoding="utf-8"))
+        except Exception as exc:
+            logger.warning(f"Ignoring unreadable Gemini cache {cache_file}: {exc}")
+            return None
+    
+    def _store_cached_queries(self, key: str, queries_data: Dict[str, Any]) -> None:
+        """Gemini 응답(JSON)을 캐시에 저장"""
+        if self.cache_dir is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_file = self.cache_dir / f"{key}.json"
+            if orjson is not None:
+                cache_file.write_bytes(orjson.dumps(queries_data))
+            else:
+                cache_file.write_text(
+                    json.dumps(queries_data, ensure_ascii=False), encoding="utf-8"
+                )
+        except Exception as exc:
+            logger.warning(f"Failed to write Gemini cache: {exc}")
         
     async def upload_pdf_to_gemini(self, pdf_path: Path) -> str:
         """PDF 파일을 Gemini API에 업로드"""
+        genai = _get_genai()
         logger.info(f"Uploading PDF to Gemini API: {pdf_path}")
         
         try:
             # 파일 업로드
-            uploaded_file = genai.upload_file(
+            # (SDK 호출은 블로킹이므로 스레드에서 실행해 여러 업로드가 겹치도록 함)
+            uploaded_file = await asyncio.to_thread(
+                genai.upload_file,
                 path=str(pdf_path),
                 display_name=pdf_path.name
             )
             
-            # 업로드 완료 대기
+            # 업로드 완료 대기 (50ms부터 최대 1초까지 지수 백오프, 전체 대기 상한 있음)
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + UPLOAD_PROCESSING_TIMEOUT
+            poll_delay = 0.05
             while uploaded_file.state.name == "PROCESSING":
-                await asyncio.sleep(1)
-                uploaded_file = genai.get_file(uploaded_file.name)
+                if loop.time() >= deadline:
+                    raise TimeoutError(
+                        f"File processing did not finish within {UPLOAD_PROCESSING_TIMEOUT:.0f}s"
+                    )
+                await asyncio.sleep(poll_delay)
+                poll_delay = min(poll_delay * 1.5, 1.0)
+                uploaded_file = await asyncio.to_thread(genai.get_file, uploaded_file.name)
             
             if uploaded_file.state.name == "FAILED":
                 raise Exception(f"File upload failed: {uploaded_file.state}")
@@ -82,37 +176,64 @@ class PatentQueryGenerator:
             logger.error(f"PDF upload failed: {exc}")
             raise
     
+    def pdf_context(self, pdf_path: Path, ttl: float = CONTEXT_CACHE_TTL) -> "GeminiPdfContext":
+        """같은 PDF로 여러 번 검색식을 생성할 때 업로드/컨텍스트 캐시를 공유하는 세션 생성"""
+        return GeminiPdfContext(self, pdf_path, ttl)
+    
     async def generate_queries(
         self, 
         pdf_file_name: str, 
-        prompt_template: str
+        prompt_template: str,
+        cached_content: Any = None
     ) -> Dict[str, Any]:
-        """Gemini를 사용하여 검색식 생성"""
+        """Gemini를 사용하여 검색식 생성
+        
+        cached_content가 주어지면 PDF는 컨텍스트 캐시에서 읽고 프롬프트만 전송한다.
+        """
+        genai = _get_genai()
         logger.info("Generating search queries with Gemini...")
         
         try:
-            # 업로드된 파일 객체 가져오기
-            uploaded_file = genai.get_file(pdf_file_name)
+            if cached_content is not None:
+                model = genai.GenerativeModel.from_cached_content(cached_content=cached_content)
+                contents: List[Any] = [prompt_template]
+            else:
+                # 업로드된 파일 객체 가져오기
+                uploaded_file = await asyncio.to_thread(genai.get_file, pdf_file_name)
+                model = self.model
+                contents = [uploaded_file, prompt_template]
+            
+            # Gemini에 프롬프트와 파일 전송 (비동기 스트리밍으로 받아 이벤트 루프를 막지 않음)
+            response = await model.generate_content_async(contents, stream=True)
+            chunks: List[str] = []
+            async for chunk in response:
+                try:
+                    chunks.append(chunk.text)
+                except ValueError:
+                    # 텍스트가 없는 청크(안전 필터 메타데이터 등)는 건너뜀
+                    continue
             
-            # Gemini에 프롬프트와 파일 전송
-            response = self.model.generate_content([
-                uploaded_file,
-                prompt_template
-            ])
+            usage = getattr(response, "usage_metadata", None)
+            if usage is not None:
+                logger.info(
+                    f"Gemini usage: prompt={getattr(usage, 'prompt_token_count', 0)} "
+                    f"cached={getattr(usage, 'cached_content_token_count', 0)} tokens"
+                )
             
             # JSON 응답 파싱
-            response_text = response.text.strip()
+            response_text = "".join(chunks).strip()
             logger.debug(f"Gemini response: {response_text}")
             
-            # JSON 추출 (마크다운 코드 블록 제거)
-            json_match = re.search(r'```json\n(.*?)\n```', response_text, re.DOTALL)
-            if json_match:
-                json_text = json_match.group(1)
+            # JSON 추출 (마크다운 코드 블록 제거, 정규식 없이 문자열 분할)
+            if "```json" in response_text:
+                body = response_text.split("```json", 1)[1]
+                json_text = body.split("```", 1)[0].strip()
             else:
                 # 코드 블록이 없으면 전체 응답에서 JSON 찾기
                 json_text = response_text
             
-            queries_data = json.loads(json_text)
+            # 여러 PDF를 동시에 처리할 때 다른 코루틴의 I/O가 막히지 않도록 스레드에서 파싱
+            queries_data = await asyncio.to_thread(_json_loads, json_text)
             logger.info(f"Generated {len(queries_data.get('search_queries', []))} search queries")
             
             return queries_data
@@ -124,41 +245,153 @@ class PatentQueryGenerator:
     async def generate_queries_from_pdf(
         self, 
         pdf_path: Path,
-        prompt_template: str
+        prompt_template: str,
+        pdf_context: Optional["GeminiPdfContext"] = None
     ) -> Dict[str, Any]:
-        """PDF에서 검색식 생성하는 전체 파이프라인"""
+        """PDF에서 검색식 생성하는 전체 파이프라인
+
+        같은 PDF와 프롬프트로 이미 생성한 적이 있으면 업로드와 Gemini 호출을
+        생략하고 캐시된 응답을 사용한다. pdf_context가 주어지면 업로드와 정리는
+        세션에 맡기고 업로드된 PDF(또는 컨텍스트 캐시)를 재사용한다.
+        """
         logger.info(f"Starting query generation for: {pdf_path}")
+        genai = _get_genai()
         
-        # 1. PDF 업로드
-        uploaded_file_name = await self.upload_pdf_to_gemini(pdf_path)
+        cache_key: Optional[str] = None
+        queries_data: Optional[Dict[str, Any]] = None
+        if self.cache_dir is not None:
+            cache_key = await asyncio.to_thread(self._cache_key, pdf_path, prompt_template)
+            queries_data = await asyncio.to_thread(self._load_cached_queries, cache_key)
+            if queries_data is not None:
+                logger.info(f"Using cached Gemini response ({cache_key})")
         
-        try:
-            # 2. 검색식 생성
-            queries_data = await self.generate_queries(uploaded_file_name, prompt_template)
-            
-            # 3. 메타데이터 추가
-            patent_number = extract_patent_number_from_filename(pdf_path)
-            final_result = {
-                "metadata": {
-                    "pdf_file": str(pdf_path),
-                    "patent_number": patent_number,
-                    "generation_timestamp": datetime.now().isoformat(),
-                    "model_used": "gemini-2.0-flash-exp"
-                },
-                "patent_info": queries_data.get("patent_info", {}),
-                "search_queries": queries_data.get("search_queries", [])
-            }
+        if queries_data is None and pdf_context is not None:
+            uploaded_file_name, cached_content = await pdf_context.acquire()
+            queries_data = await self.generate_queries(
+                uploaded_file_name, prompt_template, cached_content
+            )
+            if cache_key is not None:
+                await asyncio.to_thread(self._store_cached_queries, cache_key, queries_data)
+        
+        if queries_data is None:
+            # 1. PDF 업로드
+            uploaded_file_name = await self.upload_pdf_to_gemini(pdf_path)
             
-            logger.info(f"Query generation completed successfully")
-            return final_result
+            try:
+                # 2. 검색식 생성
+                queries_data = await self.generate_queries(uploaded_file_name, prompt_template)
+            finally:
+                # 업로드된 파일 정리
+                try:
+                    await asyncio.to_thread(genai.delete_file, uploaded_file_name)
+                    logger.debug(f"Deleted uploaded file: {uploaded_file_name}")
+                except Exception as cleanup_exc:
+                    logger.warning(f"Failed to cleanup uploaded file: {cleanup_exc}")
             
-        finally:
-            # 업로드된 파일 정리
+            if cache_key is not None:
+                await asyncio.to_thread(self._store_cached_queries, cache_key, queries_data)
+        
+        # 3. 메타데이터 추가
+        patent_number = extract_patent_number_from_filename(pdf_path)
+        final_result = {
+            "metadata": {
+                "pdf_file": str(pdf_path),
+                "patent_number": patent_number,
+                "generation_timestamp": datetime.now().isoformat(),
+                "model_used": "gemini-2.0-flash-exp"
+            },
+            "patent_info": queries_data.get("patent_info", {}),
+            "search_queries": queries_data.get("search_queries", [])
+        }
+        
+        logger.info(f"Query generation completed successfully")
+        return final_result
+
+    async def generate_queries_from_pdfs(
+        self,
+        pdf_paths: List[Path],
+        prompt_template: str,
+        concurrency: int = 4
+    ) -> List[Any]:
+        """여러 PDF의 검색식을 동시에 생성 (업로드/처리 대기를 서로 겹침)
+        
+        Returns:
+            입력 순서대로 결과 dict 또는 실패한 PDF의 예외 객체
+        """
+        sem = asyncio.Semaphore(max(1, concurrency))
+        
+        async def run_one(pdf_path: Path) -> Dict[str, Any]:
+            async with sem:
+                return await self.generate_queries_from_pdf(pdf_path, prompt_template)
+        
+        return await asyncio.gather(
+            *(run_one(p) for p in pdf_paths), return_exceptions=True
+        )
+
+
+class GeminiPdfContext:
+    """한 PDF를 여러 프롬프트로 분석할 때 업로드한 파일과 컨텍스트 캐시를 공유하는 세션
+    
+    첫 Gemini 호출 시점에 PDF를 한 번만 업로드하고, 가능하면 명시적 컨텍스트 캐시
+    (CachedContent)를 만들어 이후 호출은 프롬프트만 전송한다. 캐시를 만들 수 없으면
+    (미지원 모델, 최소 토큰 수 미달 등) 업로드된 파일을 그대로 재사용한다.
+    
+    사용 예:
+        async with generator.pdf_context(pdf_path) as ctx:
+            await generator.generate_queries_from_pdf(pdf_path, prompt_a, ctx)
+            await generator.generate_queries_from_pdf(pdf_path, prompt_b, ctx)
+    """
+    
+    def __init__(self, generator: PatentQueryGenerator, pdf_path: Path, ttl: float = CONTEXT_CACHE_TTL):
+        self.generator = generator
+        self.pdf_path = pdf_path
+        self.ttl = ttl
+        self.file_name: Optional[str] = None
+        self.cached_content: Any = None
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> Tuple[str, Any]:
+        """(업로드된 파일 이름, 컨텍스트 캐시 또는 None) 반환, 처음 호출될 때만 업로드"""
+        async with self._lock:
+            if self.file_name is None:
+                self.file_name = await self.generator.upload_pdf_to_gemini(self.pdf_path)
+                genai = _get_genai()
+                try:
+                    uploaded_file = await asyncio.to_thread(genai.get_file, self.file_name)
+                    self.cached_content = await asyncio.to_thread(
+                        genai.caching.CachedContent.create,
+                        model=self.generator.model.model_name,
+                        contents=[uploaded_file],
+                        ttl=timedelta(seconds=self.ttl)
+                    )
+                    logger.info(f"Gemini context cache created: {self.cached_content.name}")
+                except Exception as exc:
+                    logger.warning(f"Gemini context cache unavailable, reusing uploaded file: {exc}")
+                    self.cached_content = None
+        return self.file_name, self.cached_content
+    
+    async def close(self) -> None:
+        """컨텍스트 캐시와 업로드된 파일 정리"""
+        genai = _get_genai()
+        if self.cached_content is not None:
+            try:
+                await asyncio.to_thread(self.cached_content.delete)
+            except Exception as cleanup_exc:
+                logger.warning(f"Failed to delete Gemini context cache: {cleanup_exc}")
+            self.cached_content = None
+        if self.file_name is not None:
             try:
-                genai.delete_file(uploaded_file_name)
-                logger.debug(f"Deleted uploaded file: {uploaded_file_name}")
+                await asyncio.to_thread(genai.delete_file, self.file_name)
+                logger.debug(f"Deleted uploaded file: {self.file_name}")
             except Exception as cleanup_exc:
                 logger.warning(f"Failed to cleanup uploaded file: {cleanup_exc}")
+            self.file_name = None
+    
+    async def __aenter__(self) -> "GeminiPdfContext":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
 
 
 def load_prompt_template(prompt_path: Path) -> str:
@@ -173,8 +406,13 @@ def save_results(results: Dict[str, Any], output_path: Path) -> None:
     """결과를 JSON 파일로 저장"""
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        output_path.write_bytes(
+            orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
     
     logger.info(f"Results saved to: {output_path}")
 
@@ -186,6 +424,12 @@ def setup_api_key(args) -> str:
         return args.api_key
     
     # 환경 변수에서 API 키 확인
+    # 이미 환경 변수에 있으면 .env 파일을 읽지 않음
+    api_key = os.environ.get('GOOGLE_API_KEY')
+    if api_key:
+        return api_key
+    
+    from dotenv import load_dotenv
     load_dotenv()
     api_key = os.getenv('GOOGLE_API_KEY')
     
@@ -210,8 +454,9 @@ def build_cli_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--pdf", 
         type=Path,
+        nargs="+",
         required=True,
-        help="분석할 특허 PDF 파일 경로"
+        help="분석할 특허 PDF 파일 경로 (여러 개 지정 가능)"
     )
     
     parser.add_argument(
@@ -234,6 +479,12 @@ def build_cli_parser() -> argparse.ArgumentParser:
         help="Google Gemini API 키 (환경변수 GOOGLE_API_KEY 대신 사용)"
     )
     
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="같은 PDF+프롬프트의 캐시된 Gemini 응답을 사용하지 않음"
+    )
+    
     return parser
 
 
@@ -247,36 +498,56 @@ async def main() -> int:
         api_key = setup_api_key(args)
         
         # PDF 파일 확인
-        if not args.pdf.exists():
-            logger.error(f"PDF file not found: {args.pdf}")
-            return 1
+        for pdf_path in args.pdf:
+            if not pdf_path.exists():
+                logger.error(f"PDF file not found: {pdf_path}")
+                return 1
         
         # 프롬프트 템플릿 로드
         prompt_template = load_prompt_template(args.prompt)
         
         # 검색식 생성기 초기화
-        generator = PatentQueryGenerator(api_key)
+        generator = PatentQueryGenerator(
+            api_key,
+            cache_dir=None if args.no_cache else Path("temp_results/.gemini_cache")
+        )
         
-        # 검색식 생성 실행
-        results = await generator.generate_queries_from_pdf(
+        # 검색식 생성 실행 (여러 PDF는 동시에 업로드/생성)
+        all_results = await generator.generate_queries_from_pdfs(
             args.pdf,
             prompt_template
         )
         
-        # 결과 저장
-        save_results(results, args.output)
-        
-        # 간단한 요약 출력
-        queries = results.get("search_queries", [])
-        patent_info = results.get("patent_info", {})
-        
-        print(f"✅ 검색식 생성 완료")
-        print(f"📄 특허: {patent_info.get('title', '제목 없음')}")
-        print(f"🔍 생성된 검색식: {len(queries)}개")
-        print(f"💾 결과 저장: {args.output}")
+        failed = 0
+        for pdf_path, results in zip(args.pdf, all_results):
+            if isinstance(results, BaseException):
+                logger.error(f"Query generation failed for {pdf_path}: {results}")
+                failed += 1
+                continue
+            
+            # 결과 저장 (PDF가 여러 개면 특허번호별 파일로 분리)
+            output_path = args.output
+            if len(args.pdf) > 1:
+                patent_number = extract_patent_number_from_filename(pdf_path)
+                output_path = args.output.with_name(
+                    f"{args.output.stem}_{patent_number}{args.output.suffix}"
+                )
+            save_results(results, output_path)
+            
+            # 간단한 요약 출력
+            queries = results.get("search_queries", [])
+            patent_info = results.get("patent_info", {})
+            
+            print(f"✅ 검색식 생성 완료")
+            print(f"📄 특허: {patent_info.get('title', '제목 없음')}")
+            print(f"🔍 생성된 검색식: {len(queries)}개")
+            print(f"💾 결과 저장: {output_path}")
+            
+            for i, q in enumerate(queries, 1):
+                print(f"  {i}. {q.get('strategy', 'Unknown')}: {q.get('description', 'No description')}")
         
-        for i, q in enumerate(queries, 1):
-            print(f"  {i}. {q.get('strategy', 'Unknown')}: {q.get('description', 'No description')}")
+        if failed:
+            return 1
         
         return 0
         
@@ -286,6 +557,10 @@ async def main() -> int:
 
 
 if __name__ == "__main__":
-    import os
+    try:  # 선택 의존성: libuv 기반 이벤트 루프 (patent_downloader.install_uvloop과 동일)
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     exit_code = asyncio.run(main())
     exit(exit_code)
\ No newline at end of file
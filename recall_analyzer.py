@@ -10,8 +10,32 @@
   # 전체 검색 결과 수집 (early termination 비활성화)
   python recall_analyzer.py --queries queries.json --pdf patent.pdf --full-recall --output recall.json
   
+  # 전체 결과를 페이지당 200건씩 수집 (서버가 100건으로 자르면 자동으로 100건 사용)
+  python recall_analyzer.py --queries queries.json --pdf patent.pdf --full-recall --page-size 200 --output recall.json
+  
   # 검색 지연시간 설정
   python recall_analyzer.py --queries queries.json --pdf patent.pdf --delay 2.0 --output results.json
+  
+  # 분당 검색 시작 수로 속도 제한 (분당 30회 = 2초 간격)
+  python recall_analyzer.py --queries queries.json --pdf patent.pdf --rate 30 --output results.json
+  
+  # 검색식 동시 실행 수 설정
+  python recall_analyzer.py --queries queries.json --pdf patent.pdf --concurrency 5 --output results.json
+  
+  # 느린 검색식은 20초 후 중복 요청(hedge)하여 먼저 끝난 결과 사용
+  python recall_analyzer.py --queries queries.json --pdf patent.pdf --hedge-after 20 --output results.json
+  
+  # 타임아웃/연결 오류는 최대 4번까지 재시도
+  python recall_analyzer.py --queries queries.json --pdf patent.pdf --retries 4 --output results.json
+  
+  # 어느 검색식이든 원본 특허를 찾으면 나머지 검색 취소 (검색식별 상세 결과는 불완전)
+  python recall_analyzer.py --queries queries.json --pdf patent.pdf --any-query-only --output results.json
+  
+  # 같은 검색식을 다시 분석할 때 24시간 이내 검색 결과 재사용
+  python recall_analyzer.py --queries queries.json --pdf patent.pdf --cache --output results.json
+  
+  # 튜닝 중에는 1시간 이내 검색 결과만 재사용
+  python recall_analyzer.py --queries queries.json --pdf patent.pdf --cache --cache-ttl 1 --output results.json
 
 주요 기능:
 - 검색식별 Google Patents 검색 실행
@@ -19,6 +43,7 @@
 - 검색 성능 통계 계산
 - Early termination 지원 (원본 특허 발견시 조기 종료)
 - JSON/CSV 형태의 상세한 성능 보고서 생성
+- 검색식별 결과를 완료 즉시 JSONL로 기록 (<download-dir>/<특허번호>.results.jsonl, 파이프라인 멀티 전략은 <특허번호>.<전략>.results.jsonl)
 
 필수 설정:
 1. pip install -r requirements.txt
@@ -28,15 +53,38 @@
 import argparse
 import asyncio
 import json
-import re
+import random
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
+import httpx
 from loguru import logger
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+try:  # 선택 의존성: 있으면 검색식/결과 JSON 읽기·쓰기에 사용
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 # patent_downloader 임포트
-from patent_downloader import GooglePatentsXHRDownloader, PatentSummary
+from patent_downloader import (
+    DEFAULT_PAGE_SIZE,
+    GooglePatentsXHRDownloader,
+    QUERY_CACHE_TTL,
+    PatentSummary,
+    RequestPacer,
+    install_uvloop,
+)
+
+
+# 재시도할 일시적 오류 (타임아웃, 연결 끊김 등). 그 밖의 오류는 바로 실패로 기록
+_TRANSIENT_ERRORS = (asyncio.TimeoutError, PlaywrightTimeoutError, httpx.TransportError)
+
+# 재시도 대기 시간(초): RETRY_BASE_DELAY * 2^(시도-1) + 지터, 최대 RETRY_MAX_DELAY
+RETRY_BASE_DELAY = 2.0
+RETRY_MAX_DELAY = 30.0
 
 
 def extract_patent_number_from_filename(pdf_path: Path) -> str:
@@ -47,6 +95,11 @@ def extract_patent_number_from_filename(pdf_path: Path) -> str:
     return pdf_path.stem
 
 
+# 특허번호 정규화 시 삭제할 문자 (공백류, 쉼표, 하이픈)
+_DELETE_TABLE = str.maketrans("", "", " \t\n\r\f\v\u00a0,-")
+
+
+@lru_cache(maxsize=65536)
 def normalize_patent_number(patent_number: str) -> str:
     """특허번호 정규화 (공백, 쉼표, 하이픈 제거 및 대문자 변환)
     
@@ -55,9 +108,12 @@ def normalize_patent_number(patent_number: str) -> str:
     if not patent_number:
         return ""
     
+    # XHR 응답의 번호는 대부분 이미 정규화된 형태 (예: US8771637B2)
+    if patent_number.isascii() and patent_number.isalnum() and patent_number.isupper():
+        return patent_number
+    
     # 공백, 쉼표, 하이픈 제거 후 대문자 변환
-    normalized = re.sub(r'[\s,\-]', '', patent_number).upper()
-    return normalized
+    return patent_number.translate(_DELETE_TABLE).upper()
 
 
 class RecallAnalyzer:
@@ -68,108 +124,348 @@ class RecallAnalyzer:
         download_dir: Path,
         max_results: int = 10,
         delay: float = 1.5,
-        full_recall: bool = False
+        full_recall: bool = False,
+        concurrency: int = 3,
+        hedge_after: Optional[float] = None,
+        any_query_only: bool = False,
+        use_cache: bool = False,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cache_ttl: float = QUERY_CACHE_TTL,
+        retries: int = 2
     ):
         self.download_dir = download_dir
         self.max_results = max_results
         self.delay = delay
         self.full_recall = full_recall
+        # 동시에 실행할 검색식 수
+        self.concurrency = max(1, concurrency)
+        # 이 시간(초) 안에 끝나지 않은 검색은 중복 요청을 보내 먼저 끝난 결과 사용
+        self.hedge_after = hedge_after
+        # True면 원본 특허를 한 검색식이라도 찾는 즉시 나머지 검색식 취소
+        # (검색식별 상세 Recall 대신 "어느 검색식이든 찾았는가"만 필요할 때)
+        self.any_query_only = any_query_only
+        # 일시적 오류(타임아웃/연결 오류)로 실패한 검색식의 재시도 횟수
+        self.retries = max(0, retries)
+        # 검색 시작 간격 제한. 여러 analyze_recall 호출(전략)이 동시에 돌아도
+        # 분석기 전체의 요청 속도가 delay를 넘지 않도록 인스턴스에서 공유
+        self._pacer = RequestPacer(delay)
         
         # Google Patents downloader 초기화
         self.downloader = GooglePatentsXHRDownloader(
             download_dir=download_dir,
             headless=True,
             delay=delay,
-            timeout=30
+            timeout=30,
+            concurrency=self.concurrency,
+            # 같은 검색식을 반복 분석할 때 Google Patents 재요청 생략
+            cache_ttl=cache_ttl if use_cache else None,
+            # --full-recall 페이지당 요청 개수 (100 초과 시 첫 페이지로 검증)
+            page_size=page_size
         )
+        # 정규화한 검색식 → 검색 태스크. 여러 전략(analyze_recall 호출)이 같은
+        # 검색식을 만들면 진행 중이거나 끝난 검색 결과를 공유한다
+        self._search_memo: Dict[Tuple[Any, ...], "asyncio.Task[Any]"] = {}
+        self._search_waiters: Dict[Tuple[Any, ...], int] = {}
+        
+    async def __aenter__(self) -> "RecallAnalyzer":
+        # 검색 브라우저/HTTP 세션을 열어 두고 여러 analyze_recall 호출이 공유
+        # (analyze_recall 안쪽의 중첩 진입은 세션을 닫지 않음)
+        await self.downloader.__aenter__()
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.downloader.__aexit__(*exc_info)
+    
+    async def _search_once(
+        self, query: str
+    ) -> Tuple[List[Path], Optional[int], List[PatentSummary]]:
+        """단일 쿼리 실행 (PDF는 다운로드하지 않고 검색만)"""
+        return await self.downloader.search_and_download(
+            query=query,
+            max_results=self.max_results,
+            count_only=True,
+            full_recall=self.full_recall
+        )
+    
+    async def _search_hedged(
+        self, query: str
+    ) -> Tuple[List[Path], Optional[int], List[PatentSummary]]:
+        """느린 검색에 대비해 `hedge_after`초 후 같은 검색을 한 번 더 보내고
+        먼저 성공한 결과를 사용한다 (hedge_after가 없으면 단일 실행)."""
+        if not self.hedge_after:
+            return await self._search_once(query)
         
+        async def delayed_attempt():
+            await asyncio.sleep(self.hedge_after)
+            logger.info(f"Query still running after {self.hedge_after}s; sending hedge request")
+            return await self._search_once(query)
+        
+        pending = {
+            asyncio.create_task(self._search_once(query)),
+            asyncio.create_task(delayed_attempt()),
+        }
+        last_exc: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    last_exc = task.exception()
+            raise last_exc
+        finally:
+            # 남은 시도는 취소 (컨텍스트는 search_and_download의 finally에서 정리)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+    
+    @staticmethod
+    def _retry_delay(attempt: int) -> float:
+        """재시도 전 대기 시간: 지수 백오프(최대 RETRY_MAX_DELAY) + 지터"""
+        wait = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+        return wait + random.uniform(0, RETRY_BASE_DELAY)
+    
+    def _search_key(self, query: str) -> Tuple[Any, ...]:
+        """검색 결과를 공유할 수 있는 조건(정규화 검색식, 결과 수, 모드, 조기 종료 타겟)"""
+        canonical = " ".join(GooglePatentsXHRDownloader._normalize_query_string(query).split())
+        target = None if self.full_recall else getattr(self.downloader, "_target_patent", None)
+        return (canonical, self.max_results, self.full_recall, target)
+    
+    async def _search_shared(
+        self, query: str
+    ) -> Tuple[List[Path], Optional[int], List[PatentSummary]]:
+        """같은 검색식(공백/필드 표기 차이 무시)은 한 번만 실행하고 결과를 공유한다."""
+        key = self._search_key(query)
+        task = self._search_memo.get(key)
+        if task is None:
+            task = asyncio.create_task(self._search_hedged(query))
+            self._search_memo[key] = task
+            
+            def forget_failed(t: "asyncio.Task[Any]") -> None:
+                # 실패/취소된 검색은 다음 호출에서 다시 시도
+                if (t.cancelled() or t.exception() is not None) and self._search_memo.get(key) is t:
+                    del self._search_memo[key]
+            
+            task.add_done_callback(forget_failed)
+        else:
+            logger.info("Reusing result of an identical query")
+        
+        self._search_waiters[key] = self._search_waiters.get(key, 0) + 1
+        try:
+            # 한 호출자가 취소되어도(any-query 모드) 다른 호출자가 기다리는 검색은 유지
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._search_waiters.get(key, 0) <= 1:
+                task.cancel()
+            raise
+        finally:
+            remaining = self._search_waiters.get(key, 1) - 1
+            if remaining > 0:
+                self._search_waiters[key] = remaining
+            else:
+                # 기다리는 호출이 없으면 키를 지워 검색식 수만큼 쌓이지 않게 함
+                self._search_waiters.pop(key, None)
+    
     async def execute_searches(
         self, 
         queries_data: Dict[str, Any],
-        target_patent: Optional[str] = None
+        target_patent: Optional[str] = None,
+        run_label: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        """검색식들을 실행하고 결과 수집"""
-        logger.info(f"Executing search queries (full_recall={self.full_recall})...")
+        """검색식들을 실행하고 결과 수집
+
+        검색식은 서로 독립적이므로 브라우저 하나를 공유하며 최대
+        `concurrency`개까지 동시에 실행하고, 시작 간격은 `delay`로 조절한다
+        (간격은 같은 분석기의 모든 호출이 공유).
+        결과는 입력 순서(query_index)대로 반환한다.
+        
+        같은 특허를 여러 전략으로 동시에 분석할 때는 `run_label`(예: 전략 이름)을
+        주어 검색식별 결과 스트림 파일이 서로 겹치지 않게 한다.
+        """
+        logger.info(
+            f"Executing search queries (full_recall={self.full_recall}, "
+            f"concurrency={self.concurrency})..."
+        )
         
         # target_patent 설정 (early termination용)
         if target_patent and not self.full_recall:
             self.downloader._target_patent = target_patent
             logger.info(f"Target patent for early termination: {target_patent}")
         
-        search_results = []
         queries = queries_data.get("search_queries", [])
+        total = len(queries)
+        sem = asyncio.Semaphore(self.concurrency)
+        pacer = self._pacer
         
-        for i, query_info in enumerate(queries, 1):
+        async def run_one(i: int, query_info: Dict[str, Any]) -> Dict[str, Any]:
             query = query_info.get("query", "")
             strategy = query_info.get("strategy", f"Query {i}")
             
-            logger.info(f"Executing query {i}/{len(queries)}: {strategy}")
-            logger.info(f"Query: {query}")
-            
-            try:
-                # 단일 쿼리 실행
-                saved_files, total_count, patents = await self.downloader.search_and_download(
-                    query=query,
-                    max_results=self.max_results,
-                    count_only=True,  # PDF는 다운로드하지 않고 검색만
-                    full_recall=self.full_recall
-                )
-                
-                # 특허 번호 추출
-                found_patents = []
-                if patents:
-                    found_patents = [
-                        patent.publication_number 
-                        for patent in patents 
-                        if patent.publication_number
-                    ]
-                
-                search_results.append({
+            def failed(exc: Exception) -> Dict[str, Any]:
+                # 검색 실패
+                logger.error(f"❌ Query {i} failed with error: {exc}")
+                return {
                     "query_index": i,
                     "strategy": strategy,
                     "query": query,
-                    "success": True,
-                    "total_results": total_count,
-                    "parsed_results": len(patents) if patents else 0,
-                    "found_patents": found_patents,
-                    "execution_time": 0  # 현재 측정하지 않음
-                })
-                
-                logger.info(f"✅ Query {i} completed: {len(found_patents)} patents found")
+                    "success": False,
+                    "total_results": None,
+                    "parsed_results": 0,
+                    "found_patents": [],
+                    "error": str(exc)
+                }
+            
+            attempt = 0
+            while True:
+                async with sem:
+                    # Google Patents 부하를 고려해 검색 시작 간격 유지 (재시도도 동일)
+                    await pacer.wait()
+                    if attempt == 0:
+                        logger.info(f"Executing query {i}/{total}: {strategy}")
+                        logger.info(f"Query: {query}")
                     
-            except Exception as exc:
-                # 검색 실패
+                    try:
+                        # 단일 쿼리 실행
+                        saved_files, total_count, patents = await self._search_shared(query)
+                        break
+                    except _TRANSIENT_ERRORS as exc:
+                        if attempt >= self.retries:
+                            return failed(exc)
+                        error = exc
+                    except Exception as exc:
+                        return failed(exc)
+                
+                # 일시적 오류: 동시 실행 슬롯을 반납한 채 백오프 후 다시 시도
+                attempt += 1
+                wait = self._retry_delay(attempt)
+                logger.warning(
+                    f"Query {i}: transient error ({error!r}); retry {attempt}/{self.retries} in {wait:.1f}s"
+                )
+                await asyncio.sleep(wait)
+            
+            # 특허 번호 추출
+            found_patents = []
+            if patents:
+                found_patents = [
+                    patent.publication_number 
+                    for patent in patents 
+                    if patent.publication_number
+                ]
+            
+            logger.info(f"✅ Query {i} completed: {len(found_patents)} patents found")
+            return {
+                "query_index": i,
+                "strategy": strategy,
+                "query": query,
+                "success": True,
+                "total_results": total_count,
+                "parsed_results": len(patents) if patents else 0,
+                "found_patents": found_patents,
+                "execution_time": 0  # 현재 측정하지 않음
+            }
+        
+        # 검색식이 끝날 때마다 결과를 JSONL로 바로 기록 (중단되어도 부분 결과 보존)
+        self.download_dir.mkdir(parents=True, exist_ok=True)
+        stream_name = target_patent or "recall"
+        if run_label:
+            stream_name = f"{stream_name}.{run_label}"
+        stream_path = self.download_dir / f"{stream_name}.results.jsonl"
+        
+        normalized_target = normalize_patent_number(target_patent) if target_patent else ""
+        tasks: List["asyncio.Task[Dict[str, Any]]"] = []
+        
+        with open(stream_path, "wb") as stream:
+            async def run_and_record(i: int, query_info: Dict[str, Any]) -> Dict[str, Any]:
+                result = await run_one(i, query_info)
+                if orjson is not None:
+                    stream.write(orjson.dumps(result) + b"\n")
+                else:
+                    stream.write((json.dumps(result, ensure_ascii=False) + "\n").encode("utf-8"))
+                stream.flush()
+                
+                # any-query 모드: 한 검색식이라도 원본 특허를 찾으면 나머지 검색은 취소
+                if self.any_query_only and normalized_target and any(
+                    normalize_patent_number(p) == normalized_target
+                    for p in result.get("found_patents", [])
+                ):
+                    cancelled = 0
+                    for task in tasks:
+                        if not task.done() and task is not asyncio.current_task():
+                            task.cancel()
+                            cancelled += 1
+                    if cancelled:
+                        logger.info(
+                            f"🎯 Target found by query {i}; cancelling {cancelled} remaining queries"
+                        )
+                return result
+            
+            # 브라우저를 한 번만 띄워 모든 검색식이 공유
+            async with self.downloader:
+                tasks.extend(
+                    asyncio.create_task(run_and_record(i, q))
+                    for i, q in enumerate(queries, 1)
+                )
+                outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        search_results = []
+        for i, (query_info, outcome) in enumerate(zip(queries, outcomes), 1):
+            if isinstance(outcome, BaseException):
+                # 취소된 검색식(any-query 모드) 또는 예기치 못한 오류
+                skipped = isinstance(outcome, asyncio.CancelledError)
                 search_results.append({
                     "query_index": i,
-                    "strategy": strategy,
-                    "query": query,
+                    "strategy": query_info.get("strategy", f"Query {i}"),
+                    "query": query_info.get("query", ""),
                     "success": False,
+                    "skipped": skipped,
                     "total_results": None,
                     "parsed_results": 0,
                     "found_patents": [],
-                    "error": str(exc)
+                    "error": "Skipped: target already found by another query"
+                    if skipped else str(outcome)
                 })
-                
-                logger.error(f"❌ Query {i} failed with error: {exc}")
+            else:
+                search_results.append(outcome)
         
+        logger.info(f"Per-query results streamed to: {stream_path}")
         return search_results
     
     def calculate_seed_recall(
         self, 
-        original_patent_number: str,
+        original_patent_number: Union[str, Iterable[str]],
         search_results: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
-        """Seed Recall 계산"""
-        logger.info(f"Calculating Seed Recall for patent: {original_patent_number}")
+        """Seed Recall 계산
         
-        # 특허번호 정규화
-        normalized_original = normalize_patent_number(original_patent_number)
+        특허번호 여러 개를 주면 검색 결과를 한 번만 훑어 특허별 Recall
+        (`target_recall`)도 함께 계산한다. 검색식은 대상 중 하나라도 찾으면 found.
+        """
+        # 특허번호 정규화 (정규화 번호 → 입력 번호, 입력 순서 유지)
+        originals = (
+            [original_patent_number] if isinstance(original_patent_number, str)
+            else list(original_patent_number)
+        )
+        logger.info(f"Calculating Seed Recall for patent: {', '.join(originals)}")
+        targets: Dict[str, str] = {}
+        for original in originals:
+            normalized = normalize_patent_number(original)
+            if normalized:
+                targets.setdefault(normalized, original)
+        normalized_original = normalize_patent_number(originals[0]) if originals else ""
         
         # 각 검색식별로 원본 특허 발견 여부 확인
         query_recalls = []
         found_in_queries = 0
+        found_per_target = dict.fromkeys(targets, 0)
+        # 통계용 누적값 (검색 결과 목록을 한 번만 순회)
+        successful_queries = 0
+        sum_total_results = 0
+        sum_parsed_results = 0
         
         for result in search_results:
+            sum_parsed_results += result["parsed_results"]
             if not result["success"]:
                 query_recalls.append({
                     "query_index": result["query_index"],
@@ -180,14 +476,26 @@ class RecallAnalyzer:
                 })
                 continue
             
-            found_patents = result.get("found_patents", [])
-            normalized_found = [normalize_patent_number(p) for p in found_patents if p]
+            successful_queries += 1
+            sum_total_results += result["total_results"] or 0
             
-            is_found = normalized_original in normalized_found
+            found_patents = result.get("found_patents", [])
+            # 원본 특허는 보통 상위에 있으므로 대상을 모두 찾으면 나머지 번호는 정규화하지 않음
+            hits = set()
+            if targets:
+                for p in found_patents:
+                    normalized = normalize_patent_number(p) if p else ""
+                    if normalized in targets:
+                        hits.add(normalized)
+                        if len(hits) == len(targets):
+                            break
+            is_found = bool(hits)
             if is_found:
                 found_in_queries += 1
+            for normalized in hits:
+                found_per_target[normalized] += 1
                 
-            query_recalls.append({
+            detail = {
                 "query_index": result["query_index"],
                 "strategy": result["strategy"],
                 "query": result["query"],
@@ -195,24 +503,23 @@ class RecallAnalyzer:
                 "total_results": result["total_results"],
                 "parsed_results": result["parsed_results"],
                 "found_patents_sample": found_patents[:3] if found_patents else []
-            })
+            }
+            if len(targets) > 1:
+                detail["found_targets"] = [targets[n] for n in targets if n in hits]
+            query_recalls.append(detail)
             
             logger.info(f"Query {result['query_index']}: {'✅ Found' if is_found else '❌ Not found'} - {result['parsed_results']} results")
         
         # 통계 계산
         total_queries = len(search_results)
-        successful_queries = len([r for r in search_results if r["success"]])
-        avg_total_results = sum(
-            r["total_results"] or 0 for r in search_results if r["success"]
-        ) / max(successful_queries, 1)
-        avg_parsed_results = sum(
-            r["parsed_results"] for r in search_results
-        ) / max(total_queries, 1)
+        avg_total_results = sum_total_results / max(successful_queries, 1)
+        avg_parsed_results = sum_parsed_results / max(total_queries, 1)
         
         seed_recall_rate = found_in_queries / total_queries if total_queries > 0 else 0
         
-        return {
-            "original_patent": original_patent_number,
+        performance = {
+            # 대상이 하나면 기존과 같이 문자열, 여러 개면 입력 순서의 리스트
+            "original_patent": originals[0] if len(originals) == 1 else originals,
             "normalized_patent": normalized_original,
             "total_queries": total_queries,
             "successful_queries": successful_queries,
@@ -223,17 +530,27 @@ class RecallAnalyzer:
             "queries_found_patent": found_in_queries,
             "query_details": query_recalls
         }
+        if len(targets) > 1:
+            performance["normalized_patent"] = list(targets)
+            performance["target_recall"] = {
+                targets[n]: count / total_queries if total_queries > 0 else 0
+                for n, count in found_per_target.items()
+            }
+        return performance
     
     async def analyze_recall(
         self,
         queries_data: Dict[str, Any],
-        target_patent_number: str
+        target_patent_number: str,
+        run_label: Optional[str] = None
     ) -> Dict[str, Any]:
-        """전체 Recall 분석 파이프라인"""
+        """전체 Recall 분석 파이프라인 (run_label은 execute_searches 참고)"""
         logger.info(f"Starting recall analysis for patent: {target_patent_number}")
         
         # 1. 검색 실행
-        search_results = await self.execute_searches(queries_data, target_patent_number)
+        search_results = await self.execute_searches(
+            queries_data, target_patent_number, run_label
+        )
         
         # 2. Seed Recall 계산
         performance = self.calculate_seed_recall(target_patent_number, search_results)
@@ -244,6 +561,7 @@ class RecallAnalyzer:
                 "target_patent": target_patent_number,
                 "analysis_timestamp": datetime.now().isoformat(),
                 "full_recall_mode": self.full_recall,
+                "any_query_only": self.any_query_only,
                 "max_results_per_query": self.max_results,
                 "search_delay": self.delay
             },
@@ -262,6 +580,8 @@ def load_queries_data(queries_path: Path) -> Dict[str, Any]:
     if not queries_path.exists():
         raise FileNotFoundError(f"Queries file not found: {queries_path}")
     
+    if orjson is not None:
+        return orjson.loads(queries_path.read_bytes())
     with open(queries_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
@@ -270,8 +590,13 @@ def save_results(results: Dict[str, Any], output_path: Path) -> None:
     """결과를 JSON 파일로 저장"""
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        output_path.write_bytes(
+            orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
     
     logger.info(f"Results saved to: {output_path}")
 
@@ -319,12 +644,19 @@ def build_cli_parser() -> argparse.ArgumentParser:
         help="검색식당 최대 결과 수 (기본값: 10)"
     )
     
-    parser.add_argument(
+    pacing = parser.add_mutually_exclusive_group()
+    pacing.add_argument(
         "--delay",
         type=float,
         default=1.5,
         help="검색 간 지연시간(초) (기본값: 1.5)"
     )
+    pacing.add_argument(
+        "--rate",
+        type=float,
+        default=None,
+        help="분당 최대 검색 시작 수 (지정 시 --delay 대신 60/rate초 간격 사용)"
+    )
     
     parser.add_argument(
         "--full-recall",
@@ -332,6 +664,50 @@ def build_cli_parser() -> argparse.ArgumentParser:
         help="전체 검색 수행 (early termination 비활성화)"
     )
     
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=3,
+        help="동시에 실행할 검색식 수 (기본값: 3)"
+    )
+    
+    parser.add_argument(
+        "--hedge-after",
+        type=float,
+        default=None,
+        help="이 시간(초) 후에도 끝나지 않은 검색은 중복 요청 (기본값: 사용 안 함)"
+    )
+    
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=2,
+        help="타임아웃/연결 오류로 실패한 검색식 재시도 횟수 (기본값: 2)"
+    )
+    
+    parser.add_argument(
+        "--any-query-only",
+        action="store_true",
+        help="원본 특허가 한 검색식에서라도 발견되면 나머지 검색식 취소"
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="검색 결과를 <download-dir>/.xhr_cache에 캐시하여 재분석 시 재사용 (기본 24시간)"
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=QUERY_CACHE_TTL / 3600,
+        help="--cache 사용 시 검색 결과 유효 시간(시간) (기본값: 24)"
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=DEFAULT_PAGE_SIZE,
+        help="--full-recall 수집 시 페이지당 요청 개수 (100 초과 시 첫 페이지로 지원 여부 확인)"
+    )
+    
     return parser
 
 
@@ -356,12 +732,24 @@ async def main() -> int:
         # 대상 특허번호 추출
         target_patent = extract_patent_number_from_filename(args.pdf)
         
+        # 분당 요청 수가 주어지면 검색 시작 간격으로 환산
+        delay = args.delay
+        if args.rate:
+            delay = 60.0 / args.rate
+        
         # Recall 분석기 초기화
         analyzer = RecallAnalyzer(
             download_dir=args.download_dir,
             max_results=args.max_results,
-            delay=args.delay,
-            full_recall=args.full_recall
+            delay=delay,
+            full_recall=args.full_recall,
+            concurrency=args.concurrency,
+            hedge_after=args.hedge_after,
+            any_query_only=args.any_query_only,
+            use_cache=args.cache,
+            page_size=args.page_size,
+            cache_ttl=args.cache_ttl * 3600,
+            retries=args.retries
         )
         
         # Recall 분석 실행
@@ -394,5 +782,6 @@ async def main() -> int:
 
 
 if __name__ == "__main__":
+    install_uvloop()
     exit_code = asyncio.run(main())
     exit(exit_code)
\ No newline at end of file